@@ -0,0 +1,111 @@
+"""
+Provide benchmark of memory taken by idle games: full game objects against packed records of the session pool.
+
+Usage: python3 -m benchmarks.sessions [--sessions 1000000]
+"""
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from game.board import Board
+from game.dto import Player
+from game.enums import PlayerMark
+from game.game_ import GameSession
+from game.sessions import SessionPool
+from game.ui import Ui
+
+DEFAULT_SESSIONS_NUMBER = 20_000
+MOVES = (5, 1, 9)
+
+
+def create_objects(sessions_number: int) -> list:
+    """
+    Create idle games as full objects, as the terminal game keeps them: a board, a session and a UI per game.
+
+    Arguments:
+        sessions_number (int): a number of games.
+
+    Returns:
+        The games as a list.
+    """
+    games = []
+
+    for _ in range(sessions_number):
+        players = [Player(mark=PlayerMark.CLASSIC_X), Player(mark=PlayerMark.CLASSIC_Y)]
+        board = Board(players=players)
+        session = GameSession(board=board)
+
+        for position in MOVES:
+            session.play(player=session.current_player, position=position)
+
+        games.append((session, Ui(board=board)))
+
+    return games
+
+
+def create_pool(sessions_number: int) -> SessionPool:
+    """
+    Create idle games as packed records of a session pool.
+
+    Arguments:
+        sessions_number (int): a number of games.
+
+    Returns:
+        The games' pool as a `SessionPool`.
+    """
+    pool = SessionPool()
+
+    for _ in range(sessions_number):
+        session_id = pool.create(marks=[PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y])
+
+        with pool.play(session_id=session_id) as session:
+            for position in MOVES:
+                session.play(player=session.current_player, position=position)
+
+    return pool
+
+
+def measure(function: Callable, sessions_number: int) -> float:
+    """
+    Measure memory taken by idle games.
+
+    Arguments:
+        function (Callable): a function creating the games.
+        sessions_number (int): a number of games.
+
+    Returns:
+        Bytes per game as a float.
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    games = function(sessions_number)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del games
+
+    return current / sessions_number
+
+
+def main() -> None:
+    """
+    Run the benchmark and print bytes per idle session.
+    """
+    parser = argparse.ArgumentParser(description='Measure memory taken by idle games.')
+    parser.add_argument('--sessions', type=int, default=DEFAULT_SESSIONS_NUMBER, help='a number of idle games')
+    arguments = parser.parse_args()
+
+    objects_bytes = measure(function=create_objects, sessions_number=arguments.sessions)
+    pool_bytes = measure(function=create_pool, sessions_number=arguments.sessions)
+
+    print(f'{"storage":>8} | {"bytes per session":>17}')
+    print(f'{"objects":>8} | {objects_bytes:>17.1f}')
+    print(f'{"pool":>8} | {pool_bytes:>17.1f}')
+    print(f'The pool takes {objects_bytes / pool_bytes:.1f}x less memory.')
+
+
+if __name__ == '__main__':
+    main()
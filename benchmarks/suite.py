@@ -0,0 +1,392 @@
+"""
+Provide benchmark suite of the game's hot paths: board's marking and checking, utils and UI's rendering.
+
+Results are written to a JSON file, so they can be saved as a baseline and compared against later to catch
+performance regressions.
+
+Usage: python3 -m benchmarks.suite --output results.json [--compare baseline.json] [--threshold 0.1] [--filter board.]
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+from game.board import Board
+from game.dto import Player
+from game.enums import PlayerMark
+from game.ui import Ui
+from game.utils import (
+    get_cells_winning_lines,
+    get_diagonal_sublists,
+    get_horizontal_sublists,
+    get_vertical_sublists,
+    get_winning_lines,
+    is_list_has_equal_elements,
+)
+
+SIZES = (3, 4, 8, 16, 64)
+PLAYERS_NUMBERS = (2, 3, 4)
+
+REPEATS = 5
+MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.1
+
+
+def get_players(players_number: int) -> list[Player]:
+    """
+    Get players with distinct marks.
+
+    Arguments:
+        players_number (int): a number of players.
+
+    Returns:
+        Players as a list of `Player`.
+    """
+    return [Player(mark=mark) for mark in list(PlayerMark)[:players_number]]
+
+
+def get_tie_cells(size: int, players: list[Player]) -> list:
+    """
+    Get cells of a full board without a win, so every line has to be checked.
+
+    Arguments:
+        size (int): a size of a board.
+        players (list): players as a list of `Player`, only the first two of them have marks on the board.
+
+    Returns:
+        Cells as a list of marks.
+    """
+    marks = (players[0].mark, players[1].mark)
+    return [marks[(row + column // 2) % 2] for row in range(size) for column in range(size)]
+
+
+def get_win_cells(size: int, players: list[Player]) -> list:
+    """
+    Get cells of a board with the first row filled by the first player.
+
+    Arguments:
+        size (int): a size of a board.
+        players (list): players as a list of `Player`.
+
+    Returns:
+        Cells as a list of `None` or marks.
+    """
+    return [players[0].mark] * size + [Board.EMPTY_CELL] * (size * size - size)
+
+
+def get_continue_cells(size: int, players: list[Player]) -> list:
+    """
+    Get cells of a board without a win and with a single empty cell.
+
+    Arguments:
+        size (int): a size of a board.
+        players (list): players as a list of `Player`.
+
+    Returns:
+        Cells as a list of `None` or marks.
+    """
+    cells = get_tie_cells(size=size, players=players)
+    cells[-1] = Board.EMPTY_CELL
+    return cells
+
+
+def bench_board_mark(size: int, players: list[Player]) -> tuple[Callable, int]:
+    """
+    Get a benchmark of filling an empty board with marks, one `Board.mark` call per cell.
+
+    Arguments:
+        size (int): a size of a board.
+        players (list): players as a list of `Player`.
+
+    Returns:
+        A function to time and a number of operations per its call as a tuple.
+    """
+    moves = [
+        (players[0] if cell is players[0].mark else players[1], position)
+        for position, cell in enumerate(get_tie_cells(size=size, players=players), 1)
+    ]
+
+    def run() -> None:
+        board = Board(players=players, size=size)
+
+        for player, position in moves:
+            board.mark(player=player, position=position)
+
+    return run, len(moves)
+
+
+def bench_board_check(size: int, players: list[Player], cells: list) -> tuple[Callable, int]:
+    """
+    Get a benchmark of checking a board's state from its cells.
+
+    `Board.check` itself returns the state kept up to date by `Board.mark`, so a board's cells are assigned first: it
+    is the cost of checking an arbitrary position, e.g. a restored game.
+
+    Arguments:
+        size (int): a size of a board.
+        players (list): players as a list of `Player`.
+        cells (list): cells of a board's position.
+
+    Returns:
+        A function to time and a number of operations per its call as a tuple.
+    """
+    board = Board(players=players, size=size)
+
+    def run() -> None:
+        board.board = cells
+        board.check()
+
+    return run, 1
+
+
+def bench_ui_show_current_board(size: int, players: list[Player]) -> tuple[Callable, int]:
+    """
+    Get a benchmark of rendering a board to a terminal, the output is discarded.
+
+    Arguments:
+        size (int): a size of a board.
+        players (list): players as a list of `Player`.
+
+    Returns:
+        A function to time and a number of operations per its call as a tuple.
+    """
+    board = Board(players=players, size=size)
+    board.board = get_continue_cells(size=size, players=players)
+    ui = Ui(board=board)
+
+    def run() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ui.show_current_board()
+
+    return run, 1
+
+
+def bench_ui_show_current_board_incremental(size: int, players: list[Player]) -> tuple[Callable, int]:
+    """
+    Get a benchmark of redrawing a shown board after a move and after undoing it, the output is discarded.
+
+    Arguments:
+        size (int): a size of a board.
+        players (list): players as a list of `Player`.
+
+    Returns:
+        A function to time and a number of operations per its call as a tuple.
+    """
+    board = Board(players=players, size=size)
+    board.board = get_continue_cells(size=size, players=players)
+    ui = Ui(board=board, output=io.StringIO(), is_incremental=True)
+    ui.show_current_board()
+
+    def run() -> None:
+        ui.output.seek(0)
+        ui.output.truncate()
+
+        board.mark(player=players[0], position=size * size)
+        ui.show_current_board()
+        board.undo()
+        ui.show_current_board()
+
+    return run, 2
+
+
+def bench_utils(size: int) -> dict[str, tuple[Callable, int]]:
+    """
+    Get benchmarks of each utils' helper on a board's positions.
+
+    Cached helpers are timed both as a cache hit and as building from scratch.
+
+    Arguments:
+        size (int): a size of a board.
+
+    Returns:
+        Benchmarks by helpers' names as a dictionary.
+    """
+    positions = list(range(size * size))
+    line = [PlayerMark.CLASSIC_X] * size
+
+    return {
+        'get_horizontal_sublists': (lambda: get_horizontal_sublists(list_=positions, chunks=size), 1),
+        'get_vertical_sublists': (lambda: get_vertical_sublists(list_=positions, chunks=size), 1),
+        'get_diagonal_sublists': (lambda: get_diagonal_sublists(list_=positions), 1),
+        'is_list_has_equal_elements': (lambda: is_list_has_equal_elements(list_=line), 1),
+        'get_winning_lines': (lambda: get_winning_lines(size=size), 1),
+        'get_winning_lines.uncached': (lambda: get_winning_lines.__wrapped__(size=size), 1),
+        'get_cells_winning_lines': (lambda: get_cells_winning_lines(size=size), 1),
+        'get_cells_winning_lines.uncached': (lambda: get_cells_winning_lines.__wrapped__(size=size), 1),
+    }
+
+
+def get_cases() -> dict[str, dict]:
+    """
+    Get all benchmark cases.
+
+    Returns:
+        Cases by names as a dictionary of their parameters, functions to time and numbers of operations per call.
+    """
+    cases = {}
+
+    for size in SIZES:
+        for name, (function, operations) in bench_utils(size=size).items():
+            cases[f'utils.{name}/{size}'] = {'size': size, 'function': function, 'operations': operations}
+
+        for players_number in PLAYERS_NUMBERS:
+            players = get_players(players_number=players_number)
+            suffix = f'{size}/{players_number}'
+            benchmarks = {
+                'board.mark': bench_board_mark(size=size, players=players),
+                'board.check.win': bench_board_check(
+                    size=size,
+                    players=players,
+                    cells=get_win_cells(size=size, players=players),
+                ),
+                'board.check.tie': bench_board_check(
+                    size=size,
+                    players=players,
+                    cells=get_tie_cells(size=size, players=players),
+                ),
+                'board.check.continue': bench_board_check(
+                    size=size,
+                    players=players,
+                    cells=get_continue_cells(size=size, players=players),
+                ),
+                'ui.show_current_board': bench_ui_show_current_board(size=size, players=players),
+                'ui.show_current_board.incremental': bench_ui_show_current_board_incremental(
+                    size=size,
+                    players=players,
+                ),
+            }
+
+            for name, (function, operations) in benchmarks.items():
+                cases[f'{name}/{suffix}'] = {
+                    'size': size,
+                    'players_number': players_number,
+                    'function': function,
+                    'operations': operations,
+                }
+
+    return cases
+
+
+def measure(function: Callable, operations: int) -> float:
+    """
+    Measure time of an operation.
+
+    A number of calls per timing is doubled until the timing takes at least a minimum time, so fast and slow cases are
+    measured equally precisely, and the best of repeated timings is taken as the least disturbed one.
+
+    Arguments:
+        function (Callable): a function to time.
+        operations (int): a number of operations per the function's call.
+
+    Returns:
+        The best time of an operation in microseconds.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+
+    while timer.timeit(number=number) < MIN_TIME:
+        number *= 2
+
+    return min(timer.repeat(number=number, repeat=REPEATS)) / number / operations * 1_000_000
+
+
+def run(filter_: str = '') -> dict:
+    """
+    Run benchmark cases.
+
+    Arguments:
+        filter_ (str): a substring of names of cases to run, all cases if empty.
+
+    Returns:
+        An environment and cases by names with their parameters and times in microseconds as a dictionary.
+    """
+    results = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'cases': {},
+    }
+
+    for name, case in get_cases().items():
+        if filter_ not in name:
+            continue
+
+        function, operations = case.pop('function'), case.pop('operations')
+        results['cases'][name] = {**case, 'time': measure(function=function, operations=operations)}
+
+        print(f'{name:<48} {results["cases"][name]["time"]:>14.3f} us')
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compare results against a baseline.
+
+    Arguments:
+        results (dict): results as `run` returns them.
+        baseline (dict): saved results of a baseline.
+        threshold (float): a maximum allowed relative slowdown, e.g. `0.1` is 10%.
+
+    Returns:
+        Names of cases slowed down by more than the threshold as a list of strings.
+    """
+    regressions = []
+
+    for name, case in results['cases'].items():
+        baseline_case = baseline['cases'].get(name)
+
+        if baseline_case is None:
+            print(f'{name:<48} {"new":>14}')
+            continue
+
+        ratio = case['time'] / baseline_case['time']
+        is_regression = ratio > 1 + threshold
+
+        if is_regression:
+            regressions.append(name)
+
+        print(f'{name:<48} {ratio:>13.2f}x{" SLOWER" if is_regression else ""}')
+
+    return regressions
+
+
+def main() -> None:
+    """
+    Run the benchmark suite from a command line, save results and compare them against a baseline.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths.")
+    parser.add_argument('--output', type=Path, help='a path to write results to as JSON')
+    parser.add_argument('--compare', type=Path, help='a path to baseline results to compare against')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='a maximum allowed relative slowdown against the baseline',
+    )
+    parser.add_argument('--filter', default='', help='a substring of names of cases to run')
+    arguments = parser.parse_args()
+
+    results = run(filter_=arguments.filter)
+
+    if arguments.output:
+        arguments.output.parent.mkdir(parents=True, exist_ok=True)
+        arguments.output.write_text(json.dumps(results, indent=2))
+
+    if arguments.compare:
+        baseline = json.loads(arguments.compare.read_text())
+        regressions = compare(results=results, baseline=baseline, threshold=arguments.threshold)
+
+        if regressions:
+            print(f'{len(regressions)} case(s) slowed down by more than {arguments.threshold:.0%}.')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""
+Provide benchmark of checking a board through sublists against checking it through winning lines.
+
+Usage: python3 -m benchmarks.winning_lines
+"""
+import timeit
+import tracemalloc
+
+from game.board import Board
+from game.enums import PlayerMark
+from game.utils import (
+    get_diagonal_sublists,
+    get_horizontal_sublists,
+    get_vertical_sublists,
+    get_winning_lines,
+    is_list_has_equal_elements,
+)
+
+SIZES = range(3, 51)
+REPEATS = 5
+
+
+def check_with_sublists(board: list, size: int) -> bool:
+    """
+    Check a board for a win slicing horizontal, vertical and diagonal sublists as the board used to do.
+
+    Arguments:
+        board (list): a board as a list of `None` or marks.
+        size (int): a size of a board.
+
+    Returns:
+        True, if any line is filled with marks of a single player.
+        Otherwise, False.
+    """
+    horizontal_marks = get_horizontal_sublists(list_=board, chunks=size)
+    vertical_marks = get_vertical_sublists(list_=board, chunks=size)
+    diagonal_marks = get_diagonal_sublists(list_=board)
+
+    for direction_marks in [horizontal_marks, vertical_marks, diagonal_marks]:
+        for marks in direction_marks:
+            if Board.EMPTY_CELL in marks:
+                continue
+
+            if is_list_has_equal_elements(list_=marks):
+                return True
+
+    return False
+
+
+def check_with_winning_lines(board: list, size: int) -> bool:
+    """
+    Check a board for a win iterating positions of the cached winning lines.
+
+    Arguments:
+        board (list): a board as a list of `None` or marks.
+        size (int): a size of a board.
+
+    Returns:
+        True, if any line is filled with marks of a single player.
+        Otherwise, False.
+    """
+    for positions in get_winning_lines(size=size):
+        first_cell = board[positions[0]]
+
+        if first_cell is Board.EMPTY_CELL:
+            continue
+
+        for position in positions:
+            if board[position] is not first_cell:
+                break
+
+        else:
+            return True
+
+    return False
+
+
+def get_tie_board(size: int) -> list:
+    """
+    Get a full board without a win, so every line has to be checked.
+
+    Arguments:
+        size (int): a size of a board.
+
+    Returns:
+        A board as a list of marks.
+    """
+    marks = (PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y)
+    return [marks[(row + column // 2) % 2] for row in range(size) for column in range(size)]
+
+
+def measure_allocations(function: callable, board: list, size: int) -> int:
+    """
+    Measure a peak memory allocated by a single call of a function.
+
+    Arguments:
+        function (callable): a function checking a board.
+        board (list): a board as a list of `None` or marks.
+        size (int): a size of a board.
+
+    Returns:
+        Peak allocated memory in bytes.
+    """
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    function(board, size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def measure_time(function: callable, board: list, size: int) -> float:
+    """
+    Measure time of a single call of a function.
+
+    Arguments:
+        function (callable): a function checking a board.
+        board (list): a board as a list of `None` or marks.
+        size (int): a size of a board.
+
+    Returns:
+        The best time of a call in microseconds.
+    """
+    number = max(1, 20000 // (size * size))
+    timings = timeit.repeat(lambda: function(board, size), number=number, repeat=REPEATS)
+    return min(timings) / number * 1_000_000
+
+
+def main() -> None:
+    """
+    Run the benchmark and print a table of results.
+    """
+    print(
+        f'{"size":>4} | {"sublists, us":>12} | {"lines, us":>9} | {"speedup":>7} | '
+        f'{"sublists, B":>11} | {"lines, B":>8}',
+    )
+
+    for size in SIZES:
+        board = get_tie_board(size=size)
+        get_winning_lines(size=size)
+
+        sublists_time = measure_time(function=check_with_sublists, board=board, size=size)
+        lines_time = measure_time(function=check_with_winning_lines, board=board, size=size)
+        sublists_allocations = measure_allocations(function=check_with_sublists, board=board, size=size)
+        lines_allocations = measure_allocations(function=check_with_winning_lines, board=board, size=size)
+
+        print(
+            f'{size:>4} | {sublists_time:>12.2f} | {lines_time:>9.2f} | {sublists_time / lines_time:>6.1f}x | '
+            f'{sublists_allocations:>11} | {lines_allocations:>8}',
+        )
+
+
+if __name__ == '__main__':
+    main()
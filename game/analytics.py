@@ -0,0 +1,329 @@
+"""
+Provide implementation of the game's streaming analytics over archives of games.
+
+Records are streamed from an archive by a pipeline of generators (read, replay and aggregate), so only a game at a time
+is in memory and aggregates are bounded by a board's positions and lines, however many games an archive has.
+
+Usage: python3 -m game.analytics games.ttt --workers 4 --top 5
+"""
+import argparse
+import os
+from collections import Counter
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from game.board import Board
+from game.dto import (
+    ArchiveStatistics,
+    GameRecord,
+    Player,
+)
+from game.enums import BoardCheckResultDecision
+from game.exceptions import (
+    BoardPlayerDoesNotExistException,
+    BoardPlayersMarksDuplicateException,
+    BoardPositionAlreadyTakenException,
+    BoardPositionDoesNotExistException,
+    BoardWinLengthIsInvalidException,
+    WorkersNumberIsInvalidException,
+)
+from game.records import (
+    RECORDS_OFFSET,
+    VERSION,
+    RecordReader,
+    get_archive_version,
+    get_board_state,
+    get_record_state,
+)
+
+REPLAY_EXCEPTIONS = (
+    BoardPlayerDoesNotExistException,
+    BoardPlayersMarksDuplicateException,
+    BoardPositionAlreadyTakenException,
+    BoardPositionDoesNotExistException,
+    BoardWinLengthIsInvalidException,
+)
+
+
+def read_records(path: Path, start: int = RECORDS_OFFSET, end: Optional[int] = None) -> Iterator[GameRecord]:
+    """
+    Read records of an archive.
+
+    Arguments:
+        path (Path): a path to an archive.
+        start (int): an offset of the first record to read, the first record of the archive if not specified.
+        end (int): an offset to stop reading records at, the end of the archive if not specified.
+
+    Yields:
+        Records as `GameRecord`.
+    """
+    with RecordReader(path=path) as reader:
+        for _, record in reader.iterate_with_offsets(start=start, end=end):
+            yield record
+
+
+def validate_record(record: GameRecord, version: int = VERSION) -> Optional[Board]:
+    """
+    Validate a record by replaying it through a board's moves.
+
+    A record is valid if its board can be built, each its move is legal and is made while the game continues, and the
+    game's state after the moves is the record's one. Games' states are got by the rules of the record's archive's
+    version (see `get_board_state`).
+
+    Arguments:
+        record (GameRecord): a game's record.
+        version (int): a version of the record's archive, the current one if not specified.
+
+    Returns:
+        The board after the game's moves as a `Board`, `None` if the record is invalid.
+    """
+    players = [Player(mark=mark) for mark in record.marks]
+
+    if not players:
+        return None
+
+    try:
+        board = Board(players=players, size=record.size, height=record.height, win_length=record.win_length)
+
+        for index, position in enumerate(record.moves):
+            if get_board_state(board=board, version=version).decision != BoardCheckResultDecision.CONTINUE:
+                return None
+
+            board.mark(player=players[index % len(players)], position=position)
+
+    except REPLAY_EXCEPTIONS:
+        return None
+
+    if get_board_state(board=board, version=version) != get_record_state(record=record):
+        return None
+
+    return board
+
+
+def replay_records(
+    records: Iterable[GameRecord],
+    version: int = VERSION,
+) -> Iterator[tuple[GameRecord, Optional[Board]]]:
+    """
+    Replay records through boards' moves, validating them.
+
+    Arguments:
+        records (Iterable): games' records as `GameRecord`.
+        version (int): a version of the records' archive, the current one if not specified.
+
+    Yields:
+        Records and their boards after the games' moves as tuples, the board is `None` if the record is invalid.
+    """
+    for record in records:
+        yield record, validate_record(record=record, version=version)
+
+
+def get_completed_lines(board: Board, position: int) -> list[tuple[int, ...]]:
+    """
+    Get winning lines completed by a winning move.
+
+    Arguments:
+        board (Board): a game's board after the winning move.
+        position (int): a human-readable position of the winning move.
+
+    Returns:
+        Lines (see `get_winning_lines` of `game.utils`) as tuples of human-readable positions.
+    """
+    cells = board.get()
+    mark = cells[position - 1]
+
+    return [
+        tuple(cell + 1 for cell in board.winning_lines[line])
+        for line in board.cells_lines[position - 1]
+        if all(cells[cell] is mark for cell in board.winning_lines[line])
+    ]
+
+
+def aggregate_games(games: Iterable[tuple[GameRecord, Optional[Board]]]) -> ArchiveStatistics:
+    """
+    Aggregate statistics of replayed games.
+
+    Invalid games are counted only, the other statistics are of valid games. Winning lines are counted by boards'
+    shapes, as the same positions make different lines on boards of different shapes.
+
+    Arguments:
+        games (Iterable): records and their boards as `replay_records` yields them.
+
+    Returns:
+        The statistics as an `ArchiveStatistics`.
+    """
+    games_number, invalid_games = 0, 0
+    first_moves, first_moves_wins, lengths, winning_lines = Counter(), Counter(), Counter(), Counter()
+
+    for record, board in games:
+        games_number += 1
+
+        if board is None:
+            invalid_games += 1
+            continue
+
+        lengths[len(record.moves)] += 1
+
+        if not record.moves:
+            continue
+
+        first_moves[record.moves[0]] += 1
+
+        if record.decision != BoardCheckResultDecision.WIN:
+            continue
+
+        if record.winning_mark is record.marks[0]:
+            first_moves_wins[record.moves[0]] += 1
+
+        winning_lines.update(
+            (board.size, board.height, line) for line in get_completed_lines(board=board, position=record.moves[-1])
+        )
+
+    return ArchiveStatistics(
+        games=games_number,
+        invalid_games=invalid_games,
+        first_moves=dict(first_moves),
+        first_moves_wins=dict(first_moves_wins),
+        lengths=dict(lengths),
+        winning_lines=dict(winning_lines),
+    )
+
+
+def analyze_chunk(path: Path, start: int = RECORDS_OFFSET, end: Optional[int] = None) -> ArchiveStatistics:
+    """
+    Analyze a chunk of an archive.
+
+    Arguments:
+        path (Path): a path to an archive.
+        start (int): an offset of the chunk's first record, the first record of the archive if not specified.
+        end (int): an offset of the chunk's end, the end of the archive if not specified.
+
+    Returns:
+        The chunk's statistics as an `ArchiveStatistics`.
+    """
+    records = read_records(path=path, start=start, end=end)
+
+    return aggregate_games(games=replay_records(records=records, version=get_archive_version(path=path)))
+
+
+def get_chunks(path: Path, chunks_number: int) -> list[tuple[int, int]]:
+    """
+    Split an archive into chunks of about the same size at records' boundaries.
+
+    Records are not decoded to find the boundaries (see `RecordReader.iterate_offsets`), and only the boundaries are
+    kept, so it takes a fraction of the chunks' analysis time and constant memory.
+
+    Arguments:
+        path (Path): a path to an archive.
+        chunks_number (int): a number of chunks, less chunks are returned if there are less records, none if there
+            are no records.
+
+    Returns:
+        Offsets of the chunks' first records and ends as a list of tuples.
+    """
+    archive_size = Path(path).stat().st_size
+    chunk_size = (archive_size - RECORDS_OFFSET) / chunks_number
+    starts = []
+
+    with RecordReader(path=path) as reader:
+        for offset in reader.iterate_offsets():
+            if not starts or offset >= RECORDS_OFFSET + len(starts) * chunk_size:
+                starts.append(offset)
+
+    if not starts:
+        return []
+
+    return list(zip(starts, starts[1:] + [archive_size], strict=True))
+
+
+def merge_statistics(statistics: Iterable[ArchiveStatistics]) -> ArchiveStatistics:
+    """
+    Merge statistics of archives' chunks.
+
+    Arguments:
+        statistics (Iterable): chunks' statistics as `ArchiveStatistics`.
+
+    Returns:
+        The merged statistics as an `ArchiveStatistics`.
+    """
+    games, invalid_games = 0, 0
+    first_moves, first_moves_wins, lengths, winning_lines = Counter(), Counter(), Counter(), Counter()
+
+    for chunk_statistics in statistics:
+        games += chunk_statistics.games
+        invalid_games += chunk_statistics.invalid_games
+        first_moves.update(chunk_statistics.first_moves)
+        first_moves_wins.update(chunk_statistics.first_moves_wins)
+        lengths.update(chunk_statistics.lengths)
+        winning_lines.update(chunk_statistics.winning_lines)
+
+    return ArchiveStatistics(
+        games=games,
+        invalid_games=invalid_games,
+        first_moves=dict(first_moves),
+        first_moves_wins=dict(first_moves_wins),
+        lengths=dict(sorted(lengths.items())),
+        winning_lines=dict(winning_lines),
+    )
+
+
+def analyze_archive(path: Path, workers: int = 1) -> ArchiveStatistics:
+    """
+    Analyze an archive of games.
+
+    With a single worker, the archive is streamed in the current process. Otherwise, it is split into a chunk per
+    worker, chunks are analyzed by worker processes and their statistics are merged.
+
+    Arguments:
+        path (Path): a path to an archive.
+        workers (int): a number of worker processes.
+
+    Raises:
+        WorkersNumberIsInvalidException: if the number of worker processes is less than 1.
+
+    Returns:
+        The archive's statistics as an `ArchiveStatistics`.
+    """
+    if workers < 1:
+        raise WorkersNumberIsInvalidException
+
+    if workers == 1:
+        return merge_statistics(statistics=[analyze_chunk(path=path)])
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(analyze_chunk, path, start, end)
+            for start, end in get_chunks(path=path, chunks_number=workers)
+        ]
+        return merge_statistics(statistics=(future.result() for future in futures))
+
+
+def main() -> None:
+    """
+    Analyze an archive of games from a command line and print its statistics.
+    """
+    parser = argparse.ArgumentParser(description='Analyze an archive of games.')
+    parser.add_argument('path', type=Path, help='a path to an archive')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='a number of worker processes')
+    parser.add_argument('--top', type=int, default=5, help='a number of the most common winning lines to print')
+    arguments = parser.parse_args()
+
+    statistics = analyze_archive(path=arguments.path, workers=arguments.workers)
+
+    print(f'Games: {statistics.games}, invalid: {statistics.invalid_games}.')
+    print(f'Lengths: {statistics.lengths}.')
+
+    for position, win_rate in statistics.get_first_moves_win_rates().items():
+        print(f'First move {position}: {statistics.first_moves[position]} games, {win_rate:.1%} won.')
+
+    for (size, height, line), wins in statistics.get_most_common_winning_lines(number=arguments.top):
+        print(f'Winning line {line} of {size}x{height} boards: {wins} games.')
+
+
+if __name__ == '__main__':
+    main()
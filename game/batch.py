@@ -0,0 +1,71 @@
+"""
+Provide implementation of the game's boards batch checking.
+"""
+from typing import Optional
+
+import numpy as np
+
+from game.enums import BoardCheckResultDecision
+from game.exceptions import BoardsShapeDoesNotMatchSizeException
+from game.utils import get_winning_lines
+
+EMPTY_CELL = 0
+BOARDS_DIMENSIONS_NUMBER = 2
+
+
+def check_boards(
+    boards: np.ndarray,
+    size: int,
+    height: Optional[int] = None,
+    win_length: Optional[int] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Check states of many boards at once.
+
+    It is a vectorized analogue of `Board.check` for offline analysis of huge numbers of positions. Each row of the
+    array is a board, where `0` is an empty cell and `i + 1` is a mark of the `i`-th board's player. Cells of all
+    winning lines of all boards are gathered at once and checked for being non-empty and equal, the first complete
+    line in the order of horizontals, verticals and diagonals wins, the same as `Board.check` does. A board without
+    a win is a tie if none of its lines is live, i.e. every line holds marks of different players, as its lowest and
+    highest marks differ.
+
+    Arguments:
+        boards (np.ndarray): boards as an integer array of `(N, size * height)` shape.
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of board's rows, the same as the size if not specified (a perfect square).
+        win_length (int): a number of marks in a row needed to win, the shortest side if not specified.
+
+    Raises:
+        BoardsShapeDoesNotMatchSizeException: if boards' shape does not match a board's size.
+
+    Returns:
+        Decisions as an array of `BoardCheckResultDecision` values and winning marks (`0` if no win) as an integer
+        array, both of `(N,)` shape.
+    """
+    boards = np.asarray(boards)
+    height = size if height is None else height
+
+    if boards.ndim != BOARDS_DIMENSIONS_NUMBER or boards.shape[1] != size * height:
+        raise BoardsShapeDoesNotMatchSizeException
+
+    lines = np.array(get_winning_lines(size=size, height=height, win_length=win_length), dtype=np.intp)
+    lines_cells = boards[:, lines]
+    lines_first_cells = lines_cells[:, :, 0]
+
+    are_lines_completed = (lines_first_cells != EMPTY_CELL) & (lines_cells == lines_first_cells[:, :, None]).all(axis=2)
+    are_boards_won = are_lines_completed.any(axis=1)
+    lines_lowest_marks = np.where(lines_cells == EMPTY_CELL, lines_cells.max(initial=EMPTY_CELL) + 1, lines_cells)
+    are_lines_live = lines_lowest_marks.min(axis=2) >= lines_cells.max(axis=2)
+    are_boards_dead = ~are_lines_live.any(axis=1)
+
+    first_completed_lines = are_lines_completed.argmax(axis=1)
+    winning_marks = lines_first_cells[np.arange(len(boards)), first_completed_lines]
+    winning_marks = np.where(are_boards_won, winning_marks, EMPTY_CELL)
+
+    decisions = np.where(
+        are_boards_won,
+        BoardCheckResultDecision.WIN.value,
+        np.where(are_boards_dead, BoardCheckResultDecision.TIE.value, BoardCheckResultDecision.CONTINUE.value),
+    )
+
+    return decisions, winning_marks
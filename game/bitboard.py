@@ -0,0 +1,249 @@
+"""
+Provide implementation of the game's bitboard.
+"""
+from functools import lru_cache
+from typing import Optional
+
+from game.dto import (
+    BoardState,
+    Player,
+)
+from game.enums import BoardCheckResultDecision
+from game.exceptions import (
+    BoardPlayerDoesNotExistException,
+    BoardPlayersMarksDuplicateException,
+    BoardPositionAlreadyTakenException,
+    BoardPositionDoesNotExistException,
+    BoardWinLengthIsInvalidException,
+)
+from game.utils import (
+    WINNING_LINES_CACHE_SIZE,
+    get_cells_winning_lines,
+    get_winning_lines,
+)
+
+
+@lru_cache(maxsize=WINNING_LINES_CACHE_SIZE)
+def get_win_masks(size: int, height: int, win_length: int) -> tuple[int, ...]:
+    """
+    Get win masks of a board.
+
+    A win mask is an integer with bits set for each position of a winning line (as `get_winning_lines` returns them),
+    the first position is the lowest bit. Masks are computed once per board's shape.
+
+    Arguments:
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of board's rows.
+        win_length (int): a number of marks in a row needed to win.
+
+    Returns:
+        Win masks as a tuple of integers.
+    """
+    winning_lines = get_winning_lines(size=size, height=height, win_length=win_length)
+    return tuple(sum(1 << position for position in positions) for positions in winning_lines)
+
+
+@lru_cache(maxsize=WINNING_LINES_CACHE_SIZE)
+def get_cells_win_masks(size: int, height: int, win_length: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Get win masks going through each board's cell.
+
+    Arguments:
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of board's rows.
+        win_length (int): a number of marks in a row needed to win.
+
+    Returns:
+        Win masks for each board's cell as a tuple of tuples of integers.
+    """
+    win_masks = get_win_masks(size=size, height=height, win_length=win_length)
+    cells_winning_lines = get_cells_winning_lines(size=size, height=height, win_length=win_length)
+    return tuple(tuple(win_masks[line] for line in lines) for lines in cells_winning_lines)
+
+
+class BitBoard:
+    """
+    Bitboard implementation.
+
+    It has the same interface as `Board`, but stores each player's marks as an integer bitmask instead of a list of
+    marks, so a win is a few `mask & win_mask == win_mask` operations against precomputed win masks. A number of live
+    win masks (holding marks of a single player at most) is kept as well, so a game is a tie as soon as none is left.
+    """
+
+    EMPTY_CELL = None
+
+    def __init__(
+        self,
+        players: [Player],
+        size: int = 3,
+        height: Optional[int] = None,
+        win_length: Optional[int] = None,
+    ) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            players (list): a list of players as list of `Player`.
+            size (int): a size of a board as integer, means number of positions per row.
+            height (int): a number of board's rows, the same as the size if not specified (a perfect square).
+            win_length (int): a number of marks in a row needed to win, the shortest side if not specified.
+
+        Raises:
+            BoardPlayersMarksDuplicateException: if board players' marks duplicate.
+            BoardWinLengthIsInvalidException: if board's win length does not fit into the board.
+        """
+        self.players = players
+        self.players_number = len(players)
+
+        if len({player.mark for player in players}) != self.players_number:
+            raise BoardPlayersMarksDuplicateException
+
+        self.size = size
+        self.height = size if height is None else height
+        self.win_length = min(self.size, self.height) if win_length is None else win_length
+
+        if not 1 <= self.win_length <= max(self.size, self.height):
+            raise BoardWinLengthIsInvalidException
+
+        self.board_positions_number = self.size * self.height
+        self.win_masks = get_win_masks(size=self.size, height=self.height, win_length=self.win_length)
+        self.cells_win_masks = get_cells_win_masks(size=self.size, height=self.height, win_length=self.win_length)
+
+        self.masks = {player.mark: 0 for player in players}
+        self.occupied_mask = 0
+        self.live_lines_number = len(self.win_masks)
+        self.state = BoardState(decision=BoardCheckResultDecision.CONTINUE)
+
+    @property
+    def board(self) -> list:
+        """
+        Get a board's cells.
+
+        Returns:
+            A board as a list of `None` or marks.
+        """
+        return self.get()
+
+    @board.setter
+    def board(self, board: list) -> None:
+        """
+        Set a board's cells.
+
+        Arguments:
+            board (list): a board as a list of `None` or marks.
+        """
+        self.masks = {player.mark: 0 for player in self.players}
+        self.occupied_mask = 0
+
+        for computer_position, cell in enumerate(board):
+            if cell is self.EMPTY_CELL:
+                continue
+
+            self.masks[cell] = self.masks.get(cell, 0) | 1 << computer_position
+            self.occupied_mask |= 1 << computer_position
+
+        self.live_lines_number = sum(
+            sum(1 for mask in self.masks.values() if mask & win_mask) <= 1 for win_mask in self.win_masks
+        )
+        self.state = self._get_state()
+
+    def get(self) -> list:
+        """
+        Get a board.
+
+        Returns:
+            A board as a list of `None` or marks.
+        """
+        board = [self.EMPTY_CELL] * self.board_positions_number
+
+        for mark, mask in self.masks.items():
+            remaining_mask = mask
+
+            while remaining_mask:
+                lowest_bit = remaining_mask & -remaining_mask
+                board[lowest_bit.bit_length() - 1] = mark
+                remaining_mask ^= lowest_bit
+
+        return board
+
+    def mark(self, player: Player, position: int) -> None:
+        """
+        Mark a board's cell by a player.
+
+        It accepts the position as human-readable position meaning first position would be 1.
+        For computers, in particular board representation as a bitmask, the first position is the lowest bit.
+
+        Arguments:
+            player (Player): a player as a `Player`.
+            position (int): position on a board.
+
+        Raises:
+            BoardPlayerDoesNotExistException: if board's player does not exist.
+            BoardPositionDoesNotExistException: if board's position does not exist.
+            BoardPositionAlreadyTakenException: if board's position already taken.
+        """
+        if player not in self.players:
+            raise BoardPlayerDoesNotExistException
+
+        if position == 0 or position > self.board_positions_number:
+            raise BoardPositionDoesNotExistException
+
+        computer_position = position - 1
+        bit = 1 << computer_position
+
+        if self.occupied_mask & bit:
+            raise BoardPositionAlreadyTakenException
+
+        previous_mask, previous_occupied_mask = self.masks[player.mark], self.occupied_mask
+        mask = previous_mask | bit
+        self.masks[player.mark] = mask
+        self.occupied_mask |= bit
+
+        if self.state.decision != BoardCheckResultDecision.CONTINUE:
+            return
+
+        for win_mask in self.cells_win_masks[computer_position]:
+            if mask & win_mask == win_mask:
+                self.state = BoardState(decision=BoardCheckResultDecision.WIN, winning_player=player)
+                return
+
+        for win_mask in self.cells_win_masks[computer_position]:
+            others_mask = previous_occupied_mask & win_mask
+
+            if previous_mask & win_mask or not others_mask:
+                continue
+
+            if any(mask & win_mask == others_mask for mask in self.masks.values()):
+                self.live_lines_number -= 1
+
+        if not self.live_lines_number:
+            self.state = BoardState(decision=BoardCheckResultDecision.TIE)
+
+    def check(self) -> BoardState:
+        """
+        Check a board's state.
+
+        The state is computed by `mark` against win masks going through the marked cell only: a win mask becomes dead
+        when the player marks it for the first time while it holds marks of another single player.
+
+        Returns:
+             A board's state as a `BoardState`.
+        """
+        return self.state
+
+    def _get_state(self) -> BoardState:
+        """
+        Get a board's state checking all win masks.
+
+        Returns:
+             A board's state as a `BoardState`.
+        """
+        for win_mask in self.win_masks:
+            for player in self.players:
+                if self.masks[player.mark] & win_mask == win_mask:
+                    return BoardState(decision=BoardCheckResultDecision.WIN, winning_player=player)
+
+        if not self.live_lines_number:
+            return BoardState(decision=BoardCheckResultDecision.TIE)
+
+        return BoardState(decision=BoardCheckResultDecision.CONTINUE)
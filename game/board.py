@@ -1,6 +1,8 @@
 """
 Provide implementation of the game's board.
 """
+from typing import Optional
+
 from game.dto import (
     BoardState,
     Player,
@@ -8,36 +10,60 @@ from game.dto import (
 )
 from game.enums import BoardCheckResultDecision
 from game.exceptions import (
+    BoardMoveToRedoDoesNotExistException,
+    BoardMoveToUndoDoesNotExistException,
     BoardPlayerDoesNotExistException,
     BoardPlayersMarksDuplicateException,
     BoardPositionAlreadyTakenException,
     BoardPositionDoesNotExistException,
+    BoardWinLengthIsInvalidException,
 )
 from game.utils import (
-    get_diagonal_sublists,
-    get_horizontal_sublists,
-    get_vertical_sublists,
-    is_list_has_equal_elements,
+    get_cells_winning_lines,
+    get_winning_lines,
+    get_zobrist_table,
 )
 
 
 class Board:
     """
     Board implementation.
+
+    A position's Zobrist key (see `get_zobrist_table`) is kept in `key` and updated by each move in O(1), so caches and
+    transposition tables can be keyed by it instead of hashing the board's cells.
+
+    Numbers of open lines (lines holding marks of a single player) per player and per number of marks are kept too,
+    updated by each move only for lines going through the marked cell, so heuristics (see `game.heuristics`) read
+    patterns like open twos and threes without rescanning the board. Empty cells completing players' threats (open
+    lines a mark short of a win) are kept the same way, with numbers of the threats each of them completes.
     """
 
     EMPTY_CELL = None
-
-    def __init__(self, players: [Player], size: int = 3) -> None:
+    MIXED_LINE = object()
+
+    def __init__(
+        self,
+        players: [Player],
+        size: int = 3,
+        height: Optional[int] = None,
+        win_length: Optional[int] = None,
+    ) -> None:
         """
         Construct the object.
 
+        A board is a rectangle of `height` rows of `size` positions, where a player needs `win_length` marks in a row
+        (horizontally, vertically or diagonally) to win. By default, it is a perfect square and a player needs to fill
+        a whole row, column or diagonal, as in the classic game; e.g. Gomoku is `size=15, win_length=5`.
+
         Arguments:
             players (list): a list of players as list of `Player`.
-            size (int): a size of a board as integer, means number of position per side in a perfect square.
+            size (int): a size of a board as integer, means number of positions per row.
+            height (int): a number of board's rows, the same as the size if not specified (a perfect square).
+            win_length (int): a number of marks in a row needed to win, the shortest side if not specified.
 
         Raises:
             BoardPlayersMarksDuplicateException: if board players' marks duplicate.
+            BoardWinLengthIsInvalidException: if board's win length does not fit into the board.
         """
         self.players = players
         self.players_number = len(players)
@@ -46,9 +72,49 @@ class Board:
             raise BoardPlayersMarksDuplicateException
 
         self.size = size
+        self.height = size if height is None else height
+        self.win_length = min(self.size, self.height) if win_length is None else win_length
+
+        if not 1 <= self.win_length <= max(self.size, self.height):
+            raise BoardWinLengthIsInvalidException
+
+        self.board_positions_number = self.size * self.height
+        self.winning_lines = get_winning_lines(size=self.size, height=self.height, win_length=self.win_length)
+        self.cells_lines = get_cells_winning_lines(size=self.size, height=self.height, win_length=self.win_length)
+        self.lines_number = len(self.winning_lines)
+        self.zobrist_table = get_zobrist_table(cells_number=self.board_positions_number)
+
+        self._board = [self.EMPTY_CELL] * self.board_positions_number
+        self._moves = []
+        self._redo_moves = []
+        self._reset_lines()
+
+    @property
+    def board(self) -> list:
+        """
+        Get a board's cells.
 
-        self.board = [self.EMPTY_CELL, self.EMPTY_CELL, self.EMPTY_CELL] * size
-        self.board_positions_number = len(self.board)
+        Returns:
+            A board as a list of `None` or marks.
+        """
+        return self._board
+
+    @board.setter
+    def board(self, board: list) -> None:
+        """
+        Set a board's cells.
+
+        Assigning a whole board (e.g. restoring a saved game) rebuilds the lines' state from scratch, so the state
+        returned by `check` is correct for an arbitrary board, not only for a board built by `mark` calls. The moves'
+        history is cleared, as the board's moves are not known.
+
+        Arguments:
+            board (list): a board as a list of `None` or marks.
+        """
+        self._board = board
+        self._moves = []
+        self._redo_moves = []
+        self._rebuild_lines()
 
     def get(self) -> list:
         """
@@ -59,6 +125,42 @@ class Board:
         """
         return self.board
 
+    def get_moves(self) -> list[int]:
+        """
+        Get moves made on a board, undone moves excluded.
+
+        Returns:
+            Human-readable positions of the moves in order as a list of integers.
+        """
+        return [computer_position + 1 for computer_position, *_ in self._moves]
+
+    def get_open_lines_numbers(self, player: Player) -> list[int]:
+        """
+        Get numbers of a player's open lines, i.e. winning lines holding the player's marks only.
+
+        Arguments:
+            player (Player): a player as a `Player`.
+
+        Returns:
+            Numbers of the open lines by numbers of the player's marks in them (from 0 to a win length, lines without
+            marks are not counted) as a list of integers.
+        """
+        return list(self._open_lines_numbers[player.mark])
+
+    def get_threats_cells(self, player: Player) -> list[int]:
+        """
+        Get empty cells completing a player's threats, i.e. open lines holding a mark less than a win length.
+
+        A cell completing several threats is got once, so a player with two or more cells has a double threat.
+
+        Arguments:
+            player (Player): a player as a `Player`.
+
+        Returns:
+            Human-readable positions of the cells as a list of integers.
+        """
+        return [computer_position + 1 for computer_position in self._threats_cells[player.mark]]
+
     def mark(self, player: Player, position: int) -> None:
         """
         Mark a board's cell by a player.
@@ -87,40 +189,302 @@ class Board:
         if cell is not self.EMPTY_CELL:
             raise BoardPositionAlreadyTakenException
 
-        self.board[computer_position] = player.mark
+        self._redo_moves.clear()
+        self._make(computer_position=computer_position, player=player)
+
+    def undo(self) -> None:
+        """
+        Undo the last move.
+
+        It restores the cell, the lines going through it, the position's key and the board's state in O(1) per line,
+        without copying the board, so engines and analysis tools can try moves on the board itself. The cell is emptied
+        after its lines are restored, so an empty cell of a threat which stops being one is the only empty cell found.
+
+        Raises:
+            BoardMoveToUndoDoesNotExistException: if there are no moves to undo.
+        """
+        if not self._moves:
+            raise BoardMoveToUndoDoesNotExistException
+
+        computer_position, player, previous_state, mixed_lines = self._moves.pop()
+
+        self._live_lines_number += len(mixed_lines)
+        self.key ^= self.zobrist_table[player.mark][computer_position]
+
+        open_lines_numbers = self._open_lines_numbers[player.mark]
+        threat_marks_number = self.win_length - 1
+
+        for line in self.cells_lines[computer_position]:
+            line_marks_number = self._lines_marks_numbers[line]
+            self._lines_marks_numbers[line] = line_marks_number - 1
+
+            if self._lines_marks[line] is not player.mark:
+                continue
+
+            open_lines_numbers[line_marks_number] -= 1
+
+            if line_marks_number == threat_marks_number:
+                self._remove_threat_cell(mark=player.mark, computer_position=self._get_line_empty_cell(line=line))
+
+            elif line_marks_number > threat_marks_number > 0:
+                self._add_threat_cell(mark=player.mark, computer_position=computer_position)
+
+            if line_marks_number == 1:
+                self._lines_marks[line] = self.EMPTY_CELL
+
+            else:
+                open_lines_numbers[line_marks_number - 1] += 1
+
+        for line, line_mark in mixed_lines:
+            self._lines_marks[line] = line_mark
+            self._open_lines_numbers[line_mark][self._lines_marks_numbers[line]] += 1
+
+            if self._lines_marks_numbers[line] == threat_marks_number:
+                self._add_threat_cell(mark=line_mark, computer_position=computer_position)
+
+        self._board[computer_position] = self.EMPTY_CELL
+        self.state = previous_state
+        self._redo_moves.append((computer_position, player))
+
+    def redo(self) -> None:
+        """
+        Redo the last undone move.
+
+        Undone moves can be redone until a new move is marked.
+
+        Raises:
+            BoardMoveToRedoDoesNotExistException: if there are no moves to redo.
+        """
+        if not self._redo_moves:
+            raise BoardMoveToRedoDoesNotExistException
+
+        computer_position, player = self._redo_moves.pop()
+        self._make(computer_position=computer_position, player=player)
 
     def check(self) -> BoardState:
         """
         Check a board's state.
 
         It checks if board's state is a win of a player, tie or continue. It is meant to check the board state after
-        each move. The algorithm is way simple: take all possible and winnable positions (all horizontals, verticals
-        and diagonals) and check for all marks of them would be equal (meaning related to a single player).
+        each move. The state is not computed here: each `mark` updates only winning lines (windows of a win length of
+        cells in a row) going through the marked cell, at most a win length of them per direction, so the state after
+        a move is already known and the board is never rescanned.
+
+        A tie is declared as soon as no line is live, i.e. every line holds marks of different players, so nobody can
+        win anymore, even if there are empty cells left (a full board without a winner has no live lines either).
 
         Returns:
              A board's state as a `BoardState`.
         """
-        horizontal_marks = get_horizontal_sublists(list_=self.board, chunks=self.size)
-        vertical_marks = get_vertical_sublists(list_=self.board, chunks=self.size)
-        diagonal_marks = get_diagonal_sublists(list_=self.board)
+        return self.state
 
-        for direction_marks in [horizontal_marks, vertical_marks, diagonal_marks]:
-            for marks in direction_marks:
-                if self.EMPTY_CELL in marks:
-                    continue
+    def _make(self, computer_position: int, player: Player) -> None:
+        """
+        Mark an empty board's cell by a player and push the move to the moves' history.
+
+        Arguments:
+            computer_position (int): position on a board, the first position is 0.
+            player (Player): a player as a `Player`.
+        """
+        previous_state = self.state
+
+        self._board[computer_position] = player.mark
+        self.key ^= self.zobrist_table[player.mark][computer_position]
+
+        mixed_lines = []
+        is_line_completed = self._mark_lines(
+            computer_position=computer_position,
+            mark=player.mark,
+            mixed_lines=mixed_lines,
+        )
+        self._live_lines_number -= len(mixed_lines)
+        self._moves.append((computer_position, player, previous_state, mixed_lines))
+
+        if self.state.decision != BoardCheckResultDecision.CONTINUE:
+            return
+
+        if is_line_completed:
+            self.state = BoardState(decision=BoardCheckResultDecision.WIN, winning_player=player)
+            return
 
-                are_marks_identical = is_list_has_equal_elements(list_=marks)
+        if not self._live_lines_number:
+            self.state = BoardState(decision=BoardCheckResultDecision.TIE)
+
+    def _mark_lines(self, computer_position: int, mark: PlayerMark, mixed_lines: list) -> bool:
+        """
+        Mark lines going through a board's cell.
+
+        Each line remembers a mark it is filled with (`None` if the line is empty, `MIXED_LINE` if it contains marks of
+        different players) and a number of marks in it. Lines which become mixed by the mark are collected with their
+        previous marks, so the move can be undone: other lines' marks are restored by their numbers of marks. Numbers
+        of open lines are moved between numbers of marks, or decreased for lines which become mixed. A threat stops
+        being one only by marking its single empty cell, which is the marked cell then.
+
+        Arguments:
+            computer_position (int): position on a board, the first position is 0.
+            mark (PlayerMark): a player's mark.
+            mixed_lines (list): a list to collect lines which become mixed to, as tuples of a line and its mark.
+
+        Returns:
+            True, if any of the lines is completely filled with the mark.
+            Otherwise, False.
+        """
+        is_line_completed = False
+        open_lines_numbers = self._open_lines_numbers[mark]
+        threat_marks_number = self.win_length - 1
+
+        for line in self.cells_lines[computer_position]:
+            line_mark = self._lines_marks[line]
+            line_marks_number = self._lines_marks_numbers[line]
+            self._lines_marks_numbers[line] = line_marks_number + 1
+
+            if line_mark is self.EMPTY_CELL:
+                self._lines_marks[line] = mark
+                line_mark = mark
+
+            elif line_mark is mark:
+                open_lines_numbers[line_marks_number] -= 1
+
+            elif line_mark is not self.MIXED_LINE:
+                self._lines_marks[line] = self.MIXED_LINE
+                self._open_lines_numbers[line_mark][line_marks_number] -= 1
+                mixed_lines.append((line, line_mark))
+
+                if line_marks_number == threat_marks_number:
+                    self._remove_threat_cell(mark=line_mark, computer_position=computer_position)
+
+                continue
+
+            else:
+                continue
+
+            line_marks_number += 1
+            open_lines_numbers[line_marks_number] += 1
+
+            if line_marks_number < threat_marks_number:
+                continue
+
+            if line_marks_number == threat_marks_number:
+                self._add_threat_cell(mark=mark, computer_position=self._get_line_empty_cell(line=line))
+                continue
+
+            is_line_completed = True
+
+            if threat_marks_number:
+                self._remove_threat_cell(mark=mark, computer_position=computer_position)
+
+        return is_line_completed
+
+    def _rebuild_lines(self) -> None:
+        """
+        Rebuild lines' state, a board's state and a position's Zobrist key from a board's cells.
+
+        It iterates positions of the winning lines shared by all boards of the shape, so no sublists are created. The
+        lines are checked in the order of horizontals, verticals and diagonals.
+        """
+        board = self._board
+        self._reset_lines()
 
-                if not are_marks_identical:
+        for position, cell in enumerate(board):
+            if cell is not self.EMPTY_CELL:
+                self.key ^= self.zobrist_table[cell][position]
+
+        for line, positions in enumerate(self.winning_lines):
+            line_mark = self.EMPTY_CELL
+            line_marks_number = 0
+            empty_position = None
+
+            for position in positions:
+                cell = board[position]
+
+                if cell is self.EMPTY_CELL:
+                    empty_position = position
                     continue
 
-                winning_player = self._get_player_from_marks(marks=marks)
-                return BoardState(decision=BoardCheckResultDecision.WIN, winning_player=winning_player)
+                line_marks_number += 1
+
+                if line_mark is self.EMPTY_CELL:
+                    line_mark = cell
+
+                elif cell is not line_mark:
+                    line_mark = self.MIXED_LINE
+
+            self._lines_marks[line] = line_mark
+            self._lines_marks_numbers[line] = line_marks_number
+
+            if line_mark is self.MIXED_LINE:
+                self._live_lines_number -= 1
+
+            if line_mark in self._open_lines_numbers:
+                self._open_lines_numbers[line_mark][line_marks_number] += 1
+
+                if line_marks_number == self.win_length - 1:
+                    self._add_threat_cell(mark=line_mark, computer_position=empty_position)
+
+            is_line_completed = line_marks_number == self.win_length and line_mark is not self.MIXED_LINE
+
+            if is_line_completed and self.state.decision == BoardCheckResultDecision.CONTINUE:
+                winning_player = self._get_player_from_marks(marks=[line_mark])
+                self.state = BoardState(decision=BoardCheckResultDecision.WIN, winning_player=winning_player)
+
+        if self.state.decision == BoardCheckResultDecision.CONTINUE and not self._live_lines_number:
+            self.state = BoardState(decision=BoardCheckResultDecision.TIE)
+
+    def _reset_lines(self) -> None:
+        """
+        Reset lines' state, a board's state and a position's Zobrist key to the ones of an empty board.
+
+        An empty board's state is known without scanning its cells: all lines are empty and live, no player has open
+        lines or threats, and the key is `0`.
+        """
+        self._lines_marks = [self.EMPTY_CELL] * self.lines_number
+        self._lines_marks_numbers = [0] * self.lines_number
+        self._open_lines_numbers = {player.mark: [0] * (self.win_length + 1) for player in self.players}
+        self._threats_cells = {player.mark: {} for player in self.players}
+        self._live_lines_number = self.lines_number
+        self.state = BoardState(decision=BoardCheckResultDecision.CONTINUE)
+
+        self.key = 0
+
+    def _get_line_empty_cell(self, line: int) -> int:
+        """
+        Get an empty cell of a threat, it is the only empty cell of the line.
+
+        Arguments:
+            line (int): an index of a winning line.
+
+        Returns:
+            The cell's position, the first position is 0.
+        """
+        return next(position for position in self.winning_lines[line] if self._board[position] is self.EMPTY_CELL)
+
+    def _add_threat_cell(self, mark: PlayerMark, computer_position: int) -> None:
+        """
+        Count a threat completed by an empty cell.
+
+        Arguments:
+            mark (PlayerMark): a mark of the threat's player.
+            computer_position (int): the cell's position, the first position is 0.
+        """
+        threats_cells = self._threats_cells[mark]
+        threats_cells[computer_position] = threats_cells.get(computer_position, 0) + 1
+
+    def _remove_threat_cell(self, mark: PlayerMark, computer_position: int) -> None:
+        """
+        Uncount a threat completed by a cell, the cell is forgotten when it completes no threats.
+
+        Arguments:
+            mark (PlayerMark): a mark of the threat's player.
+            computer_position (int): the cell's position, the first position is 0.
+        """
+        threats_cells = self._threats_cells[mark]
+        threats_number = threats_cells[computer_position] - 1
 
-        if self.EMPTY_CELL not in self.board:
-            return BoardState(decision=BoardCheckResultDecision.TIE)
+        if threats_number:
+            threats_cells[computer_position] = threats_number
 
-        return BoardState(decision=BoardCheckResultDecision.CONTINUE)
+        else:
+            del threats_cells[computer_position]
 
     def _get_player_from_marks(self, marks: [PlayerMark]) -> Player:
         """
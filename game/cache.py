@@ -0,0 +1,150 @@
+"""
+Provide implementation of the game's evaluation cache shared by engines.
+
+A cache's file is a header (`MAGIC` and a version byte) followed by entries from the least to the most recently used:
+
+    uint64  key     - a position's key.
+    uint16  depth   - a depth the position has been searched to.
+    int32   value   - the position's value for a player to move.
+    uint8   bound   - whether the value is exact, a lower bound or an upper bound, as an engine defines it.
+    int16   move    - the best move's position (the first position is 0), `-1` if there is no move.
+"""
+import struct
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from game.dto import CacheStats
+from game.exceptions import (
+    EvaluationCacheCapacityIsInvalidException,
+    EvaluationCacheFileIsInvalidException,
+)
+
+MAGIC = b'TTTE'
+VERSION = 1
+HEADER = MAGIC + bytes([VERSION])
+
+ENTRY = struct.Struct('<QHiBh')
+NO_MOVE = -1
+
+DEFAULT_CAPACITY = 1_000_000
+
+
+class EvaluationCache:
+    """
+    Evaluation cache implementation.
+
+    It maps positions' keys (64-bit integers, e.g. Zobrist keys, see `get_zobrist_table`) to their search results:
+    a depth, a value, a bound and the best move. Its capacity is a number of entries, not of bytes: it holds at most
+    the capacity of entries, evicting the least recently used one when it is full, so its memory grows with the
+    capacity, but an entry's size in memory depends on the interpreter and is not capped. A single cache can be shared
+    by engines across moves and games, and saved to a file and loaded from it, so a restarted process starts warm.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            capacity (int): a maximum number of entries.
+
+        Raises:
+            EvaluationCacheCapacityIsInvalidException: if the capacity is less than 1.
+        """
+        if capacity < 1:
+            raise EvaluationCacheCapacityIsInvalidException
+
+        self.capacity = capacity
+        self.stats = CacheStats()
+
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        """
+        Get a number of entries.
+
+        Returns:
+            The number of entries as an integer.
+        """
+        return len(self._entries)
+
+    def get(self, key: int) -> Optional[tuple[int, int, int, Optional[int]]]:
+        """
+        Get an entry of a position and mark it as the most recently used.
+
+        Arguments:
+            key (int): the position's key.
+
+        Returns:
+            The position's depth, value, bound and best move as a tuple, `None` if the position is not cached.
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+
+        return entry
+
+    def put(self, key: int, depth: int, value: int, bound: int, move: Optional[int]) -> None:  # noqa: PLR0913
+        """
+        Put an entry of a position, replacing its previous entry, and evict the least recently used entry if full.
+
+        Arguments:
+            key (int): the position's key.
+            depth (int): a depth the position has been searched to.
+            value (int): the position's value for a player to move.
+            bound (int): whether the value is exact, a lower bound or an upper bound.
+            move (int): the best move's position, the first position is 0, `None` if there is no move.
+        """
+        entries = self._entries
+
+        if key in entries:
+            entries.move_to_end(key)
+
+        elif len(entries) >= self.capacity:
+            entries.popitem(last=False)
+            self.stats.evictions += 1
+
+        entries[key] = (depth, value, bound, move)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        self._entries.clear()
+
+    def save(self, path: Path) -> None:
+        """
+        Save entries to a file, from the least to the most recently used.
+
+        Arguments:
+            path (Path): a path to the file.
+        """
+        buffer = bytearray(HEADER)
+
+        for key, (depth, value, bound, move) in self._entries.items():
+            buffer.extend(ENTRY.pack(key, depth, value, bound, NO_MOVE if move is None else move))
+
+        Path(path).write_bytes(buffer)
+
+    def load(self, path: Path) -> None:
+        """
+        Load entries from a file, as the most recently used ones, evicting entries if the cache gets full.
+
+        Arguments:
+            path (Path): a path to the file.
+
+        Raises:
+            EvaluationCacheFileIsInvalidException: if the file is not a cache's file or is truncated.
+        """
+        data = Path(path).read_bytes()
+
+        if data[:len(HEADER)] != HEADER or (len(data) - len(HEADER)) % ENTRY.size:
+            raise EvaluationCacheFileIsInvalidException
+
+        for key, depth, value, bound, move in ENTRY.iter_unpack(memoryview(data)[len(HEADER):]):
+            self.put(key=key, depth=depth, value=value, bound=bound, move=None if move == NO_MOVE else move)
@@ -1,7 +1,11 @@
 """
 Provide implementation of the game's dataclasses.
 """
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import (
+    dataclass,
+    field,
+)
 from typing import Optional
 
 from game.enums import (
@@ -58,3 +62,190 @@ class BoardState:
             return False
 
         return True
+
+
+@dataclass
+class SearchStats:
+    """
+    Engine's search statistics dataclass implementation.
+    """
+
+    nodes: int = 0
+    transposition_table_lookups: int = 0
+    transposition_table_hits: int = 0
+    depth: int = 0
+    time: float = 0.0
+
+    @property
+    def transposition_table_hit_rate(self) -> float:
+        """
+        Get a transposition table's hit rate.
+
+        Returns:
+            A ratio of hits to lookups as a float, 0 if there were no lookups.
+        """
+        if not self.transposition_table_lookups:
+            return 0.0
+
+        return self.transposition_table_hits / self.transposition_table_lookups
+
+
+@dataclass
+class PlayoutStats:
+    """
+    Monte Carlo engine's playouts statistics dataclass implementation.
+    """
+
+    playouts: int = 0
+    reused_playouts: int = 0
+    time: float = 0.0
+
+    @property
+    def playouts_per_second(self) -> float:
+        """
+        Get a number of playouts per second.
+
+        Returns:
+            A number of playouts per second as a float, 0 if no time has passed.
+        """
+        if not self.time:
+            return 0.0
+
+        return self.playouts / self.time
+
+
+@dataclass
+class SelfPlayResult:
+    """
+    Self-play games' result dataclass implementation.
+    """
+
+    games: int = 0
+    wins: dict = field(default_factory=dict)
+    ties: int = 0
+    lengths: dict = field(default_factory=dict)
+    time: float = 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """
+        Get a number of games played per second.
+
+        Returns:
+            A number of games per second as a float, 0 if no time has passed.
+        """
+        if not self.time:
+            return 0.0
+
+        return self.games / self.time
+
+
+@dataclass
+class CacheStats:
+    """
+    Evaluation cache's statistics dataclass implementation.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Get a cache's hit rate.
+
+        Returns:
+            A ratio of hits to lookups as a float, 0 if there were no lookups.
+        """
+        lookups = self.hits + self.misses
+
+        if not lookups:
+            return 0.0
+
+        return self.hits / lookups
+
+
+@dataclass
+class LinesPatterns:
+    """
+    Player's lines patterns dataclass implementation.
+
+    Patterns are open lines, i.e. winning lines holding marks of the player only: open twos and threes hold two and
+    three marks, threats are a mark short of a win. Threats are counted by lines, and by empty cells completing them
+    as well, as several threats can be completed by the same cell.
+    """
+
+    open_twos: int
+    open_threes: int
+    threats: int
+    threats_cells: int
+
+    @property
+    def is_double_threat(self) -> bool:
+        """
+        Check if a player has a double threat, i.e. an opponent cannot block all the threats with a single move.
+
+        Returns:
+            True, if the player's threats are completed by at least two different cells.
+            Otherwise, False.
+        """
+        return self.threats_cells > 1
+
+
+@dataclass
+class GameRecord:
+    """
+    Game's record dataclass implementation.
+
+    Moves are human-readable positions (the first position is 1) made by players in turns, in the players' order.
+    """
+
+    size: int
+    height: int
+    win_length: int
+    marks: list = field(default_factory=list)
+    moves: list = field(default_factory=list)
+    decision: BoardCheckResultDecision = BoardCheckResultDecision.CONTINUE
+    winning_mark: Optional[PlayerMark] = None
+
+
+@dataclass
+class ArchiveStatistics:
+    """
+    Archived games' statistics dataclass implementation.
+
+    Positions are human-readable (the first position is 1). Winning lines are keyed by tuples of a board's size, its
+    height and the line's positions.
+    """
+
+    games: int = 0
+    invalid_games: int = 0
+    first_moves: dict = field(default_factory=dict)
+    first_moves_wins: dict = field(default_factory=dict)
+    lengths: dict = field(default_factory=dict)
+    winning_lines: dict = field(default_factory=dict)
+
+    def get_first_moves_win_rates(self) -> dict:
+        """
+        Get win rates of a first player by its first move.
+
+        Returns:
+            Shares of games won by a first player by positions of its first move as a dictionary.
+        """
+        return {
+            position: self.first_moves_wins.get(position, 0) / games
+            for position, games in sorted(self.first_moves.items())
+        }
+
+    def get_most_common_winning_lines(self, number: int) -> list:
+        """
+        Get the most common winning lines.
+
+        Arguments:
+            number (int): a number of lines to get.
+
+        Returns:
+            Winning lines and numbers of games won by them as a list of tuples, the most common first.
+        """
+        return Counter(self.winning_lines).most_common(number)
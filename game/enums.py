@@ -25,3 +25,22 @@ class PlayerMark(Enum):
     CLASSIC_Y = 'o'
     MODERN_X = '✘'
     MODERN_Y = '𝐎'  # ruff: noqa: RUF001
+
+
+class PositionValue(Enum):
+    """
+    Position's game-theoretic value for a player to move enum implementation.
+    """
+
+    WIN = 'win'
+    TIE = 'tie'
+    LOSS = 'loss'
+
+
+class ProfileMode(Enum):
+    """
+    Profile capture's mode enum implementation.
+    """
+
+    CPROFILE = 'cprofile'
+    TRACEMALLOC = 'tracemalloc'
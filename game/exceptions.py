@@ -31,3 +31,129 @@ class ListIsNotPerfectSquareException(Exception):
     """
     List is not a perfect square exception.
     """
+
+
+class BoardsShapeDoesNotMatchSizeException(Exception):
+    """
+    Boards' shape does not match a board's size exception.
+    """
+
+
+class EnginePlayersNumberIsNotSupportedException(Exception):
+    """
+    Engine's players number is not supported exception.
+    """
+
+
+class EngineSearchBudgetExceededException(Exception):
+    """
+    Engine's search budget (nodes or time) exceeded exception.
+    """
+
+
+class PerfectPlayTableBoardIsNotSupportedException(Exception):
+    """
+    Perfect play table's board (its size or players number) is not supported exception.
+    """
+
+
+class PerfectPlayTablePositionIsNotReachableException(Exception):
+    """
+    Perfect play table's position is not reachable exception.
+    """
+
+
+class ListIsNotRectangleException(Exception):
+    """
+    List is not a rectangle exception.
+    """
+
+
+class BoardWinLengthIsInvalidException(Exception):
+    """
+    Board's win length is invalid (does not fit into the board) exception.
+    """
+
+
+class GameIsOverException(Exception):
+    """
+    Game is over exception.
+    """
+
+
+class GamePlayerIsNotToMoveException(Exception):
+    """
+    Game's player is not to move (it is another player's turn) exception.
+    """
+
+
+class SessionPoolSessionDoesNotExistException(Exception):
+    """
+    Session pool's session does not exist exception.
+    """
+
+
+class SessionPoolMarksNumberDoesNotMatchException(Exception):
+    """
+    Session pool's session marks number does not match the pool's players number exception.
+    """
+
+
+class BoardMoveToUndoDoesNotExistException(Exception):
+    """
+    Board's move to undo does not exist exception.
+    """
+
+
+class BoardMoveToRedoDoesNotExistException(Exception):
+    """
+    Board's move to redo does not exist exception.
+    """
+
+
+class GameRecordIsInvalidException(Exception):
+    """
+    Game's record is invalid (corrupted or truncated) exception.
+    """
+
+
+class GameRecordsArchiveIsInvalidException(Exception):
+    """
+    Game records' archive is invalid (not an archive or of an unsupported version) exception.
+    """
+
+
+class EvaluationCacheCapacityIsInvalidException(Exception):
+    """
+    Evaluation cache's capacity is invalid (less than 1 entry) exception.
+    """
+
+
+class EvaluationCacheFileIsInvalidException(Exception):
+    """
+    Evaluation cache's file is invalid (not a cache's file, of an unsupported version or truncated) exception.
+    """
+
+
+class TablebaseBoardIsNotSupportedException(Exception):
+    """
+    Tablebase's board is not supported (too many cells, not the tablebase's shape or not two players) exception.
+    """
+
+
+class TablebasePositionIsNotReachableException(Exception):
+    """
+    Tablebase's position is not reachable exception.
+    """
+
+
+class TablebaseFileIsInvalidException(Exception):
+    """
+    Tablebase's file is invalid (not a tablebase or of an unsupported version) exception.
+    """
+
+
+class WorkersNumberIsInvalidException(Exception):
+    """
+    Worker processes' number is invalid (less than 1) exception.
+    """
@@ -1,38 +1,159 @@
 """
 Provide implementation of the game.
 """
+import argparse
+import contextlib
+import json
 import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import (
+    Optional,
+    TextIO,
+)
 
 from game.board import Board
-from game.dto import Player
+from game.cache import EvaluationCache
+from game.dto import (
+    BoardState,
+    Player,
+)
 from game.enums import (
     BoardCheckResultDecision,
     PlayerMark,
+    ProfileMode,
 )
 from game.exceptions import (
     BoardPositionAlreadyTakenException,
     BoardPositionDoesNotExistException,
+    GameIsOverException,
+    GamePlayerIsNotToMoveException,
 )
+from game.instrumentation import (
+    INSTRUMENTATION,
+    capture_profile,
+)
+from game.negamax import NegamaxEngine
 from game.ui import Ui
 
 
+class GameSession:
+    """
+    Game session implementation.
+
+    It is the game loop's state machine free of any input and output: it takes players' moves in turns and keeps the
+    game's state, so the terminal game, the server and any other front-end drive the same logic.
+    """
+
+    def __init__(self, board: Board, moves_number: int = 0) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            board (Board): a game's board, its players move in their order.
+            moves_number (int): a number of moves already made on the board, e.g. when a saved game is resumed.
+        """
+        self.board = board
+        self.players = board.players
+        self.moves_number = moves_number
+        self.state = board.check()
+
+    @property
+    def current_player(self) -> Player:
+        """
+        Get a player to move.
+
+        Returns:
+            The player as a `Player`.
+        """
+        return self.players[self.moves_number % len(self.players)]
+
+    @property
+    def is_over(self) -> bool:
+        """
+        Check if the game is over.
+
+        Returns:
+            True, if the game has ended with a win or a tie.
+            Otherwise, False.
+        """
+        return self.state.decision != BoardCheckResultDecision.CONTINUE
+
+    def play(self, player: Player, position: int) -> BoardState:
+        """
+        Make a player's move.
+
+        Arguments:
+            player (Player): a player to move.
+            position (int): a human-readable position meaning first position would be 1.
+
+        Raises:
+            GameIsOverException: if the game is over.
+            GamePlayerIsNotToMoveException: if it is another player's turn.
+
+        Returns:
+            The game's state after the move as a `BoardState`.
+        """
+        if self.is_over:
+            raise GameIsOverException
+
+        if player != self.current_player:
+            raise GamePlayerIsNotToMoveException
+
+        self.board.mark(player=player, position=position)
+        self.moves_number += 1
+        self.state = self.board.check()
+
+        return self.state
+
+    @staticmethod
+    def parse_position(text: str) -> int:
+        """
+        Parse a position entered by a player.
+
+        Arguments:
+            text (str): a position as a player has entered it.
+
+        Raises:
+            BoardPositionDoesNotExistException: if the text is not a position's number.
+
+        Returns:
+            A human-readable position meaning first position would be 1.
+        """
+        text = text.strip()
+
+        if not (text.isascii() and text.isdigit()):
+            raise BoardPositionDoesNotExistException
+
+        return int(text)
+
+
 class Game:
     """
     The game implementation.
+
+    It drives a game's session with players' input and shows it in a terminal.
     """
 
     CONTINUE = True
     POSITION_IS_VALID = False
     SYSTEM_EXIT_STATUS = 1
 
-    def __init__(self) -> None:
+    def __init__(self, board_class: type = Board, engines: Optional[dict] = None) -> None:
         """
         Construct the object.
+
+        Arguments:
+            board_class (type): a board's implementation class, e.g. `Board` or `BitBoard`.
+            engines (dict): computer players' engines (e.g. `NegamaxEngine`) by players' marks, players without an
+                engine enter positions themselves.
         """
         self.player_x = Player(mark=PlayerMark.CLASSIC_X)
         self.player_y = Player(mark=PlayerMark.CLASSIC_Y)
+        self.engines = engines or {}
 
-        self.board = Board(players=[self.player_x, self.player_y])
+        self.board = board_class(players=[self.player_x, self.player_y])
+        self.session = GameSession(board=self.board)
         self.ui = Ui(board=self.board)
 
     def start(self) -> None:
@@ -43,36 +164,14 @@ class Game:
         self.ui.show_how_to_play()
         self.ui.show_current_board()
 
-        current_player = self.player_x
-
         while Game.CONTINUE:
-            while not self.POSITION_IS_VALID:
-                position = input(f'Player {current_player.mark.value}, enter a position: ')
-
-                if not position.isdigit():
-                    self.ui.show_position_is_invalid()
-                    continue
-
-                position = int(position)
+            current_player = self.session.current_player
+            self._make_move(player=current_player)
 
-                try:
-                    self.board.mark(player=current_player, position=position)
-
-                except BoardPositionDoesNotExistException:
-                    self.ui.show_position_is_invalid()
-                    continue
-
-                except BoardPositionAlreadyTakenException:
-                    self.ui.show_position_is_invalid()
-                    continue
-
-                break
-
-            board_state = self.board.check()
+            board_state = self.session.state
             self.ui.show_current_board()
 
             if board_state.decision == BoardCheckResultDecision.CONTINUE:
-                current_player = self.player_y if current_player == self.player_x else self.player_x
                 continue
 
             if board_state.decision == BoardCheckResultDecision.TIE:
@@ -83,7 +182,204 @@ class Game:
                 self.ui.show_win_result(player=current_player)
                 sys.exit(Game.SYSTEM_EXIT_STATUS)
 
+    def _make_move(self, player: Player) -> None:
+        """
+        Make a move of a player: by the player's engine or entered by a human.
+
+        It is called once per the game loop's iteration, so it is a hook to instrument the loop.
+
+        Arguments:
+            player (Player): a player to move.
+        """
+        engine = self.engines.get(player.mark)
+
+        if engine is None:
+            self._make_human_move(player=player)
+            return
+
+        position = engine.get_move(board=self.board, player=player)
+        self.session.play(player=player, position=position)
+
+    def _make_human_move(self, player: Player) -> None:
+        """
+        Make a move of a human player entering a position until it is valid.
+
+        Arguments:
+            player (Player): a player to move.
+        """
+        while not self.POSITION_IS_VALID:
+            text = self.ui.ask_position(player=player)
+
+            try:
+                self.session.play(player=player, position=GameSession.parse_position(text=text))
+
+            except BoardPositionDoesNotExistException:
+                self.ui.show_position_is_invalid()
+                continue
+
+            except BoardPositionAlreadyTakenException:
+                self.ui.show_position_is_invalid()
+                continue
+
+            break
+
+
+class GameBatch:
+    """
+    The game's batch mode implementation.
+
+    It plays games' move sequences through game sessions without rendering, one game per line of positions separated
+    by spaces or commas, and writes a result line per game: a decision, a winner's mark (`-` if none), a number of
+    moves made and a number of invalid moves (positions that do not exist or are taken, and moves after the game is
+    over), e.g. `win x 5 0`. Invalid moves are skipped, so it is still the same player's turn, as in the terminal game.
+    Blank lines are skipped too, they are not games. Result lines are written in blocks, not a write per game.
+    """
+
+    NO_WINNER = '-'
+    WRITE_BLOCK_LINES = 10_000
+
+    INVALID_MOVE_EXCEPTIONS = (
+        BoardPositionAlreadyTakenException,
+        BoardPositionDoesNotExistException,
+    )
+
+    def __init__(self, board_class: type = Board) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            board_class (type): a board's implementation class, e.g. `Board` or `BitBoard`.
+        """
+        self.board_class = board_class
+        self.players = [Player(mark=PlayerMark.CLASSIC_X), Player(mark=PlayerMark.CLASSIC_Y)]
+
+    def play(self, lines: Iterable[str], output: TextIO) -> int:
+        """
+        Play games and write their results.
+
+        Arguments:
+            lines (Iterable): games' move sequences, a game per line, e.g. a file or the standard input.
+            output (TextIO): a stream to write results to.
+
+        Returns:
+            A number of games played as an integer.
+        """
+        results = []
+        games_number = 0
+
+        for line in lines:
+            if not line.strip():
+                continue
+
+            results.append(self.play_game(line=line))
+            games_number += 1
+
+            if len(results) == self.WRITE_BLOCK_LINES:
+                output.write('\n'.join(results) + '\n')
+                results.clear()
+
+        if results:
+            output.write('\n'.join(results) + '\n')
+
+        output.flush()
+
+        return games_number
+
+    def play_game(self, line: str) -> str:
+        """
+        Play a game's move sequence.
+
+        Arguments:
+            line (str): positions of the game's moves separated by spaces or commas.
+
+        Returns:
+            The game's result line as a string, without a line break.
+        """
+        session = GameSession(board=self.board_class(players=self.players))
+        invalid_moves_number = 0
+
+        texts = line.replace(',', ' ').split()
+
+        for index, text in enumerate(texts):
+            if session.is_over:
+                invalid_moves_number += len(texts) - index
+                break
+
+            try:
+                session.play(player=session.current_player, position=GameSession.parse_position(text=text))
+
+            except self.INVALID_MOVE_EXCEPTIONS:
+                invalid_moves_number += 1
+
+        state = session.state
+        winner = self.NO_WINNER if state.winning_player is None else state.winning_player.mark.value
+
+        return f'{state.decision.value} {winner} {session.moves_number} {invalid_moves_number}'
+
 
 if __name__ == '__main__':
-    game = Game()
-    game.start()
+    parser = argparse.ArgumentParser(description='Play tic-tac-toe in a terminal.')
+    parser.add_argument(
+        '--computer',
+        action='store_true',
+        help=f'play against a computer player taking the «{PlayerMark.CLASSIC_Y.value}» mark',
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help="count calls, exceptions and latencies of the game's hot paths and print them when the game ends",
+    )
+    parser.add_argument(
+        '--profile',
+        choices=[mode.value for mode in ProfileMode],
+        help='capture a profile of the game and print it when the game ends',
+    )
+    parser.add_argument('--profile-output', type=Path, help='a path to dump the profile to instead of printing it')
+    parser.add_argument(
+        '--batch',
+        type=argparse.FileType(encoding='utf-8'),
+        help="play games' move sequences from a file (`-` for the standard input), a game per line, without rendering",
+    )
+    parser.add_argument(
+        '--cache',
+        type=Path,
+        help="a path to the computer player's evaluation cache, loaded if it exists and saved when the game ends, "
+        'used with `--computer` only',
+    )
+    arguments = parser.parse_args()
+
+    if arguments.batch:
+        GameBatch().play(lines=arguments.batch, output=sys.stdout)
+        sys.exit()
+
+    cache = None
+    engines = None
+
+    if arguments.computer:
+        cache = EvaluationCache()
+
+        if arguments.cache is not None and arguments.cache.exists():
+            cache.load(path=arguments.cache)
+
+        engines = {PlayerMark.CLASSIC_Y: NegamaxEngine(max_time=1.0, cache=cache)}
+
+    game = Game(engines=engines)
+
+    if arguments.stats:
+        INSTRUMENTATION.enable()
+
+    profile = contextlib.nullcontext()
+
+    if arguments.profile:
+        profile = capture_profile(mode=ProfileMode(arguments.profile), output=arguments.profile_output)
+
+    try:
+        with profile:
+            game.start()
+
+    finally:
+        if cache is not None and arguments.cache is not None:
+            cache.save(path=arguments.cache)
+
+        if arguments.stats:
+            print(json.dumps(INSTRUMENTATION.snapshot(), indent=2), file=sys.stderr)
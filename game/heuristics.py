@@ -0,0 +1,119 @@
+"""
+Provide implementation of the game's heuristic evaluation of positions on large boards.
+
+Patterns are read from numbers of open lines and threats' cells kept by a board (see `Board.get_open_lines_numbers`
+and `Board.get_threats_cells`), so a position is evaluated in O(players * win length) plus the threats' cells, however
+big a board is and however many lines it has.
+"""
+from game.board import Board
+from game.dto import (
+    LinesPatterns,
+    Player,
+)
+from game.enums import BoardCheckResultDecision
+
+OPEN_TWO_MARKS_NUMBER = 2
+OPEN_THREE_MARKS_NUMBER = 3
+
+OPEN_TWO_SCORE = 10
+OPEN_THREE_SCORE = 100
+THREAT_SCORE = 1_000
+DOUBLE_THREAT_SCORE = 100_000
+WIN_SCORE = 1_000_000
+
+
+def get_lines_patterns(board: Board, player: Player) -> LinesPatterns:
+    """
+    Get a player's lines patterns on a board.
+
+    Arguments:
+        board (Board): a game's board.
+        player (Player): a player as a `Player`.
+
+    Returns:
+        The player's patterns as a `LinesPatterns`.
+    """
+    open_lines_numbers = board.get_open_lines_numbers(player=player)
+
+    return LinesPatterns(
+        open_twos=_get_open_lines_number(open_lines_numbers=open_lines_numbers, marks_number=OPEN_TWO_MARKS_NUMBER),
+        open_threes=_get_open_lines_number(open_lines_numbers=open_lines_numbers, marks_number=OPEN_THREE_MARKS_NUMBER),
+        threats=_get_open_lines_number(open_lines_numbers=open_lines_numbers, marks_number=board.win_length - 1),
+        threats_cells=len(board.get_threats_cells(player=player)),
+    )
+
+
+def evaluate(board: Board, player: Player) -> int:
+    """
+    Evaluate a board's position for a player heuristically.
+
+    A finished game is a win, a loss or a tie. Otherwise, each player's patterns are scored, double threats the most,
+    and the position's value is the player's score less the strongest opponent's one.
+
+    Arguments:
+        board (Board): a game's board.
+        player (Player): a player to evaluate the position for.
+
+    Returns:
+        The position's value for the player, positive if the player is better off.
+    """
+    state = board.check()
+
+    if state.decision == BoardCheckResultDecision.WIN:
+        return WIN_SCORE if state.winning_player == player else -WIN_SCORE
+
+    if state.decision == BoardCheckResultDecision.TIE:
+        return 0
+
+    opponents_scores = [
+        _score(patterns=get_lines_patterns(board=board, player=opponent), win_length=board.win_length)
+        for opponent in board.players
+        if opponent != player
+    ]
+    score = _score(patterns=get_lines_patterns(board=board, player=player), win_length=board.win_length)
+
+    return score - max(opponents_scores, default=0)
+
+
+def _get_open_lines_number(open_lines_numbers: list[int], marks_number: int) -> int:
+    """
+    Get a number of open lines holding a number of marks.
+
+    Arguments:
+        open_lines_numbers (list): numbers of open lines by numbers of marks in them.
+        marks_number (int): a number of marks.
+
+    Returns:
+        The number of open lines as an integer, 0 if lines cannot hold the number of marks.
+    """
+    if not 0 < marks_number < len(open_lines_numbers):
+        return 0
+
+    return open_lines_numbers[marks_number]
+
+
+def _score(patterns: LinesPatterns, win_length: int) -> int:
+    """
+    Score a player's lines patterns.
+
+    Open twos (or threes) a mark short of a win are the threats' lines, so they are scored as threats only.
+
+    Arguments:
+        patterns (LinesPatterns): the player's patterns.
+        win_length (int): a number of marks in a row needed to win.
+
+    Returns:
+        The score as an integer.
+    """
+    score = patterns.threats * THREAT_SCORE
+
+    if win_length - 1 != OPEN_TWO_MARKS_NUMBER:
+        score += patterns.open_twos * OPEN_TWO_SCORE
+
+    if win_length - 1 != OPEN_THREE_MARKS_NUMBER:
+        score += patterns.open_threes * OPEN_THREE_SCORE
+
+    if patterns.is_double_threat:
+        score += DOUBLE_THREAT_SCORE
+
+    return score
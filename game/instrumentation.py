@@ -0,0 +1,320 @@
+"""
+Provide implementation of the game's instrumentation: hot paths' counters, latency histograms and profile capture.
+
+Usage:
+    INSTRUMENTATION.enable()
+    ...
+    INSTRUMENTATION.snapshot()
+"""
+import contextlib
+import cProfile
+import functools
+import importlib
+import importlib.util
+import io
+import pstats
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import (
+    Callable,
+    Iterator,
+)
+from pathlib import Path
+from typing import Optional
+
+from game.enums import ProfileMode
+
+TARGETS = {
+    'board.mark': 'game.board:Board.mark',
+    'board.check': 'game.board:Board.check',
+    'game.move': 'game.game_:Game._make_move',
+}
+
+HISTOGRAM_BUCKETS_NUMBER = 64
+PERCENTILES = (50, 90, 99)
+PROFILE_TOP_ENTRIES_NUMBER = 20
+
+
+class Histogram:
+    """
+    Latency histogram implementation.
+
+    Latencies are counted in power-of-two buckets of nanoseconds, so adding a latency is a couple of integer operations
+    and the histogram's memory is fixed, while percentiles are precise up to a factor of two.
+    """
+
+    __slots__ = ('buckets', 'count', 'total', 'minimum', 'maximum')
+
+    def __init__(self) -> None:
+        """
+        Construct the object.
+        """
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Remove all latencies.
+        """
+        self.buckets = [0] * HISTOGRAM_BUCKETS_NUMBER
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, latency: int) -> None:
+        """
+        Add a latency.
+
+        Arguments:
+            latency (int): a latency in nanoseconds.
+        """
+        self.buckets[min(latency.bit_length(), HISTOGRAM_BUCKETS_NUMBER - 1)] += 1
+        self.count += 1
+        self.total += latency
+
+        if self.minimum is None or latency < self.minimum:
+            self.minimum = latency
+
+        if self.maximum is None or latency > self.maximum:
+            self.maximum = latency
+
+    def get_percentile(self, percentile: int) -> Optional[int]:
+        """
+        Get a latency's percentile.
+
+        Arguments:
+            percentile (int): a percentile from 0 to 100.
+
+        Returns:
+            An upper bound of the percentile's bucket in nanoseconds (not greater than the maximum latency), `None` if
+            there are no latencies.
+        """
+        if not self.count:
+            return None
+
+        rank, cumulative_count = self.count * percentile / 100, 0
+
+        for index, bucket_count in enumerate(self.buckets):
+            cumulative_count += bucket_count
+
+            if cumulative_count >= rank:
+                return min((1 << index) - 1, self.maximum)
+
+        return self.maximum
+
+    def snapshot(self) -> dict:
+        """
+        Get the histogram's statistics.
+
+        Returns:
+            A count, total, mean, minimum, maximum and percentiles of latencies in nanoseconds and non-empty buckets by
+            their upper bounds as a dictionary.
+        """
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.minimum,
+            'max': self.maximum,
+            **{f'p{percentile}': self.get_percentile(percentile=percentile) for percentile in PERCENTILES},
+            'buckets': {(1 << index) - 1: count for index, count in enumerate(self.buckets) if count},
+        }
+
+
+class Instrumentation:
+    """
+    Instrumentation implementation.
+
+    When enabled, it replaces methods of the targets (`module:Class.method` import paths by metrics' names) with
+    wrappers counting calls, exceptions raised by a class of an exception (e.g.
+    `board.mark.BoardPositionAlreadyTakenException`) and latencies. When disabled, the original methods are restored, so
+    there is no overhead at all, and it can be switched at any moment of a running game.
+    """
+
+    def __init__(self, targets: Optional[dict] = None) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            targets (dict): methods to instrument as `module:Class.method` import paths by metrics' names, `TARGETS` if
+                not specified.
+        """
+        self.targets = TARGETS if targets is None else targets
+        self.counters = Counter()
+        self.histograms = {name: Histogram() for name in self.targets}
+
+        self._original_methods = {}
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        Check if the instrumentation is enabled.
+
+        Returns:
+            True, if the targets are instrumented.
+            Otherwise, False.
+        """
+        return bool(self._original_methods)
+
+    def enable(self) -> None:
+        """
+        Enable the instrumentation: replace the targets' methods with instrumented wrappers.
+        """
+        if self.is_enabled:
+            return
+
+        for name, path in self.targets.items():
+            owner, method_name = self._resolve(path=path)
+            method = owner.__dict__[method_name]
+
+            self._original_methods[name] = (owner, method_name, method)
+            setattr(owner, method_name, self._wrap(name=name, method=method))
+
+    def disable(self) -> None:
+        """
+        Disable the instrumentation: restore the targets' original methods, the collected stats are kept.
+        """
+        for owner, method_name, method in self._original_methods.values():
+            setattr(owner, method_name, method)
+
+        self._original_methods = {}
+
+    def reset(self) -> None:
+        """
+        Reset the collected stats.
+        """
+        self.counters.clear()
+
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def snapshot(self) -> dict:
+        """
+        Get the collected stats.
+
+        Returns:
+            Whether the instrumentation is enabled, counters by names and histograms' statistics by names as a
+            dictionary.
+        """
+        return {
+            'enabled': self.is_enabled,
+            'counters': dict(self.counters),
+            'histograms': {name: histogram.snapshot() for name, histogram in self.histograms.items()},
+        }
+
+    def _wrap(self, name: str, method: Callable) -> Callable:
+        """
+        Wrap a method to count its calls, exceptions and latencies.
+
+        Arguments:
+            name (str): a metric's name.
+            method (Callable): a method to wrap.
+
+        Returns:
+            The wrapper as a function.
+        """
+        counters, histogram = self.counters, self.histograms[name]
+
+        @functools.wraps(method)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            started_at = time.perf_counter_ns()
+
+            try:
+                return method(*args, **kwargs)
+
+            except Exception as exception:
+                counters[f'{name}.{type(exception).__name__}'] += 1
+                raise
+
+            finally:
+                counters[name] += 1
+                histogram.add(time.perf_counter_ns() - started_at)
+
+        return wrapper
+
+    def _resolve(self, path: str) -> tuple[type, str]:
+        """
+        Resolve a method's import path.
+
+        A module run as a script (e.g. the game itself) is resolved to the running `__main__` module rather than
+        imported once again, so its classes are the ones instrumented.
+
+        Arguments:
+            path (str): a method's import path as `module:Class.method`.
+
+        Returns:
+            The method's class and name as a tuple.
+        """
+        module_name, _, qualified_name = path.partition(':')
+        class_name, _, method_name = qualified_name.rpartition('.')
+
+        main_module = sys.modules['__main__']
+        main_module_file = getattr(main_module, '__file__', None)
+        module_file = importlib.util.find_spec(module_name).origin
+
+        if main_module_file is not None and Path(main_module_file).resolve() == Path(module_file).resolve():
+            module = main_module
+
+        else:
+            module = importlib.import_module(module_name)
+
+        return getattr(module, class_name), method_name
+
+
+INSTRUMENTATION = Instrumentation()
+
+
+@contextlib.contextmanager
+def capture_profile(mode: ProfileMode, output: Optional[Path] = None) -> Iterator[None]:
+    """
+    Capture a profile of a block of code, e.g. a single game.
+
+    With `cProfile`, time spent by each function is captured: the statistics are dumped to an output file (to be read
+    with `pstats` or `snakeviz`) or the top entries by cumulative time are printed to the standard error. With
+    `tracemalloc`, memory allocated by each line is captured: the snapshot is dumped to an output file or the top lines
+    are printed. The profile is finished even if the block exits, as the game does when it ends.
+
+    Arguments:
+        mode (ProfileMode): a profiler to capture with.
+        output (Path): a path to dump the profile to, printed if not specified.
+
+    Yields:
+        Nothing, the profile is captured while the block runs.
+    """
+    if mode == ProfileMode.CPROFILE:
+        profile = cProfile.Profile()
+        profile.enable()
+
+        try:
+            yield
+
+        finally:
+            profile.disable()
+
+            if output is not None:
+                profile.dump_stats(output)
+
+            else:
+                stream = io.StringIO()
+                pstats.Stats(profile, stream=stream).sort_stats('cumulative').print_stats(PROFILE_TOP_ENTRIES_NUMBER)
+                print(stream.getvalue(), file=sys.stderr)
+
+        return
+
+    tracemalloc.start()
+
+    try:
+        yield
+
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        if output is not None:
+            snapshot.dump(str(output))
+
+        else:
+            for statistic in snapshot.statistics('lineno')[:PROFILE_TOP_ENTRIES_NUMBER]:
+                print(statistic, file=sys.stderr)
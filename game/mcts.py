@@ -0,0 +1,370 @@
+"""
+Provide implementation of the game's Monte Carlo tree search engine.
+"""
+import math
+import random
+import time
+from typing import Optional
+
+from game.board import Board
+from game.dto import (
+    Player,
+    PlayoutStats,
+)
+from game.enums import BoardCheckResultDecision
+from game.utils import (
+    get_cells_winning_lines,
+    get_winning_lines,
+)
+
+
+class MctsNode:
+    """
+    Monte Carlo search tree's node implementation.
+    """
+
+    __slots__ = ('position', 'side', 'parent', 'children', 'untried_index', 'visits', 'reward', 'winner')
+
+    def __init__(self, position: Optional[int], side: int, parent: Optional['MctsNode']) -> None:
+        """
+        Construct the object.
+
+        A winner is an index of a winning player or `MctsEngine.TIE` if the move has ended the game, `None` otherwise.
+        Moves not expanded yet are not stored: they are empty cells of the engine's shared order of positions from the
+        untried index on, so a node takes constant memory whatever a board's size is.
+
+        Arguments:
+            position (int): a position of a move leading to the node, the first position is 0.
+            side (int): an index of a player made the move.
+            parent (MctsNode): a parent node, `None` for a root node.
+        """
+        self.position = position
+        self.side = side
+        self.parent = parent
+        self.children = {}
+        self.untried_index = 0
+        self.visits = 0
+        self.reward = 0.0
+        self.winner = None
+
+
+class MctsEngine:
+    """
+    Monte Carlo tree search engine implementation.
+
+    It is a computer player for boards of any size and any number of players, for which an exhaustive search is
+    hopeless. Until a per-move deadline, it runs playouts: it selects moves down a search tree with the UCT formula,
+    expands a node and plays random moves to the end of the game, rewarding a winning player (or every player with a
+    share of a tie). The most visited move is returned.
+
+    The search tree is kept between moves: a subtree of moves made since the previous call becomes a new root, so
+    playouts are not lost. Playouts do not copy a board: the engine marks its own cells and marks numbers per line
+    and unmarks them back after each playout.
+    """
+
+    EMPTY_CELL = -1
+    TIE = -1
+
+    EXPLORATION = math.sqrt(2)
+
+    PLAYOUTS_BETWEEN_TIME_CHECKS = 16
+
+    def __init__(self, deadline: int = 1000, exploration: float = EXPLORATION, seed: Optional[int] = None) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            deadline (int): time to search per move in milliseconds.
+            exploration (float): an exploration constant of the UCT formula.
+            seed (int): a seed of random moves, random if `None`.
+        """
+        self.deadline = deadline
+        self.exploration = exploration
+
+        self._random = random.Random(seed)
+        self._root = None
+        self._root_cells = None
+        self._order = None
+
+        self.stats = PlayoutStats()
+
+    def get_move(self, board: Board, player: Player) -> Optional[int]:
+        """
+        Get the best move of a player on a board.
+
+        Arguments:
+            board (Board): a game's board.
+            player (Player): a player to move.
+
+        Returns:
+            A human-readable position meaning first position would be 1, `None` if the game is over.
+        """
+        if board.check().decision != BoardCheckResultDecision.CONTINUE:
+            return None
+
+        started_at = time.perf_counter()
+        deadline = started_at + self.deadline / 1000
+
+        self._set_up(board=board)
+        root = self._get_root(side=board.players.index(player))
+
+        self.stats = PlayoutStats(reused_playouts=root.visits)
+
+        while True:
+            self._playout(root=root)
+            self.stats.playouts += 1
+
+            is_time_to_check = self.stats.playouts % self.PLAYOUTS_BETWEEN_TIME_CHECKS == 0
+
+            if is_time_to_check and time.perf_counter() >= deadline:
+                break
+
+        self.stats.time = time.perf_counter() - started_at
+
+        best_child = max(root.children.values(), key=lambda child: child.visits)
+
+        return best_child.position + 1
+
+    def _set_up(self, board: Board) -> None:
+        """
+        Set up the engine's position from a board.
+
+        Arguments:
+            board (Board): a game's board.
+        """
+        self._win_length = board.win_length
+        self._players_number = board.players_number
+        self._cells_lines = get_cells_winning_lines(
+            size=board.size,
+            height=board.height,
+            win_length=board.win_length,
+        )
+
+        marks_sides = {player.mark: index for index, player in enumerate(board.players)}
+        self._cells = [marks_sides.get(cell, self.EMPTY_CELL) for cell in board.get()]
+
+        self._empty_positions = []
+        self._empty_positions_indexes = [0] * len(self._cells)
+
+        for position, side in enumerate(self._cells):
+            if side == self.EMPTY_CELL:
+                self._empty_positions_indexes[position] = len(self._empty_positions)
+                self._empty_positions.append(position)
+
+        winning_lines = get_winning_lines(size=board.size, height=board.height, win_length=board.win_length)
+        self._lines_marks_numbers = [0] * len(winning_lines) * self._players_number
+
+        for position, side in enumerate(self._cells):
+            if side != self.EMPTY_CELL:
+                for line in self._cells_lines[position]:
+                    self._lines_marks_numbers[line * self._players_number + side] += 1
+
+        self._moves = []
+
+    def _get_root(self, side: int) -> MctsNode:
+        """
+        Get a search tree's root for a position.
+
+        If the position is reachable from the previous root by moves already expanded in the tree, the subtree is
+        reused. Moves made since the previous call are matched in the players' order, as each player moves once.
+
+        Arguments:
+            side (int): an index of a player to move.
+
+        Returns:
+            The root as a `MctsNode`.
+        """
+        root = self._root
+
+        if root is not None and len(self._root_cells) == len(self._cells):
+            changed_positions = [
+                position
+                for position, (previous_side, side_) in enumerate(zip(self._root_cells, self._cells, strict=True))
+                if previous_side != side_
+            ]
+            new_moves = {self._cells[position]: position for position in changed_positions}
+
+            if len(new_moves) != len(changed_positions):
+                root = None
+
+            while root is not None and new_moves:
+                next_side = (root.side + 1) % self._players_number
+                root = root.children.get(new_moves.pop(next_side, None))
+
+            if root is not None and (root.side + 1) % self._players_number != side:
+                root = None
+
+        if root is None:
+            self._order = list(range(len(self._cells)))
+            self._random.shuffle(self._order)
+
+            previous_side = (side - 1) % self._players_number
+            root = MctsNode(position=None, side=previous_side, parent=None)
+
+        root.parent = None
+
+        self._root = root
+        self._root_cells = list(self._cells)
+
+        return root
+
+    def _playout(self, root: MctsNode) -> None:
+        """
+        Run a single playout from a root: select, expand, roll out and back propagate.
+
+        Arguments:
+            root (MctsNode): a search tree's root.
+        """
+        node = root
+
+        while node.winner is None and self._get_untried_position(node=node) is None and node.children:
+            node = self._select_child(node=node)
+            self._make(position=node.position, side=node.side)
+
+        position = None if node.winner is not None else self._get_untried_position(node=node)
+
+        if position is not None:
+            node.untried_index += 1
+
+            side = (node.side + 1) % self._players_number
+            winner = self._make(position=position, side=side)
+
+            child = MctsNode(position=position, side=side, parent=node)
+            child.winner = winner
+            node.children[position] = child
+            node = child
+
+        winner = node.winner
+
+        if winner is None:
+            winner = self._roll_out(side=(node.side + 1) % self._players_number)
+
+        self._unmake_all()
+
+        tie_reward = 1 / self._players_number
+
+        while node is not None:
+            node.visits += 1
+
+            if winner == self.TIE:
+                node.reward += tie_reward
+
+            elif winner == node.side:
+                node.reward += 1
+
+            node = node.parent
+
+    def _get_untried_position(self, node: MctsNode) -> Optional[int]:
+        """
+        Get a node's next move not expanded yet, the engine's cells have to be the node's position.
+
+        The node's untried index is moved past cells of the shared order which are not empty in the node's position.
+
+        Arguments:
+            node (MctsNode): a node.
+
+        Returns:
+            The move's position, `None` if all the node's moves are expanded.
+        """
+        order, cells = self._order, self._cells
+        index = node.untried_index
+
+        while index < len(order) and cells[order[index]] != self.EMPTY_CELL:
+            index += 1
+
+        node.untried_index = index
+
+        if index == len(order):
+            return None
+
+        return order[index]
+
+    def _select_child(self, node: MctsNode) -> MctsNode:
+        """
+        Select a node's child with the UCT formula.
+
+        Arguments:
+            node (MctsNode): a node with all moves expanded.
+
+        Returns:
+            The child as a `MctsNode`.
+        """
+        log_visits = math.log(node.visits)
+        best_child, best_score = None, -1.0
+
+        for child in node.children.values():
+            score = child.reward / child.visits + self.exploration * math.sqrt(log_visits / child.visits)
+
+            if score > best_score:
+                best_child, best_score = child, score
+
+        return best_child
+
+    def _roll_out(self, side: int) -> int:
+        """
+        Play random moves to the end of the game.
+
+        Arguments:
+            side (int): an index of a player to move.
+
+        Returns:
+            An index of a winning player or `TIE`.
+        """
+        while True:
+            empty_positions = self._empty_positions
+            position = empty_positions[int(self._random.random() * len(empty_positions))]
+            winner = self._make(position=position, side=side)
+
+            if winner is not None:
+                return winner
+
+            side = (side + 1) % self._players_number
+
+    def _make(self, position: int, side: int) -> Optional[int]:
+        """
+        Mark a cell by a player.
+
+        Arguments:
+            position (int): a cell's position, the first position is 0.
+            side (int): an index of a player.
+
+        Returns:
+            An index of a winning player or `TIE` if the move ends the game, `None` otherwise.
+        """
+        self._cells[position] = side
+        self._moves.append(position)
+
+        empty_positions, empty_positions_indexes = self._empty_positions, self._empty_positions_indexes
+        index, last_position = empty_positions_indexes[position], empty_positions[-1]
+        empty_positions[index] = last_position
+        empty_positions_indexes[last_position] = index
+        empty_positions.pop()
+
+        winner = None
+
+        for line in self._cells_lines[position]:
+            line_index = line * self._players_number + side
+            self._lines_marks_numbers[line_index] += 1
+
+            if self._lines_marks_numbers[line_index] == self._win_length:
+                winner = side
+
+        if winner is None and not empty_positions:
+            winner = self.TIE
+
+        return winner
+
+    def _unmake_all(self) -> None:
+        """
+        Unmark all cells marked since the search's position.
+        """
+        while self._moves:
+            position = self._moves.pop()
+            side = self._cells[position]
+
+            self._cells[position] = self.EMPTY_CELL
+            self._empty_positions_indexes[position] = len(self._empty_positions)
+            self._empty_positions.append(position)
+
+            for line in self._cells_lines[position]:
+                self._lines_marks_numbers[line * self._players_number + side] -= 1
@@ -0,0 +1,460 @@
+"""
+Provide implementation of the game's negamax engine.
+"""
+import random
+import time
+from typing import Optional
+
+from game.board import Board
+from game.cache import EvaluationCache
+from game.dto import (
+    Player,
+    SearchStats,
+)
+from game.enums import BoardCheckResultDecision
+from game.exceptions import (
+    EnginePlayersNumberIsNotSupportedException,
+    EngineSearchBudgetExceededException,
+)
+from game.utils import (
+    get_cells_winning_lines,
+    get_winning_lines,
+    get_zobrist_side_keys,
+    get_zobrist_table,
+)
+
+
+class NegamaxEngine:
+    """
+    Negamax engine implementation.
+
+    It is a computer player searching for the best move with negamax and alpha-beta pruning. Positions are searched
+    with iterative deepening, so when a node or time budget is exceeded, the best move of the deepest completed search
+    is returned. Searched positions are stored in a transposition table (an `EvaluationCache`, which can be shared by
+    engines and persisted) keyed by a position's Zobrist key and a player to move, and moves are ordered by the
+    table's best move first, then by a number of winning lines going through a cell. Among root moves of the same best
+    value, the first one is returned, or a random one if the engine is seeded, so seeded engines play different games.
+
+    The engine does not copy a board: it keeps its own cells, marks numbers per line and a position's key, marking and
+    unmarking them while searching.
+    """
+
+    EMPTY_CELL = 0
+    PLAYERS_NUMBER = 2
+
+    WIN_SCORE = 1_000_000
+    WIN_THRESHOLD = WIN_SCORE // 2
+
+    EXACT = 0
+    LOWER_BOUND = 1
+    UPPER_BOUND = 2
+
+    NODES_BETWEEN_TIME_CHECKS = 1024
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_nodes: Optional[int] = None,
+        max_time: Optional[float] = None,
+        transposition_table_size: int = 1_000_000,
+        cache: Optional[EvaluationCache] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            max_nodes (int): a maximum number of nodes to search per move, unlimited if `None`.
+            max_time (float): a maximum time to search per move in seconds, unlimited if `None`.
+            transposition_table_size (int): a maximum number of the transposition table's entries, the least recently
+                used entries are evicted when it is full.
+            cache (EvaluationCache): a transposition table shared with other engines, e.g. loaded from a file, a new
+                one of the transposition table's size if not specified.
+            seed (int): a seed of choosing among moves of the same best value, the first move is chosen if `None`.
+        """
+        self.max_nodes = max_nodes
+        self.max_time = max_time
+
+        self.cache = EvaluationCache(capacity=transposition_table_size) if cache is None else cache
+        self._random = None if seed is None else random.Random(seed)
+        self.stats = SearchStats()
+
+    def get_move(self, board: Board, player: Player) -> Optional[int]:
+        """
+        Get the best move of a player on a board.
+
+        Arguments:
+            board (Board): a game's board.
+            player (Player): a player to move.
+
+        Raises:
+            EnginePlayersNumberIsNotSupportedException: if a board has not two players.
+
+        Returns:
+            A human-readable position meaning first position would be 1, `None` if the game is over.
+        """
+        if board.players_number != self.PLAYERS_NUMBER:
+            raise EnginePlayersNumberIsNotSupportedException
+
+        if board.check().decision != BoardCheckResultDecision.CONTINUE:
+            return None
+
+        self._set_up(board=board)
+        self._root_side = board.players.index(player)
+
+        self.stats = SearchStats()
+        started_at = time.perf_counter()
+        self._time_limit = None if self.max_time is None else started_at + self.max_time
+
+        best_position = self._get_ordered_moves(best_position=None)[0]
+
+        for depth in range(1, self._empty_cells_number + 1):
+            self._depth = depth
+
+            try:
+                value, position = self._search_root()
+
+            except EngineSearchBudgetExceededException:
+                break
+
+            best_position = position
+            self.stats.depth = depth
+
+            if abs(value) > self.WIN_THRESHOLD:
+                break
+
+        self.stats.time = time.perf_counter() - started_at
+
+        return best_position + 1
+
+    def _set_up(self, board: Board) -> None:
+        """
+        Set up the engine's position from a board.
+
+        Arguments:
+            board (Board): a game's board.
+        """
+        self._win_length = board.win_length
+        self._cells_lines = get_cells_winning_lines(
+            size=board.size,
+            height=board.height,
+            win_length=board.win_length,
+        )
+        self._static_order = sorted(
+            range(board.board_positions_number),
+            key=lambda position: len(self._cells_lines[position]),
+            reverse=True,
+        )
+
+        marks_codes = {player.mark: index + 1 for index, player in enumerate(board.players)}
+        self._cells = [marks_codes.get(cell, self.EMPTY_CELL) for cell in board.get()]
+        self._empty_cells_number = self._cells.count(self.EMPTY_CELL)
+
+        zobrist_table = get_zobrist_table(cells_number=board.board_positions_number)
+        self._zobrist_table = [zobrist_table[player.mark] for player in board.players]
+        self._side_keys = get_zobrist_side_keys(
+            size=board.size,
+            height=board.height,
+            win_length=board.win_length,
+            players_number=self.PLAYERS_NUMBER,
+        )
+        self._key = 0
+
+        winning_lines = get_winning_lines(size=board.size, height=board.height, win_length=board.win_length)
+        self._lines_marks_numbers = [0] * len(winning_lines) * self.PLAYERS_NUMBER
+
+        for position, code in enumerate(self._cells):
+            if code != self.EMPTY_CELL:
+                self._key ^= self._zobrist_table[code - 1][position]
+
+                for line in self._cells_lines[position]:
+                    self._lines_marks_numbers[line * self.PLAYERS_NUMBER + code - 1] += 1
+
+    def _search_root(self) -> tuple[int, int]:
+        """
+        Search the best move of a root position.
+
+        The root's window is kept one below the best value, so values of moves as good as the best one are exact and
+        all the best moves are known.
+
+        Returns:
+            The best move's value and position as a tuple.
+        """
+        alpha, beta = -self.WIN_SCORE - 1, self.WIN_SCORE + 1
+        best_value, best_positions = -self.WIN_SCORE - 1, []
+
+        _, _, table_position = self._probe(ply=0)
+
+        for position in self._get_ordered_moves(best_position=table_position):
+            value = self._search_move(position=position, ply=0, alpha=alpha, beta=beta)
+
+            if value > best_value:
+                best_value, best_positions = value, [position]
+
+            elif value == best_value:
+                best_positions.append(position)
+
+            alpha = max(alpha, value - 1)
+
+        best_position = best_positions[0] if self._random is None else self._random.choice(best_positions)
+
+        self._store(ply=0, value=best_value, flag=self.EXACT, position=best_position)
+
+        return best_value, best_position
+
+    def _search(self, ply: int, alpha: int, beta: int) -> int:
+        """
+        Search a position with negamax and alpha-beta pruning.
+
+        A player to move and a depth left to search are defined by a number of moves made from the root position.
+
+        Arguments:
+            ply (int): a number of moves made from the root position.
+            alpha (int): a minimum value a player to move is assured of.
+            beta (int): a maximum value an opponent is assured of.
+
+        Returns:
+            The position's value for a player to move.
+        """
+        self._count_node()
+
+        original_alpha = alpha
+        table_value, table_flag, table_position = self._probe(ply=ply)
+
+        if table_flag == self.EXACT:
+            return table_value
+
+        if table_flag == self.LOWER_BOUND:
+            alpha = max(alpha, table_value)
+
+        elif table_flag == self.UPPER_BOUND:
+            beta = min(beta, table_value)
+
+        if alpha >= beta:
+            return table_value
+
+        if ply == self._depth:
+            return self._evaluate(side=self._get_side(ply=ply))
+
+        best_value, best_position = -self.WIN_SCORE - 1, None
+
+        for position in self._get_ordered_moves(best_position=table_position):
+            value = self._search_move(position=position, ply=ply, alpha=alpha, beta=beta)
+
+            if value > best_value:
+                best_value, best_position = value, position
+
+            alpha = max(alpha, value)
+
+            if alpha >= beta:
+                break
+
+        if best_value <= original_alpha:
+            flag = self.UPPER_BOUND
+
+        elif best_value >= beta:
+            flag = self.LOWER_BOUND
+
+        else:
+            flag = self.EXACT
+
+        self._store(ply=ply, value=best_value, flag=flag, position=best_position)
+
+        return best_value
+
+    def _search_move(self, position: int, ply: int, alpha: int, beta: int) -> int:
+        """
+        Search a move: make it, search a position after it and unmake it.
+
+        Arguments:
+            position (int): a move's position, the first position is 0.
+            ply (int): a number of moves made from the root position before the move.
+            alpha (int): a minimum value a player to move is assured of.
+            beta (int): a maximum value an opponent is assured of.
+
+        Returns:
+            The move's value for a player to move.
+        """
+        side = self._get_side(ply=ply)
+        is_won = self._make(position=position, side=side)
+
+        if is_won:
+            value = self.WIN_SCORE - ply - 1
+
+        elif not self._empty_cells_number:
+            value = 0
+
+        else:
+            value = -self._search(ply=ply + 1, alpha=-beta, beta=-alpha)
+
+        self._unmake(position=position, side=side)
+
+        return value
+
+    def _count_node(self) -> None:
+        """
+        Count a searched node and check the search's budget.
+
+        Time is checked once per a number of nodes, as getting it is much slower than searching a node.
+
+        Raises:
+            EngineSearchBudgetExceededException: if a node or time budget is exceeded.
+        """
+        self.stats.nodes += 1
+
+        if self.max_nodes is not None and self.stats.nodes > self.max_nodes:
+            raise EngineSearchBudgetExceededException
+
+        is_time_to_check = self.stats.nodes % self.NODES_BETWEEN_TIME_CHECKS == 0
+
+        if self._time_limit is not None and is_time_to_check and time.perf_counter() > self._time_limit:
+            raise EngineSearchBudgetExceededException
+
+    def _get_side(self, ply: int) -> int:
+        """
+        Get a player to move.
+
+        Arguments:
+            ply (int): a number of moves made from the root position.
+
+        Returns:
+            An index of a player to move.
+        """
+        return (self._root_side + ply) % self.PLAYERS_NUMBER
+
+    def _make(self, position: int, side: int) -> bool:
+        """
+        Mark a cell by a player.
+
+        Arguments:
+            position (int): a cell's position, the first position is 0.
+            side (int): an index of a player.
+
+        Returns:
+            True, if the player has completed any line.
+            Otherwise, False.
+        """
+        self._cells[position] = side + 1
+        self._key ^= self._zobrist_table[side][position]
+        self._empty_cells_number -= 1
+
+        is_won = False
+
+        for line in self._cells_lines[position]:
+            index = line * self.PLAYERS_NUMBER + side
+            self._lines_marks_numbers[index] += 1
+
+            if self._lines_marks_numbers[index] == self._win_length:
+                is_won = True
+
+        return is_won
+
+    def _unmake(self, position: int, side: int) -> None:
+        """
+        Unmark a cell marked by a player.
+
+        Arguments:
+            position (int): a cell's position, the first position is 0.
+            side (int): an index of a player.
+        """
+        self._cells[position] = self.EMPTY_CELL
+        self._key ^= self._zobrist_table[side][position]
+        self._empty_cells_number += 1
+
+        for line in self._cells_lines[position]:
+            self._lines_marks_numbers[line * self.PLAYERS_NUMBER + side] -= 1
+
+    def _evaluate(self, side: int) -> int:
+        """
+        Evaluate a non-terminal position heuristically.
+
+        Each line not blocked by an opponent is worth a square of a number of a player's marks in it.
+
+        Arguments:
+            side (int): an index of a player to move.
+
+        Returns:
+            The position's value for a player to move.
+        """
+        value = 0
+        numbers = self._lines_marks_numbers
+
+        for index in range(0, len(numbers), self.PLAYERS_NUMBER):
+            own_marks_number, opponent_marks_number = numbers[index + side], numbers[index + 1 - side]
+
+            if not opponent_marks_number:
+                value += own_marks_number * own_marks_number
+
+            elif not own_marks_number:
+                value -= opponent_marks_number * opponent_marks_number
+
+        return value
+
+    def _get_ordered_moves(self, best_position: Optional[int]) -> list[int]:
+        """
+        Get empty cells' positions ordered for searching.
+
+        Arguments:
+            best_position (int): the best position known from the transposition table, if any.
+
+        Returns:
+            Positions as a list of integers, the first position is 0.
+        """
+        moves = [position for position in self._static_order if self._cells[position] == self.EMPTY_CELL]
+
+        if best_position is not None and self._cells[best_position] == self.EMPTY_CELL:
+            moves.remove(best_position)
+            moves.insert(0, best_position)
+
+        return moves
+
+    def _probe(self, ply: int) -> tuple[Optional[int], Optional[int], Optional[int]]:
+        """
+        Probe the transposition table for a position.
+
+        Arguments:
+            ply (int): a number of moves made from the root position.
+
+        Returns:
+            The position's value relative to the root and its flag (both `None` if the position has not been searched
+            deep enough) and the best move's position (`None` if the position has not been searched) as a tuple.
+        """
+        self.stats.transposition_table_lookups += 1
+        entry = self.cache.get(key=self._key ^ self._side_keys[self._get_side(ply=ply)])
+
+        if entry is None:
+            return None, None, None
+
+        self.stats.transposition_table_hits += 1
+        depth, value, flag, position = entry
+
+        if depth < self._depth - ply:
+            return None, None, position
+
+        if value > self.WIN_THRESHOLD:
+            value -= ply
+
+        elif value < -self.WIN_THRESHOLD:
+            value += ply
+
+        return value, flag, position
+
+    def _store(self, ply: int, value: int, flag: int, position: int) -> None:
+        """
+        Store a searched position to the transposition table.
+
+        Win values are stored relative to the position rather than to the root, so they are valid for any root.
+
+        Arguments:
+            ply (int): a number of moves made from the root position.
+            value (int): the position's value for a player to move.
+            flag (int): whether the value is exact, a lower bound or an upper bound.
+            position (int): the best move's position.
+        """
+        if value > self.WIN_THRESHOLD:
+            value += ply
+
+        elif value < -self.WIN_THRESHOLD:
+            value -= ply
+
+        key = self._key ^ self._side_keys[self._get_side(ply=ply)]
+        self.cache.put(key=key, depth=self._depth - ply, value=value, bound=flag, move=position)
@@ -0,0 +1,235 @@
+"""
+Provide implementation of the game's perfect play table for a 3x3 board.
+
+Usage (build the table): python3 -m game.perfect_play [path]
+"""
+import mmap
+import sys
+from pathlib import Path
+from typing import Optional
+
+from game.board import Board
+from game.dto import Player
+from game.enums import PositionValue
+from game.exceptions import (
+    PerfectPlayTableBoardIsNotSupportedException,
+    PerfectPlayTablePositionIsNotReachableException,
+)
+from game.utils import get_winning_lines
+
+SIZE = 3
+PLAYERS_NUMBER = 2
+CELLS_NUMBER = SIZE * SIZE
+SLOTS_NUMBER = 3 ** CELLS_NUMBER
+
+EMPTY_CELL = 0
+UNREACHABLE_SLOT = 0
+
+MOVE_BITS_MASK = 0b1111
+VALUE_BITS_SHIFT = 4
+
+VALUES_CODES = {
+    PositionValue.LOSS: 1,
+    PositionValue.TIE: 2,
+    PositionValue.WIN: 3,
+}
+CODES_VALUES = {code: value for value, code in VALUES_CODES.items()}
+OPPOSITE_VALUES = {
+    PositionValue.LOSS: PositionValue.WIN,
+    PositionValue.TIE: PositionValue.TIE,
+    PositionValue.WIN: PositionValue.LOSS,
+}
+
+DEFAULT_PATH = Path(__file__).parent / 'data' / 'perfect-play-3x3.bin'
+
+
+def get_position_index(cells: list[int]) -> int:
+    """
+    Get a position's index in the table.
+
+    A position is encoded as a base-3 number where each digit is a cell: `0` is an empty cell, `1` is a mark of the
+    first player and `2` is a mark of the second player, the first cell is the lowest digit.
+
+    Arguments:
+        cells (list): cells as a list of `0`, `1` or `2`.
+
+    Returns:
+        The position's index as an integer.
+    """
+    index = 0
+
+    for cell in reversed(cells):
+        index = index * 3 + cell
+
+    return index
+
+
+def build_perfect_play_table(path: Path = DEFAULT_PATH) -> None:
+    """
+    Build the perfect play table and write it to a file.
+
+    It enumerates every position reachable from an empty board, the first player moves first, and solves it. Each
+    position takes a byte at its index: the lowest four bits are the best move's position (the first position is 1,
+    `0` if the game is over), the next two bits are the position's value for a player to move. Bytes of positions that
+    are not reachable are `0`. Among moves of the same value, the fastest win or the slowest loss is chosen.
+
+    Arguments:
+        path (Path): a path to write the table to.
+    """
+    table = bytearray(SLOTS_NUMBER)
+    _solve(cells=[EMPTY_CELL] * CELLS_NUMBER, side=0, table=table, distances={})
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(table)
+
+
+def _solve(cells: list[int], side: int, table: bytearray, distances: dict) -> tuple[PositionValue, int]:
+    """
+    Solve a position and every position reachable from it.
+
+    A position is a tie as soon as every line has marks of both players, as no one can win it anymore, even if there
+    are empty cells left.
+
+    Arguments:
+        cells (list): cells as a list of `0`, `1` or `2`.
+        side (int): an index of a player to move.
+        table (bytearray): the perfect play table to fill.
+        distances (dict): numbers of moves to the end of the game by solved positions' indexes.
+
+    Returns:
+        The position's value for a player to move and a number of moves to the end of the game as a tuple.
+    """
+    index = get_position_index(cells=cells)
+
+    if table[index] != UNREACHABLE_SLOT:
+        return CODES_VALUES[table[index] >> VALUE_BITS_SHIFT], distances[index]
+
+    opponent_code = 2 - side
+    lines_cells = [{cells[position] for position in line} for line in get_winning_lines(size=SIZE)]
+
+    if any(line_cells == {opponent_code} for line_cells in lines_cells):
+        best_value, best_distance, best_move = PositionValue.LOSS, 0, 0
+
+    elif all(side + 1 in line_cells and opponent_code in line_cells for line_cells in lines_cells):
+        best_value, best_distance, best_move = PositionValue.TIE, 0, 0
+
+    else:
+        best_key, best_value, best_distance, best_move = None, None, None, None
+
+        for position in range(CELLS_NUMBER):
+            if cells[position] != EMPTY_CELL:
+                continue
+
+            cells[position] = side + 1
+            child_value, child_distance = _solve(cells=cells, side=1 - side, table=table, distances=distances)
+            cells[position] = EMPTY_CELL
+
+            value, distance = OPPOSITE_VALUES[child_value], child_distance + 1
+            key = (VALUES_CODES[value], -distance if value == PositionValue.WIN else distance)
+
+            if best_key is None or key > best_key:
+                best_key, best_value, best_distance, best_move = key, value, distance, position + 1
+
+    table[index] = VALUES_CODES[best_value] << VALUE_BITS_SHIFT | best_move
+    distances[index] = best_distance
+
+    return best_value, best_distance
+
+
+class PerfectPlayTable:
+    """
+    Perfect play table implementation.
+
+    The table is memory-mapped read-only, so any number of processes share a single page-cached copy of it, and a
+    position's lookup is a single byte read.
+    """
+
+    def __init__(self, path: Path = DEFAULT_PATH) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            path (Path): a path to the table built by `build_perfect_play_table`.
+        """
+        with Path(path).open('rb') as file:
+            self._table = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        """
+        Close the table.
+        """
+        self._table.close()
+
+    def evaluate(self, board: Board) -> PositionValue:
+        """
+        Evaluate a board's position with a perfect play.
+
+        Arguments:
+            board (Board): a game's board.
+
+        Returns:
+            The position's value for a player to move as a `PositionValue`.
+        """
+        return CODES_VALUES[self._get_slot(board=board) >> VALUE_BITS_SHIFT]
+
+    def best_move(self, board: Board) -> Optional[int]:
+        """
+        Get the best move on a board with a perfect play.
+
+        Arguments:
+            board (Board): a game's board.
+
+        Returns:
+            A human-readable position meaning first position would be 1, `None` if the game is over.
+        """
+        move = self._get_slot(board=board) & MOVE_BITS_MASK
+        return move or None
+
+    def get_move(self, board: Board, player: Player) -> Optional[int]:  # noqa: ARG002
+        """
+        Get the best move of a player on a board, so the table can be used as a game's engine.
+
+        Arguments:
+            board (Board): a game's board.
+            player (Player): a player to move, it is always defined by the board's marks.
+
+        Returns:
+            A human-readable position meaning first position would be 1, `None` if the game is over.
+        """
+        return self.best_move(board=board)
+
+    def _get_slot(self, board: Board) -> int:
+        """
+        Get a byte of a board's position.
+
+        The first board's player is considered to move first.
+
+        Arguments:
+            board (Board): a game's board.
+
+        Raises:
+            PerfectPlayTableBoardIsNotSupportedException: if a board is not a classic 3x3 or has not two players.
+            PerfectPlayTablePositionIsNotReachableException: if a board's position is not reachable.
+
+        Returns:
+            The position's byte as an integer.
+        """
+        is_board_classic = board.size == SIZE and board.height == SIZE and board.win_length == SIZE
+
+        if not is_board_classic or board.players_number != PLAYERS_NUMBER:
+            raise PerfectPlayTableBoardIsNotSupportedException
+
+        marks_codes = {player.mark: index + 1 for index, player in enumerate(board.players)}
+        cells = [marks_codes.get(cell, EMPTY_CELL) for cell in board.get()]
+
+        slot = self._table[get_position_index(cells=cells)]
+
+        if slot == UNREACHABLE_SLOT:
+            raise PerfectPlayTablePositionIsNotReachableException
+
+        return slot
+
+
+if __name__ == '__main__':
+    build_perfect_play_table(path=Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PATH)
@@ -0,0 +1,598 @@
+"""
+Provide implementation of the game's compact binary records of games.
+
+An archive is a header (`MAGIC` and a version byte) followed by records written one after another. A record is:
+
+    varint   size              - a number of positions per row.
+    varint   height            - a number of rows.
+    varint   win length        - a number of marks in a row needed to win.
+    byte     players number
+    bytes    marks             - an index of each player's mark in `PlayerMark`, in the players' order.
+    varint   moves number
+    varints  moves             - positions of the moves, the first position is 1, players move in turns.
+    byte     decision          - `0` for continue, `1` for a win and `2` for a tie.
+    byte     winner            - an index of a winning player plus one, `0` if there is no winner.
+
+A varint is an unsigned LEB128 integer: 7 bits per byte, the lowest bits first, the highest bit is set on all bytes but
+the last one, so a position of a board up to 127 cells takes a single byte and a 3x3 game takes 10 to 18 bytes.
+
+Records are encoded the same way by all versions, but games of version 1 archives were played when a tie was declared
+on a full board only, while since version 2 a tie is declared as soon as no winning line is live (see `Board.check`),
+so games' states are got by the rules of an archive's version (see `get_board_state`).
+"""
+import mmap
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+
+from game.board import Board
+from game.dto import (
+    BoardState,
+    GameRecord,
+    Player,
+)
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.exceptions import (
+    GameRecordIsInvalidException,
+    GameRecordsArchiveIsInvalidException,
+)
+
+MAGIC = b'TTTR'
+VERSION = 2
+FIRST_VERSION = 1
+FULL_BOARD_TIE_VERSION = 1
+HEADER = MAGIC + bytes([VERSION])
+RECORDS_OFFSET = len(HEADER)
+
+MARKS = tuple(PlayerMark)
+DECISIONS = (BoardCheckResultDecision.CONTINUE, BoardCheckResultDecision.WIN, BoardCheckResultDecision.TIE)
+DECISIONS_CODES = {decision: code for code, decision in enumerate(DECISIONS)}
+NO_WINNER = 0
+
+VARINT_BITS = 7
+VARINT_MASK = 0x7F
+VARINT_CONTINUATION = 0x80
+
+WRITE_BUFFER_SIZE = 1 << 20
+INDEX_TYPECODE = 'Q'
+
+
+def encode_varint(value: int, buffer: bytearray) -> None:
+    """
+    Encode an unsigned integer as a varint.
+
+    Arguments:
+        value (int): a non-negative integer.
+        buffer (bytearray): a buffer to append the varint to.
+    """
+    while value > VARINT_MASK:
+        buffer.append(value & VARINT_MASK | VARINT_CONTINUATION)
+        value >>= VARINT_BITS
+
+    buffer.append(value)
+
+
+def decode_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """
+    Decode a varint.
+
+    Arguments:
+        data (bytes): data with the varint, any buffer supporting indexing (e.g. `mmap`).
+        offset (int): an offset of the varint in the data.
+
+    Raises:
+        GameRecordIsInvalidException: if the data ends before the varint.
+
+    Returns:
+        The integer and an offset after the varint as a tuple.
+    """
+    value, shift = 0, 0
+
+    while True:
+        if offset >= len(data):
+            raise GameRecordIsInvalidException
+
+        byte = data[offset]
+        offset += 1
+        value |= (byte & VARINT_MASK) << shift
+
+        if not byte & VARINT_CONTINUATION:
+            return value, offset
+
+        shift += VARINT_BITS
+
+
+def encode_record(record: GameRecord, buffer: bytearray) -> None:
+    """
+    Encode a game's record.
+
+    Arguments:
+        record (GameRecord): a game's record.
+        buffer (bytearray): a buffer to append the encoded record to.
+    """
+    encode_varint(value=record.size, buffer=buffer)
+    encode_varint(value=record.height, buffer=buffer)
+    encode_varint(value=record.win_length, buffer=buffer)
+
+    buffer.append(len(record.marks))
+    buffer.extend(MARKS.index(mark) for mark in record.marks)
+
+    encode_varint(value=len(record.moves), buffer=buffer)
+
+    for position in record.moves:
+        encode_varint(value=position, buffer=buffer)
+
+    buffer.append(DECISIONS_CODES[record.decision])
+    buffer.append(NO_WINNER if record.winning_mark is None else record.marks.index(record.winning_mark) + 1)
+
+
+def decode_record(data: bytes, offset: int) -> tuple[GameRecord, int]:
+    """
+    Decode a game's record.
+
+    Arguments:
+        data (bytes): data with the record, any buffer supporting indexing and slicing (e.g. `mmap`).
+        offset (int): an offset of the record in the data.
+
+    Raises:
+        GameRecordIsInvalidException: if the record is corrupted or the data ends before its end.
+
+    Returns:
+        The record as a `GameRecord` and an offset after it as a tuple.
+    """
+    size, offset = decode_varint(data=data, offset=offset)
+    height, offset = decode_varint(data=data, offset=offset)
+    win_length, offset = decode_varint(data=data, offset=offset)
+
+    if offset >= len(data):
+        raise GameRecordIsInvalidException
+
+    players_number = data[offset]
+    marks_end = offset + 1 + players_number
+    marks_indexes = data[offset + 1:marks_end]
+
+    moves_number, offset = decode_varint(data=data, offset=marks_end)
+    moves = []
+
+    for _ in range(moves_number):
+        position, offset = decode_varint(data=data, offset=offset)
+        moves.append(position)
+
+    if offset + 2 > len(data):
+        raise GameRecordIsInvalidException
+
+    decision_code, winner = data[offset], data[offset + 1]
+
+    try:
+        marks = [MARKS[index] for index in marks_indexes]
+        decision = DECISIONS[decision_code]
+        winning_mark = None if winner == NO_WINNER else marks[winner - 1]
+
+    except IndexError as exception:
+        raise GameRecordIsInvalidException from exception
+
+    record = GameRecord(
+        size=size,
+        height=height,
+        win_length=win_length,
+        marks=marks,
+        moves=moves,
+        decision=decision,
+        winning_mark=winning_mark,
+    )
+
+    return record, offset + 2
+
+
+def create_record(board: Board) -> GameRecord:
+    """
+    Create a record of a game played on a board.
+
+    Arguments:
+        board (Board): a game's board, its moves are made by players in turns.
+
+    Returns:
+        The game's record as a `GameRecord`.
+    """
+    board_state = board.check()
+
+    return GameRecord(
+        size=board.size,
+        height=board.height,
+        win_length=board.win_length,
+        marks=[player.mark for player in board.players],
+        moves=board.get_moves(),
+        decision=board_state.decision,
+        winning_mark=None if board_state.winning_player is None else board_state.winning_player.mark,
+    )
+
+
+def replay_record(record: GameRecord) -> Board:
+    """
+    Replay a game's record on a board.
+
+    Arguments:
+        record (GameRecord): a game's record.
+
+    Returns:
+        The board after the game's moves as a `Board`, its `check` returns the game's state.
+    """
+    players = [Player(mark=mark) for mark in record.marks]
+    board = Board(players=players, size=record.size, height=record.height, win_length=record.win_length)
+
+    for index, position in enumerate(record.moves):
+        board.mark(player=players[index % len(players)], position=position)
+
+    return board
+
+
+def get_record_state(record: GameRecord) -> BoardState:
+    """
+    Get a game's state stored in its record.
+
+    Arguments:
+        record (GameRecord): a game's record.
+
+    Returns:
+        The game's state as a `BoardState`.
+    """
+    winning_player = None if record.winning_mark is None else Player(mark=record.winning_mark)
+    return BoardState(decision=record.decision, winning_player=winning_player)
+
+
+def get_board_state(board: Board, version: int = VERSION) -> BoardState:
+    """
+    Get a board's state by the rules of an archive's version.
+
+    Up to `FULL_BOARD_TIE_VERSION`, a game is a tie only if its board is full, so a board without live lines and with
+    empty cells left is still a game to continue. Nobody can win such a game, so a tie is the only state it can end in.
+
+    Arguments:
+        board (Board): a game's board.
+        version (int): an archive's version, the current one if not specified.
+
+    Returns:
+        The board's state as a `BoardState`.
+    """
+    state = board.check()
+    is_board_full = Board.EMPTY_CELL not in board.get()
+
+    if version <= FULL_BOARD_TIE_VERSION and state.decision == BoardCheckResultDecision.TIE and not is_board_full:
+        return BoardState(decision=BoardCheckResultDecision.CONTINUE)
+
+    return state
+
+
+def get_archive_version(path: Path) -> int:
+    """
+    Get an archive's version from its header.
+
+    Arguments:
+        path (Path): a path to an archive.
+
+    Raises:
+        GameRecordsArchiveIsInvalidException: if the file is not an archive or is of an unsupported version.
+
+    Returns:
+        The version as an integer.
+    """
+    with Path(path).open('rb') as file:
+        version = parse_header(header=file.read(RECORDS_OFFSET))
+
+    if version is None:
+        raise GameRecordsArchiveIsInvalidException
+
+    return version
+
+
+def parse_header(header: bytes) -> Optional[int]:
+    """
+    Parse an archive's header.
+
+    Arguments:
+        header (bytes): the first bytes of a file, up to `RECORDS_OFFSET` of them.
+
+    Returns:
+        The archive's version as an integer, `None` if the file is not an archive or is of an unsupported version.
+    """
+    if len(header) != RECORDS_OFFSET or header[:len(MAGIC)] != MAGIC:
+        return None
+
+    version = header[-1]
+
+    if not FIRST_VERSION <= version <= VERSION:
+        return None
+
+    return version
+
+
+class RecordWriter:
+    """
+    Game records' writer implementation.
+
+    Records are encoded into a buffer and appended to an archive in blocks, so writing millions of records takes a
+    write per megabyte rather than per record.
+    """
+
+    def __init__(self, path: Path, buffer_size: int = WRITE_BUFFER_SIZE) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            path (Path): a path to an archive, it is created if it does not exist, otherwise records are appended to it.
+            buffer_size (int): a size of the buffer in bytes to write in blocks.
+
+        Raises:
+            GameRecordsArchiveIsInvalidException: if records are appended to a file which is not an archive of the
+                current version, as its games' states are got by other rules.
+        """
+        self.path = Path(path)
+        self.buffer_size = buffer_size
+
+        is_appended = self.path.exists() and self.path.stat().st_size > 0
+
+        if is_appended and get_archive_version(path=self.path) != VERSION:
+            raise GameRecordsArchiveIsInvalidException
+
+        self._file = self.path.open('ab')
+        self._buffer = bytearray()
+
+        if not self._file.tell():
+            self._buffer.extend(HEADER)
+
+    def __enter__(self) -> 'RecordWriter':
+        """
+        Enter the writer's context.
+
+        Returns:
+            The writer as a `RecordWriter`.
+        """
+        return self
+
+    def __exit__(self, *exception_info: object) -> None:
+        """
+        Exit the writer's context: flush and close it.
+
+        Arguments:
+            exception_info (object): an exception's type, value and traceback, if any.
+        """
+        self.close()
+
+    def write(self, record: GameRecord) -> None:
+        """
+        Write a record.
+
+        Arguments:
+            record (GameRecord): a game's record.
+        """
+        encode_record(record=record, buffer=self._buffer)
+
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Append buffered records to the archive.
+        """
+        self._file.write(self._buffer)
+        self._file.flush()
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """
+        Flush buffered records and close the archive.
+        """
+        self.flush()
+        self._file.close()
+
+
+class RecordReader:
+    """
+    Game records' reader implementation.
+
+    An archive is memory-mapped, so it is read lazily by the operating system's pages and any size of it takes constant
+    memory. Records are iterated by a generator or accessed by their numbers through an offset index.
+    """
+
+    def __init__(self, path: Path, index: Optional[array] = None) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            path (Path): a path to an archive.
+            index (array): offsets of records by their numbers, as `build_index` returns them, if any.
+
+        Raises:
+            GameRecordsArchiveIsInvalidException: if the file is not an archive or is of an unsupported version.
+        """
+        self.path = Path(path)
+        self.index = index
+
+        with self.path.open('rb') as file:
+            self.version = parse_header(header=file.read(RECORDS_OFFSET))
+
+            if self.version is None:
+                raise GameRecordsArchiveIsInvalidException
+
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> 'RecordReader':
+        """
+        Enter the reader's context.
+
+        Returns:
+            The reader as a `RecordReader`.
+        """
+        return self
+
+    def __exit__(self, *exception_info: object) -> None:
+        """
+        Exit the reader's context: close it.
+
+        Arguments:
+            exception_info (object): an exception's type, value and traceback, if any.
+        """
+        self.close()
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        """
+        Iterate over records.
+
+        Yields:
+            Records as `GameRecord`.
+        """
+        for _, record in self.iterate_with_offsets():
+            yield record
+
+    def __len__(self) -> int:
+        """
+        Get a number of records in the index.
+
+        Returns:
+            The number of records as an integer.
+        """
+        return len(self._get_index())
+
+    def __getitem__(self, number: int) -> GameRecord:
+        """
+        Get a record by its number through the offset index, it is built on the first access if it is not given.
+
+        Arguments:
+            number (int): a record's number, the first record is 0.
+
+        Returns:
+            The record as a `GameRecord`.
+        """
+        return self.read_at(offset=self._get_index()[number])
+
+    def iterate_with_offsets(self, start: int = RECORDS_OFFSET, end: Optional[int] = None) -> Iterator[tuple]:
+        """
+        Iterate over records with their offsets.
+
+        Arguments:
+            start (int): an offset of the first record to read, the first record of the archive if not specified.
+            end (int): an offset to stop reading records at, the end of the archive if not specified.
+
+        Yields:
+            Offsets and records as tuples of an integer and a `GameRecord`.
+        """
+        data = self._data
+        offset, end = start, len(data) if end is None else end
+
+        while offset < end:
+            record, next_offset = decode_record(data=data, offset=offset)
+            yield offset, record
+            offset = next_offset
+
+    def iterate_offsets(self, start: int = RECORDS_OFFSET, end: Optional[int] = None) -> Iterator[int]:
+        """
+        Iterate over offsets of records.
+
+        Records are skipped by their varints' continuation bits without being decoded, so it is a cheap pass to index
+        an archive or split it into chunks.
+
+        Arguments:
+            start (int): an offset of the first record, the first record of the archive if not specified.
+            end (int): an offset to stop at, the end of the archive if not specified.
+
+        Raises:
+            GameRecordIsInvalidException: if the archive ends in the middle of a record.
+
+        Yields:
+            Offsets of records as integers.
+        """
+        data = self._data
+        offset, end = start, len(data) if end is None else end
+
+        while offset < end:
+            yield offset
+
+            _, offset = decode_varint(data=data, offset=offset)
+            _, offset = decode_varint(data=data, offset=offset)
+            _, offset = decode_varint(data=data, offset=offset)
+
+            if offset >= len(data):
+                raise GameRecordIsInvalidException
+
+            moves_number, offset = decode_varint(data=data, offset=offset + 1 + data[offset])
+
+            for _ in range(moves_number):
+                while offset < len(data) and data[offset] & VARINT_CONTINUATION:
+                    offset += 1
+
+                offset += 1
+
+            offset += 2
+
+            if offset > len(data):
+                raise GameRecordIsInvalidException
+
+    def read_at(self, offset: int) -> GameRecord:
+        """
+        Read a record at an offset.
+
+        Arguments:
+            offset (int): the record's offset.
+
+        Returns:
+            The record as a `GameRecord`.
+        """
+        record, _ = decode_record(data=self._data, offset=offset)
+        return record
+
+    def build_index(self) -> array:
+        """
+        Build an offset index of the archive's records.
+
+        Returns:
+            Offsets of records by their numbers as an array of unsigned 64-bit integers.
+        """
+        return array(INDEX_TYPECODE, self.iterate_offsets())
+
+    def close(self) -> None:
+        """
+        Close the archive.
+        """
+        self._data.close()
+
+    def _get_index(self) -> array:
+        """
+        Get the offset index, build it if it is not given.
+
+        Returns:
+            Offsets of records by their numbers as an array.
+        """
+        if self.index is None:
+            self.index = self.build_index()
+
+        return self.index
+
+
+def save_index(index: array, path: Path) -> None:
+    """
+    Save an offset index to a file, e.g. next to its archive.
+
+    Arguments:
+        index (array): offsets of records by their numbers.
+        path (Path): a path to the index's file.
+    """
+    Path(path).write_bytes(index.tobytes())
+
+
+def load_index(path: Path) -> array:
+    """
+    Load an offset index from a file.
+
+    Arguments:
+        path (Path): a path to the index's file.
+
+    Returns:
+        Offsets of records by their numbers as an array.
+    """
+    index = array(INDEX_TYPECODE)
+    index.frombytes(Path(path).read_bytes())
+    return index
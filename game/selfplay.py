@@ -0,0 +1,266 @@
+"""
+Provide implementation of the game's multi-process self-play.
+
+Usage: python3 -m game.selfplay --games 10000 --workers 4 --policy random
+"""
+import argparse
+import importlib
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from game.board import Board
+from game.dto import (
+    Player,
+    SelfPlayResult,
+)
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.exceptions import (
+    EnginePlayersNumberIsNotSupportedException,
+    WorkersNumberIsInvalidException,
+)
+from game.mcts import MctsEngine
+from game.negamax import NegamaxEngine
+
+
+class RandomEngine:
+    """
+    Random engine implementation.
+
+    It is a computer player marking a random empty cell.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            seed (int): a seed of random moves, random if `None`.
+        """
+        self._random = random.Random(seed)
+
+    def get_move(self, board: Board, player: Player) -> int:  # noqa: ARG002
+        """
+        Get a random move of a player on a board.
+
+        Arguments:
+            board (Board): a game's board.
+            player (Player): a player to move.
+
+        Returns:
+            A human-readable position meaning first position would be 1.
+        """
+        empty_positions = [position for position, cell in enumerate(board.get(), 1) if cell is board.EMPTY_CELL]
+        return self._random.choice(empty_positions)
+
+
+POLICIES = {
+    'random': lambda seed: RandomEngine(seed=seed),
+    'negamax': lambda seed: NegamaxEngine(max_nodes=10_000, seed=seed),
+    'mcts': lambda seed: MctsEngine(deadline=10, seed=seed),
+}
+POLICIES_PLAYERS_NUMBERS = {
+    'negamax': NegamaxEngine.PLAYERS_NUMBER,
+}
+
+
+def get_engine(policy: str, seed: int) -> object:
+    """
+    Get an engine of a move policy.
+
+    Arguments:
+        policy (str): a name of a policy (`random`, `negamax` or `mcts`) or an import path of an engine's class as
+            `module:Class`, constructed with a `seed` keyword argument.
+        seed (int): a seed of the engine's random moves.
+
+    Returns:
+        An engine with a `get_move(board, player)` method.
+    """
+    if policy in POLICIES:
+        return POLICIES[policy](seed)
+
+    module_name, _, class_name = policy.partition(':')
+    engine_class = getattr(importlib.import_module(module_name), class_name)
+
+    return engine_class(seed=seed)
+
+
+def validate_policy(policy: str, players_number: int) -> None:
+    """
+    Validate that a move policy supports a number of players, before any game is played.
+
+    Arguments:
+        policy (str): a move policy, as `get_engine` accepts it.
+        players_number (int): a number of players.
+
+    Raises:
+        EnginePlayersNumberIsNotSupportedException: if the policy's engine does not support the number of players.
+    """
+    supported_players_number = POLICIES_PLAYERS_NUMBERS.get(policy)
+
+    if supported_players_number is not None and players_number != supported_players_number:
+        raise EnginePlayersNumberIsNotSupportedException
+
+
+def play_games(games: int, policy: str, players_number: int, seed: int, board_options: dict) -> SelfPlayResult:
+    """
+    Play games of an engine against itself.
+
+    Arguments:
+        games (int): a number of games to play.
+        policy (str): a move policy, as `get_engine` accepts it.
+        players_number (int): a number of players.
+        seed (int): a seed of the engine's random moves.
+        board_options (dict): a board's shape as `Board` keyword arguments (`size`, `height` and `win_length`).
+
+    Returns:
+        The games' result as a `SelfPlayResult`.
+    """
+    validate_policy(policy=policy, players_number=players_number)
+    started_at = time.perf_counter()
+
+    engine = get_engine(policy=policy, seed=seed)
+    players = [Player(mark=mark) for mark in list(PlayerMark)[:players_number]]
+
+    wins, lengths, ties = Counter(), Counter(), 0
+
+    for _ in range(games):
+        board = Board(players=players, **board_options)
+        moves_number = 0
+
+        while board.check().decision == BoardCheckResultDecision.CONTINUE:
+            player = players[moves_number % players_number]
+            board.mark(player=player, position=engine.get_move(board=board, player=player))
+            moves_number += 1
+
+        board_state = board.check()
+        lengths[moves_number] += 1
+
+        if board_state.decision == BoardCheckResultDecision.WIN:
+            wins[board_state.winning_player.mark.value] += 1
+
+        else:
+            ties += 1
+
+    return SelfPlayResult(
+        games=games,
+        wins=dict(wins),
+        ties=ties,
+        lengths=dict(lengths),
+        time=time.perf_counter() - started_at,
+    )
+
+
+def merge_results(results: list[SelfPlayResult], time_: float) -> SelfPlayResult:
+    """
+    Merge games' results of workers.
+
+    Arguments:
+        results (list): workers' results as a list of `SelfPlayResult`.
+        time_ (float): wall-clock time of all the workers.
+
+    Returns:
+        The merged result as a `SelfPlayResult`.
+    """
+    wins, lengths = Counter(), Counter()
+
+    for result in results:
+        wins.update(result.wins)
+        lengths.update(result.lengths)
+
+    return SelfPlayResult(
+        games=sum(result.games for result in results),
+        wins=dict(wins),
+        ties=sum(result.ties for result in results),
+        lengths=dict(sorted(lengths.items())),
+        time=time_,
+    )
+
+
+def run_self_play(  # noqa: PLR0913
+    games: int,
+    workers: int,
+    policy: str,
+    players_number: int = 2,
+    seed: int = 0,
+    board_options: Optional[dict] = None,
+) -> tuple[SelfPlayResult, list[SelfPlayResult]]:
+    """
+    Run self-play games sharded across worker processes.
+
+    Each worker plays its share of games with its own seed (a base seed plus the worker's index), so runs are
+    reproducible and workers do not play the same games.
+
+    Arguments:
+        games (int): a number of games to play.
+        workers (int): a number of worker processes.
+        policy (str): a move policy, as `get_engine` accepts it.
+        players_number (int): a number of players.
+        seed (int): a base seed of the engines' random moves.
+        board_options (dict): a board's shape as `Board` keyword arguments, a classic 3x3 board if not specified.
+
+    Raises:
+        WorkersNumberIsInvalidException: if the number of worker processes is less than 1.
+
+    Returns:
+        The overall result and workers' results as a tuple.
+    """
+    if workers < 1:
+        raise WorkersNumberIsInvalidException
+
+    validate_policy(policy=policy, players_number=players_number)
+
+    board_options = board_options or {}
+    shards = [games // workers + (1 if index < games % workers else 0) for index in range(workers)]
+    started_at = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(play_games, shard, policy, players_number, seed + index, board_options)
+            for index, shard in enumerate(shards)
+        ]
+        results = [future.result() for future in futures]
+
+    return merge_results(results=results, time_=time.perf_counter() - started_at), results
+
+
+def main() -> None:
+    """
+    Run self-play games from a command line and print their results.
+    """
+    parser = argparse.ArgumentParser(description='Play games of an engine against itself.')
+    parser.add_argument('--games', type=int, default=1000, help='a number of games to play')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='a number of worker processes')
+    parser.add_argument('--policy', default='random', help='random, negamax, mcts or module:Class')
+    parser.add_argument('--size', type=int, default=3, help='a number of positions per row')
+    parser.add_argument('--height', type=int, help='a number of rows, the same as the size if not specified')
+    parser.add_argument('--win-length', type=int, help='a number of marks in a row needed to win')
+    parser.add_argument('--players', type=int, default=2, help='a number of players')
+    parser.add_argument('--seed', type=int, default=0, help="a base seed, a worker's seed is the base plus its index")
+    arguments = parser.parse_args()
+
+    result, workers_results = run_self_play(
+        games=arguments.games,
+        workers=arguments.workers,
+        policy=arguments.policy,
+        players_number=arguments.players,
+        seed=arguments.seed,
+        board_options={'size': arguments.size, 'height': arguments.height, 'win_length': arguments.win_length},
+    )
+
+    for index, worker_result in enumerate(workers_results):
+        print(f'Worker {index}: {worker_result.games} games, {worker_result.games_per_second:.1f} games/sec.')
+
+    print(f'Overall: {result.games} games, {result.games_per_second:.1f} games/sec.')
+    print(f'Wins: {result.wins}, ties: {result.ties}.')
+    print(f'Lengths: {result.lengths}.')
+
+
+if __name__ == '__main__':
+    main()
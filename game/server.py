@@ -0,0 +1,397 @@
+"""
+Provide implementation of the game's asyncio TCP server.
+
+Usage: python3 -m game.server --host 127.0.0.1 --port 8765 --move-timeout 30
+
+The protocol is line-based UTF-8 text, one message per line, words are separated by spaces:
+
+    server: WAIT                      - the connection waits for an opponent.
+    server: START <mark>              - the game has started, the connection plays with the mark.
+    server: BOARD <cells>             - the board's cells in the row-major order, `.` is an empty cell.
+    server: TURN <mark>               - a player with the mark is to move.
+    client: <position>                - a move of the player, the first position is 1.
+    server: INVALID                   - the move is invalid (not the player's turn or a wrong position).
+    server: OVER win <mark>           - the game is over with a win of a player with the mark.
+    server: OVER tie                  - the game is over with a tie.
+    server: OVER timeout <mark>       - the game is over as a player with the mark has not moved in time.
+    server: OVER left <mark>          - the game is over as a player with the mark has disconnected.
+
+Try it with `nc 127.0.0.1 8765` in two terminals.
+"""
+import argparse
+import asyncio
+import contextlib
+from typing import Optional
+
+from game.board import Board
+from game.dto import Player
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.exceptions import (
+    BoardPositionAlreadyTakenException,
+    BoardPositionDoesNotExistException,
+    GamePlayerIsNotToMoveException,
+)
+from game.game_ import GameSession
+
+PLAYERS_NUMBER = 2
+
+EMPTY_CELL_SYMBOL = '.'
+
+LINE_LIMIT = 1024
+WRITE_BUFFER_HIGH_WATER_MARK = 64 * 1024
+
+
+class Connection:
+    """
+    Client's connection implementation.
+    """
+
+    __slots__ = ('reader', 'writer', 'player', 'write_timeout', 'finished')
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, write_timeout: float) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            reader (asyncio.StreamReader): the connection's reader.
+            writer (asyncio.StreamWriter): the connection's writer.
+            write_timeout (float): time to wait for a client to read sent messages in seconds.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.player = None
+        self.write_timeout = write_timeout
+        self.finished = asyncio.get_running_loop().create_future()
+
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_HIGH_WATER_MARK)
+
+    async def send(self, *words: str) -> None:
+        """
+        Send a message to a client.
+
+        The message is buffered and then the buffer is drained, so a client not reading its messages holds back only
+        its own session, and a client not reading them for longer than a write timeout is disconnected.
+
+        Arguments:
+            words (str): the message's words.
+
+        Raises:
+            ConnectionError: if the connection is lost.
+            TimeoutError: if the client has not read the messages in time, the connection is aborted then.
+        """
+        try:
+            self.writer.write(f'{" ".join(words)}\n'.encode())
+            await asyncio.wait_for(self.writer.drain(), timeout=self.write_timeout)
+
+        except (ConnectionError, TimeoutError):
+            self.writer.transport.abort()
+            raise
+
+    async def close(self) -> None:
+        """
+        Close the connection.
+        """
+        self.writer.close()
+
+        with contextlib.suppress(ConnectionError):
+            await self.writer.wait_closed()
+
+        if not self.finished.done():
+            self.finished.set_result(None)
+
+
+class GameServer:
+    """
+    Game server implementation.
+
+    It hosts any number of concurrent games on a single event loop. Connections are matched in pairs in the order they
+    come: the first of them plays with «x» and moves first. Each game is driven by a `GameSession`, the server only
+    translates the protocol's lines to its moves and its states to the protocol's lines.
+    """
+
+    def __init__(
+        self,
+        move_timeout: float = 30.0,
+        write_timeout: float = 10.0,
+        board_options: Optional[dict] = None,
+    ) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            move_timeout (float): time for a player to move in seconds, the player loses the game after it.
+            write_timeout (float): time to wait for a client to read sent messages in seconds.
+            board_options (dict): a board's shape as `Board` keyword arguments, a classic 3x3 board if not specified.
+        """
+        self.move_timeout = move_timeout
+        self.write_timeout = write_timeout
+        self.board_options = board_options or {}
+
+        self.players = [Player(mark=mark) for mark in list(PlayerMark)[:PLAYERS_NUMBER]]
+        self.games_number = 0
+        self.finished_games_number = 0
+
+        self._waiting_connection = None
+        self._waiting_task = None
+
+    @property
+    def active_games_number(self) -> int:
+        """
+        Get a number of games being played.
+
+        Returns:
+            The number of games as an integer.
+        """
+        return self.games_number - self.finished_games_number
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> asyncio.Server:
+        """
+        Start the server.
+
+        Arguments:
+            host (str): a host to listen on.
+            port (int): a port to listen on, any free port if `0`.
+
+        Returns:
+            The listening server as an `asyncio.Server`.
+        """
+        return await asyncio.start_server(self.handle_connection, host=host, port=port, limit=LINE_LIMIT)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Handle a client's connection: match it with a waiting one or wait for an opponent.
+
+        Lines of a waiting connection are read and discarded until it is matched, so a client disconnected while
+        waiting is noticed and is not matched, and its lines sent before the game do not become its moves.
+
+        Arguments:
+            reader (asyncio.StreamReader): the connection's reader.
+            writer (asyncio.StreamWriter): the connection's writer.
+        """
+        connection = Connection(reader=reader, writer=writer, write_timeout=self.write_timeout)
+        waiting_connection, self._waiting_connection = self._waiting_connection, None
+        waiting_task, self._waiting_task = self._waiting_task, None
+
+        if waiting_task is not None:
+            waiting_task.cancel()
+
+        if waiting_connection is None or self._is_disconnected(connection=waiting_connection):
+            self._waiting_connection = connection
+            self._waiting_task = asyncio.create_task(self._discard_lines(connection=connection))
+
+            if waiting_connection is not None:
+                await waiting_connection.close()
+
+            try:
+                await connection.send('WAIT')
+
+            except (ConnectionError, TimeoutError):
+                await connection.close()
+
+            await connection.finished
+            return
+
+        await self.play(connections=[waiting_connection, connection])
+
+    async def play(self, connections: list[Connection]) -> None:
+        """
+        Play a game between connections.
+
+        Arguments:
+            connections (list): the players' connections as a list of `Connection`, in the players' order.
+        """
+        self.games_number += 1
+
+        session = GameSession(board=Board(players=self.players, **self.board_options))
+        lines = asyncio.Queue()
+        readers = []
+
+        for connection, player in zip(connections, self.players, strict=True):
+            connection.player = player
+            readers.append(asyncio.create_task(self._read_lines(connection=connection, lines=lines)))
+
+        result = None
+
+        try:
+            for connection in connections:
+                await connection.send('START', connection.player.mark.value)
+
+            result = await self._play_session(session=session, connections=connections, lines=lines)
+
+        except (ConnectionError, TimeoutError):
+            lost_connection = next(connection for connection in connections if connection.writer.is_closing())
+            result = ('OVER', 'left', lost_connection.player.mark.value)
+
+        finally:
+            for reader in readers:
+                reader.cancel()
+
+            for connection in connections:
+                if result is not None:
+                    with contextlib.suppress(ConnectionError, TimeoutError):
+                        await connection.send(*result)
+
+                await connection.close()
+
+            self.finished_games_number += 1
+
+    async def _play_session(self, session: GameSession, connections: list[Connection], lines: asyncio.Queue) -> tuple:
+        """
+        Play a game's session with players' moves read from connections until it is over.
+
+        Arguments:
+            session (GameSession): a game's session.
+            connections (list): the players' connections as a list of `Connection`.
+            lines (asyncio.Queue): lines read from the connections as tuples of a connection and a line (`None` if the
+                connection is closed).
+
+        Returns:
+            The game's final message as a tuple of words.
+        """
+        loop = asyncio.get_running_loop()
+
+        while not session.is_over:
+            await self._broadcast(connections=connections, words=('BOARD', self._serialize(board=session.board)))
+            await self._broadcast(connections=connections, words=('TURN', session.current_player.mark.value))
+
+            deadline = loop.time() + self.move_timeout
+            is_moved = False
+
+            while not is_moved:
+                try:
+                    connection, line = await asyncio.wait_for(lines.get(), timeout=deadline - loop.time())
+
+                except TimeoutError:
+                    return 'OVER', 'timeout', session.current_player.mark.value
+
+                if line is None:
+                    return 'OVER', 'left', connection.player.mark.value
+
+                try:
+                    session.play(player=connection.player, position=GameSession.parse_position(text=line))
+
+                except (
+                    BoardPositionAlreadyTakenException,
+                    BoardPositionDoesNotExistException,
+                    GamePlayerIsNotToMoveException,
+                ):
+                    await connection.send('INVALID')
+                    continue
+
+                is_moved = True
+
+        await self._broadcast(connections=connections, words=('BOARD', self._serialize(board=session.board)))
+
+        if session.state.decision == BoardCheckResultDecision.WIN:
+            return 'OVER', 'win', session.state.winning_player.mark.value
+
+        return 'OVER', 'tie'
+
+    async def _discard_lines(self, connection: Connection) -> None:
+        """
+        Read and discard lines of a connection waiting for an opponent, and close it when the client disconnects.
+
+        Arguments:
+            connection (Connection): a waiting player's connection.
+        """
+        while True:
+            try:
+                line = await connection.reader.readline()
+
+            except (ConnectionError, ValueError):
+                line = b''
+
+            if not line:
+                break
+
+        if self._waiting_connection is connection:
+            self._waiting_connection = None
+            self._waiting_task = None
+
+        await connection.close()
+
+    @staticmethod
+    def _is_disconnected(connection: Connection) -> bool:
+        """
+        Check if a connection is closed or its client has disconnected.
+
+        Arguments:
+            connection (Connection): a player's connection.
+
+        Returns:
+            True, if the connection cannot be played with anymore.
+            Otherwise, False.
+        """
+        return connection.finished.done() or connection.reader.at_eof() or connection.writer.is_closing()
+
+    async def _read_lines(self, connection: Connection, lines: asyncio.Queue) -> None:
+        """
+        Read lines from a connection into a session's queue.
+
+        Arguments:
+            connection (Connection): a player's connection.
+            lines (asyncio.Queue): a session's queue of lines.
+        """
+        while True:
+            try:
+                line = await connection.reader.readline()
+
+            except (ConnectionError, ValueError):
+                line = b''
+
+            if not line:
+                await lines.put((connection, None))
+                return
+
+            await lines.put((connection, line.decode(errors='replace')))
+
+    async def _broadcast(self, connections: list[Connection], words: tuple) -> None:
+        """
+        Send a message to all players' connections.
+
+        Arguments:
+            connections (list): the players' connections as a list of `Connection`.
+            words (tuple): the message's words.
+        """
+        for connection in connections:
+            await connection.send(*words)
+
+    def _serialize(self, board: Board) -> str:
+        """
+        Serialize a board's cells into a message's word.
+
+        Arguments:
+            board (Board): a game's board.
+
+        Returns:
+            The cells as a string of marks and `.` for empty cells.
+        """
+        return ''.join(EMPTY_CELL_SYMBOL if cell is board.EMPTY_CELL else cell.value for cell in board.get())
+
+
+async def serve(host: str, port: int, move_timeout: float) -> None:
+    """
+    Run the game server forever.
+
+    Arguments:
+        host (str): a host to listen on.
+        port (int): a port to listen on.
+        move_timeout (float): time for a player to move in seconds.
+    """
+    server = await GameServer(move_timeout=move_timeout).start(host=host, port=port)
+
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Host tic-tac-toe games over TCP.')
+    parser.add_argument('--host', default='127.0.0.1', help='a host to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='a port to listen on')
+    parser.add_argument('--move-timeout', type=float, default=30.0, help='time for a player to move in seconds')
+    arguments = parser.parse_args()
+
+    asyncio.run(serve(host=arguments.host, port=arguments.port, move_timeout=arguments.move_timeout))
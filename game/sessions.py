@@ -0,0 +1,190 @@
+"""
+Provide implementation of the game's compact in-memory session pool.
+"""
+import contextlib
+import struct
+from collections.abc import Iterator
+from typing import Optional
+
+from game.board import Board
+from game.dto import Player
+from game.enums import PlayerMark
+from game.exceptions import (
+    SessionPoolMarksNumberDoesNotMatchException,
+    SessionPoolSessionDoesNotExistException,
+)
+from game.game_ import GameSession
+
+MARKS = tuple(PlayerMark)
+
+FREE_RECORD = 0
+ACTIVE_RECORD = 1
+
+EMPTY_CELL = 0
+
+
+class SessionPool:
+    """
+    Session pool implementation.
+
+    It keeps idle games of a board's shape as packed records in a single `bytearray` rather than as objects: a record
+    is a status byte, a byte per cell (`0` for an empty cell, otherwise an index of a player plus one), a number of
+    moves made and a byte per player (an index of the player's mark), so an idle 3x3 game takes 16 bytes. A session is
+    unpacked into a full `Board` and `GameSession` only while it is being played, and packed back after that. Records
+    of deleted sessions are reused by new ones.
+    """
+
+    def __init__(
+        self,
+        size: int = 3,
+        height: Optional[int] = None,
+        win_length: Optional[int] = None,
+        players_number: int = 2,
+    ) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            size (int): a size of sessions' boards as integer, means number of positions per row.
+            height (int): a number of sessions' boards rows, the same as the size if not specified.
+            win_length (int): a number of marks in a row needed to win, the shortest side if not specified.
+            players_number (int): a number of players in each session.
+        """
+        self.board_options = {'size': size, 'height': height, 'win_length': win_length}
+        self.players_number = players_number
+
+        cells_number = size * (size if height is None else height)
+        self.record = struct.Struct(f'<B{cells_number}sI{players_number}s')
+
+        self._records = bytearray()
+        self._free_ids = []
+        self._players = {mark: Player(mark=mark) for mark in MARKS}
+
+    def __len__(self) -> int:
+        """
+        Get a number of sessions in the pool.
+
+        Returns:
+            The number of sessions as an integer.
+        """
+        return len(self._records) // self.record.size - len(self._free_ids)
+
+    def create(self, marks: list[PlayerMark]) -> int:
+        """
+        Create a session of a new game.
+
+        Arguments:
+            marks (list): players' marks in the players' order as a list of `PlayerMark`.
+
+        Raises:
+            SessionPoolMarksNumberDoesNotMatchException: if a number of the marks is not the pool's players number.
+
+        Returns:
+            The session's identifier as an integer.
+        """
+        if len(marks) != self.players_number:
+            raise SessionPoolMarksNumberDoesNotMatchException
+
+        players = [self._players[mark] for mark in marks]
+        session = GameSession(board=Board(players=players, **self.board_options))
+
+        if self._free_ids:
+            session_id = self._free_ids.pop()
+
+        else:
+            session_id = len(self._records) // self.record.size
+            self._records.extend(bytes(self.record.size))
+
+        self.check_in(session_id=session_id, session=session)
+
+        return session_id
+
+    def check_out(self, session_id: int) -> GameSession:
+        """
+        Unpack a session to play it.
+
+        Arguments:
+            session_id (int): a session's identifier.
+
+        Returns:
+            The session as a `GameSession` over a full `Board`.
+        """
+        _, cells, moves_number, marks_indexes = self._unpack(session_id=session_id)
+
+        players = [self._players[MARKS[index]] for index in marks_indexes]
+        board = Board(players=players, **self.board_options)
+        board.board = [players[cell - 1].mark if cell != EMPTY_CELL else board.EMPTY_CELL for cell in cells]
+
+        return GameSession(board=board, moves_number=moves_number)
+
+    def check_in(self, session_id: int, session: GameSession) -> None:
+        """
+        Pack a played session back into the pool.
+
+        Arguments:
+            session_id (int): a session's identifier.
+            session (GameSession): the session.
+        """
+        players_codes = {player.mark: index + 1 for index, player in enumerate(session.players)}
+        cells = bytes(players_codes.get(cell, EMPTY_CELL) for cell in session.board.get())
+        marks_indexes = bytes(MARKS.index(player.mark) for player in session.players)
+
+        self.record.pack_into(
+            self._records,
+            session_id * self.record.size,
+            ACTIVE_RECORD,
+            cells,
+            session.moves_number,
+            marks_indexes,
+        )
+
+    @contextlib.contextmanager
+    def play(self, session_id: int) -> Iterator[GameSession]:
+        """
+        Unpack a session to play it and pack it back after that.
+
+        Arguments:
+            session_id (int): a session's identifier.
+
+        Yields:
+            The session as a `GameSession`.
+        """
+        session = self.check_out(session_id=session_id)
+
+        try:
+            yield session
+
+        finally:
+            self.check_in(session_id=session_id, session=session)
+
+    def delete(self, session_id: int) -> None:
+        """
+        Delete a session, its record is reused by a next created session.
+
+        Arguments:
+            session_id (int): a session's identifier.
+        """
+        self._unpack(session_id=session_id)
+
+        self._records[session_id * self.record.size] = FREE_RECORD
+        self._free_ids.append(session_id)
+
+    def _unpack(self, session_id: int) -> tuple[int, bytes, int, bytes]:
+        """
+        Unpack a session's record.
+
+        Arguments:
+            session_id (int): a session's identifier.
+
+        Raises:
+            SessionPoolSessionDoesNotExistException: if a session does not exist.
+
+        Returns:
+            The record's status, cells, number of moves and players' marks indexes as a tuple.
+        """
+        offset = session_id * self.record.size
+
+        if session_id < 0 or offset >= len(self._records) or self._records[offset] != ACTIVE_RECORD:
+            raise SessionPoolSessionDoesNotExistException
+
+        return self.record.unpack_from(self._records, offset)
@@ -0,0 +1,389 @@
+"""
+Provide implementation of the game's sparse board.
+"""
+from typing import Optional
+
+from game.dto import (
+    BoardState,
+    Player,
+    PlayerMark,
+)
+from game.enums import BoardCheckResultDecision
+from game.exceptions import (
+    BoardPlayerDoesNotExistException,
+    BoardPlayersMarksDuplicateException,
+    BoardPositionAlreadyTakenException,
+    BoardPositionDoesNotExistException,
+    BoardWinLengthIsInvalidException,
+)
+from game.utils import DIRECTIONS
+
+
+class SparseBoard:
+    """
+    Sparse board implementation.
+
+    It has the same interface as `Board`, but stores only occupied cells in a dictionary keyed by `(row, column)`
+    coordinates, so its memory grows with a number of moves rather than with a board's area, and a board may be
+    unbounded (`size=None`), e.g. for "infinite" Gomoku. A win is detected by counting the same marks in a row around
+    the marked cell in each direction, a tie by a number of live lines of a bounded board (lines holding marks of a
+    single player at most). Lines of a bounded board remember their marks, as `Board` does, but only lines holding
+    marks are stored, so a mark updates only lines going through the marked cell. A bounding box of occupied cells is
+    kept, so rendering and search can touch only the active region of a board.
+
+    Positions of an unbounded board are not defined, so its cells are marked by coordinates with `mark_cell`.
+    """
+
+    EMPTY_CELL = None
+    MIXED_LINE = object()
+
+    def __init__(
+        self,
+        players: [Player],
+        size: Optional[int] = 3,
+        height: Optional[int] = None,
+        win_length: Optional[int] = None,
+    ) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            players (list): a list of players as list of `Player`.
+            size (int): a size of a board as integer, means number of positions per row, unbounded if `None`.
+            height (int): a number of board's rows, the same as the size if not specified (a perfect square).
+            win_length (int): a number of marks in a row needed to win, the shortest side if not specified, it must be
+                specified for an unbounded board.
+
+        Raises:
+            BoardPlayersMarksDuplicateException: if board players' marks duplicate.
+            BoardWinLengthIsInvalidException: if board's win length does not fit into the board.
+        """
+        self.players = players
+        self.players_number = len(players)
+
+        if len({player.mark for player in players}) != self.players_number:
+            raise BoardPlayersMarksDuplicateException
+
+        self.size = size
+        self.height = size if height is None else height
+        self.is_unbounded = self.size is None
+
+        if win_length is None and not self.is_unbounded:
+            win_length = min(self.size, self.height)
+
+        self.win_length = win_length
+
+        if self.win_length is None or self.win_length < 1:
+            raise BoardWinLengthIsInvalidException
+
+        if not self.is_unbounded and self.win_length > max(self.size, self.height):
+            raise BoardWinLengthIsInvalidException
+
+        self.board_positions_number = None if self.is_unbounded else self.size * self.height
+        self.lines_number = None if self.is_unbounded else self._get_lines_number()
+
+        self.cells = {}
+        self.bounding_box = None
+        self.live_lines_number = self.lines_number
+        self.state = BoardState(decision=BoardCheckResultDecision.CONTINUE)
+
+        self._lines_marks = {}
+
+    @property
+    def board(self) -> list:
+        """
+        Get a board's cells.
+
+        Returns:
+            A board as a list of `None` or marks.
+        """
+        return self.get()
+
+    @board.setter
+    def board(self, board: list) -> None:
+        """
+        Set a board's cells of a bounded board.
+
+        Arguments:
+            board (list): a board as a list of `None` or marks.
+        """
+        self.cells = {}
+        self.bounding_box = None
+        self.live_lines_number = self.lines_number
+
+        self._lines_marks = {}
+
+        for computer_position, cell in enumerate(board):
+            if cell is not self.EMPTY_CELL:
+                coordinates = divmod(computer_position, self.size)
+                self._put(coordinates=coordinates, mark=cell)
+                self._mark_lines(coordinates=coordinates, mark=cell)
+
+        self.state = self._get_state()
+
+    def get(self) -> list:
+        """
+        Get a bounded board.
+
+        It builds a dense list, so it takes time and memory proportional to a board's area, use `cells` or
+        `get_region` for large boards.
+
+        Raises:
+            BoardPositionDoesNotExistException: if a board is unbounded.
+
+        Returns:
+            A board as a list of `None` or marks.
+        """
+        if self.is_unbounded:
+            raise BoardPositionDoesNotExistException
+
+        board = [self.EMPTY_CELL] * self.board_positions_number
+
+        for (row, column), mark in self.cells.items():
+            board[row * self.size + column] = mark
+
+        return board
+
+    def get_region(self, margin: int = 0) -> tuple[int, int, list[list]]:
+        """
+        Get cells of the active region of a board: the bounding box of occupied cells extended by a margin.
+
+        A region of a bounded board is clipped to the board, a region of an empty board is empty.
+
+        Arguments:
+            margin (int): a number of cells to extend the bounding box by on each side.
+
+        Returns:
+            Coordinates of the region's top left cell and the region's rows of `None` or marks as a tuple.
+        """
+        if self.bounding_box is None:
+            return 0, 0, []
+
+        top, left, bottom, right = self.bounding_box
+        top, left, bottom, right = top - margin, left - margin, bottom + margin, right + margin
+
+        if not self.is_unbounded:
+            top, left = max(top, 0), max(left, 0)
+            bottom, right = min(bottom, self.height - 1), min(right, self.size - 1)
+
+        rows = [
+            [self.cells.get((row, column), self.EMPTY_CELL) for column in range(left, right + 1)]
+            for row in range(top, bottom + 1)
+        ]
+
+        return top, left, rows
+
+    def mark(self, player: Player, position: int) -> None:
+        """
+        Mark a bounded board's cell by a player.
+
+        It accepts the position as human-readable position meaning first position would be 1.
+
+        Arguments:
+            player (Player): a player as a `Player`.
+            position (int): position on a board.
+
+        Raises:
+            BoardPositionDoesNotExistException: if board's position does not exist.
+        """
+        if self.is_unbounded or position < 1 or position > self.board_positions_number:
+            raise BoardPositionDoesNotExistException
+
+        row, column = divmod(position - 1, self.size)
+        self.mark_cell(player=player, row=row, column=column)
+
+    def mark_cell(self, player: Player, row: int, column: int) -> None:
+        """
+        Mark a board's cell by a player with the cell's coordinates, the top left cell of a bounded board is `(0, 0)`.
+
+        Arguments:
+            player (Player): a player as a `Player`.
+            row (int): a cell's row.
+            column (int): a cell's column.
+
+        Raises:
+            BoardPlayerDoesNotExistException: if board's player does not exist.
+            BoardPositionDoesNotExistException: if board's position does not exist.
+            BoardPositionAlreadyTakenException: if board's position already taken.
+        """
+        if player not in self.players:
+            raise BoardPlayerDoesNotExistException
+
+        if not self.is_unbounded and not (0 <= row < self.height and 0 <= column < self.size):
+            raise BoardPositionDoesNotExistException
+
+        coordinates = (row, column)
+
+        if coordinates in self.cells:
+            raise BoardPositionAlreadyTakenException
+
+        self._put(coordinates=coordinates, mark=player.mark)
+
+        if not self.is_unbounded:
+            self._mark_lines(coordinates=coordinates, mark=player.mark)
+
+        if self.state.decision != BoardCheckResultDecision.CONTINUE:
+            return
+
+        if self._is_line_completed(coordinates=coordinates, mark=player.mark):
+            self.state = BoardState(decision=BoardCheckResultDecision.WIN, winning_player=player)
+            return
+
+        if self.is_unbounded:
+            return
+
+        if not self.live_lines_number:
+            self.state = BoardState(decision=BoardCheckResultDecision.TIE)
+
+    def check(self) -> BoardState:
+        """
+        Check a board's state.
+
+        The state is updated by each `mark`, so the board is never rescanned.
+
+        Returns:
+             A board's state as a `BoardState`.
+        """
+        return self.state
+
+    def _put(self, coordinates: tuple[int, int], mark: PlayerMark) -> None:
+        """
+        Put a mark into a cell and extend the bounding box with it.
+
+        Arguments:
+            coordinates (tuple): a cell's row and column.
+            mark (PlayerMark): a player's mark.
+        """
+        self.cells[coordinates] = mark
+        row, column = coordinates
+
+        if self.bounding_box is None:
+            self.bounding_box = (row, column, row, column)
+            return
+
+        top, left, bottom, right = self.bounding_box
+        self.bounding_box = (min(top, row), min(left, column), max(bottom, row), max(right, column))
+
+    def _mark_lines(self, coordinates: tuple[int, int], mark: PlayerMark) -> None:
+        """
+        Mark winning lines of a bounded board going through a cell, and count lines which become mixed as dead.
+
+        Each line holding marks remembers a mark it is filled with, `MIXED_LINE` if it contains marks of different
+        players, so each line is updated in O(1).
+
+        Arguments:
+            coordinates (tuple): a cell's row and column.
+            mark (PlayerMark): the cell's mark.
+        """
+        lines_marks = self._lines_marks
+
+        for line in self._get_cell_lines(coordinates=coordinates):
+            line_mark = lines_marks.get(line, self.EMPTY_CELL)
+
+            if line_mark is self.EMPTY_CELL:
+                lines_marks[line] = mark
+
+            elif line_mark is not mark and line_mark is not self.MIXED_LINE:
+                lines_marks[line] = self.MIXED_LINE
+                self.live_lines_number -= 1
+
+    def _is_line_completed(self, coordinates: tuple[int, int], mark: PlayerMark) -> bool:
+        """
+        Check if a cell is a part of a win length of the same marks in a row.
+
+        Only cells up to a win length away from the cell in each direction are looked up.
+
+        Arguments:
+            coordinates (tuple): a cell's row and column.
+            mark (PlayerMark): the cell's mark.
+
+        Returns:
+            True, if the cell completes a line.
+            Otherwise, False.
+        """
+        row, column = coordinates
+
+        for row_step, column_step in DIRECTIONS:
+            marks_number = 1
+
+            for sign in (1, -1):
+                for distance in range(1, self.win_length):
+                    neighbour = (row + sign * distance * row_step, column + sign * distance * column_step)
+
+                    if self.cells.get(neighbour) is not mark:
+                        break
+
+                    marks_number += 1
+
+            if marks_number >= self.win_length:
+                return True
+
+        return False
+
+    def _get_state(self) -> BoardState:
+        """
+        Get a board's state from its cells.
+
+        Cells are checked in the row-major order.
+
+        Returns:
+             A board's state as a `BoardState`.
+        """
+        players_by_marks = {player.mark: player for player in self.players}
+
+        for coordinates in sorted(self.cells):
+            mark = self.cells[coordinates]
+
+            if self._is_line_completed(coordinates=coordinates, mark=mark):
+                return BoardState(decision=BoardCheckResultDecision.WIN, winning_player=players_by_marks.get(mark))
+
+        if self.is_unbounded:
+            return BoardState(decision=BoardCheckResultDecision.CONTINUE)
+
+        if not self.live_lines_number:
+            return BoardState(decision=BoardCheckResultDecision.TIE)
+
+        return BoardState(decision=BoardCheckResultDecision.CONTINUE)
+
+    def _get_lines_number(self) -> int:
+        """
+        Get a number of winning lines of a bounded board, without building them.
+
+        Returns:
+            The number of lines as an integer, the same as `get_winning_lines` returns.
+        """
+        lines_number = 0
+
+        for row_step, column_step in DIRECTIONS:
+            rows_number = self.height - (self.win_length - 1) * abs(row_step)
+            columns_number = self.size - (self.win_length - 1) * abs(column_step)
+            lines_number += max(rows_number, 0) * max(columns_number, 0)
+
+        return lines_number
+
+    def _get_cell_lines(self, coordinates: tuple[int, int]) -> list[tuple[int, int, int, int]]:
+        """
+        Get winning lines of a bounded board going through a cell.
+
+        Arguments:
+            coordinates (tuple): a cell's row and column.
+
+        Returns:
+            Lines as a list of tuples of their first cell's row and column and their direction's row and column steps.
+        """
+        row, column = coordinates
+        lines = []
+
+        for row_step, column_step in DIRECTIONS:
+            for offset in range(self.win_length):
+                first_row, first_column = row - offset * row_step, column - offset * column_step
+                last_row = first_row + (self.win_length - 1) * row_step
+                last_column = first_column + (self.win_length - 1) * column_step
+
+                are_rows_inside = first_row >= 0 and last_row < self.height
+                are_columns_inside = min(first_column, last_column) >= 0 and max(first_column, last_column) < self.size
+
+                if are_rows_inside and are_columns_inside:
+                    lines.append((first_row, first_column, row_step, column_step))
+
+        return lines
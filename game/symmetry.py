@@ -0,0 +1,167 @@
+"""
+Provide implementation of the game's board symmetries.
+
+A square board has 8 symmetries (the dihedral group of the square): 4 rotations and 4 reflections, a rectangular board
+has 4 of them (identity, 2 reflections and a half-turn rotation) as transposing changes its shape. Positions mapped
+into each other by a symmetry are equivalent, so anything keyed on positions (caches, transposition tables, opening
+books) can store only a canonical representative of them.
+"""
+import itertools
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Optional
+
+from game.utils import WINNING_LINES_CACHE_SIZE
+
+TRANSFORMS = tuple(itertools.product((False, True), repeat=3))
+
+IDENTITY_TRANSFORM = 0
+
+
+@lru_cache(maxsize=WINNING_LINES_CACHE_SIZE)
+def get_positions_maps(size: int, height: Optional[int] = None) -> tuple[tuple[int, ...], ...]:
+    """
+    Get maps of positions for each symmetry of a board.
+
+    A map's element at a position is a position the cell is moved to by the symmetry (the first position is 0). Maps
+    are computed once per shape, the first map is identity. Each symmetry is a combination of flipping rows, flipping
+    columns and transposing (only for a square board), which gives all 4 rotations and 4 reflections.
+
+    Arguments:
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of rows, the same as the size if not specified.
+
+    Returns:
+        Maps of positions as a tuple of tuples of integers.
+    """
+    height = size if height is None else height
+    positions_maps = []
+
+    for is_transposed, are_rows_flipped, are_columns_flipped in TRANSFORMS:
+        if is_transposed and height != size:
+            continue
+
+        positions_map = []
+
+        for position in range(size * height):
+            row, column = divmod(position, size)
+
+            if are_rows_flipped:
+                row = height - 1 - row
+
+            if are_columns_flipped:
+                column = size - 1 - column
+
+            if is_transposed:
+                row, column = column, row
+
+            positions_map.append(row * size + column)
+
+        positions_maps.append(tuple(positions_map))
+
+    return tuple(positions_maps)
+
+
+@lru_cache(maxsize=WINNING_LINES_CACHE_SIZE)
+def get_permutations(size: int, height: Optional[int] = None) -> tuple[tuple[int, ...], ...]:
+    """
+    Get permutations of cells for each symmetry of a board.
+
+    A permutation's element at a position is a position of the cell moved there by the symmetry, so transformed cells
+    are `[cells[position] for position in permutation]`. It is the inverse of a map of positions.
+
+    Arguments:
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of rows, the same as the size if not specified.
+
+    Returns:
+        Permutations as a tuple of tuples of integers.
+    """
+    permutations = []
+
+    for positions_map in get_positions_maps(size=size, height=height):
+        permutation = [0] * len(positions_map)
+
+        for position, transformed_position in enumerate(positions_map):
+            permutation[transformed_position] = position
+
+        permutations.append(tuple(permutation))
+
+    return tuple(permutations)
+
+
+def canonicalize(cells: Sequence, size: int, height: Optional[int] = None) -> tuple[tuple, int]:
+    """
+    Get a canonical representative of a board's cells.
+
+    The canonical representative is the smallest of the cells transformed by each symmetry. Empty cells (`None`) are
+    smaller than marks, marks are compared by their values, so the representative is the same in any process.
+
+    Arguments:
+        cells (Sequence): a board's cells, e.g. as `Board.get()` returns them.
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of rows, the same as the size if not specified.
+
+    Returns:
+        The canonical cells as a tuple and an index of the symmetry transforming the cells to them as a tuple.
+    """
+    canonical_cells, canonical_key, canonical_transform = None, None, IDENTITY_TRANSFORM
+
+    for transform, permutation in enumerate(get_permutations(size=size, height=height)):
+        transformed_cells = tuple(cells[position] for position in permutation)
+        key = tuple(_get_cell_key(cell=cell) for cell in transformed_cells)
+
+        if canonical_key is None or key < canonical_key:
+            canonical_cells, canonical_key, canonical_transform = transformed_cells, key, transform
+
+    return canonical_cells, canonical_transform
+
+
+def transform_position(position: int, transform: int, size: int, height: Optional[int] = None) -> int:
+    """
+    Transform a position of the original cells to a position of the transformed ones.
+
+    Arguments:
+        position (int): a human-readable position meaning first position would be 1.
+        transform (int): an index of a symmetry, as `canonicalize` returns it.
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of rows, the same as the size if not specified.
+
+    Returns:
+        The human-readable transformed position.
+    """
+    return get_positions_maps(size=size, height=height)[transform][position - 1] + 1
+
+
+def restore_position(position: int, transform: int, size: int, height: Optional[int] = None) -> int:
+    """
+    Restore a position of the transformed cells to a position of the original ones.
+
+    It maps a move found on the canonical cells (e.g. stored in an opening book) back through the inverse symmetry.
+
+    Arguments:
+        position (int): a human-readable position meaning first position would be 1.
+        transform (int): an index of a symmetry, as `canonicalize` returns it.
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of rows, the same as the size if not specified.
+
+    Returns:
+        The human-readable original position.
+    """
+    return get_permutations(size=size, height=height)[transform][position - 1] + 1
+
+
+def _get_cell_key(cell: object) -> tuple[bool, str]:
+    """
+    Get a cell's key to compare cells by.
+
+    Arguments:
+        cell (object): a cell, `None` or a mark.
+
+    Returns:
+        The cell's key as a tuple.
+    """
+    if cell is None:
+        return False, ''
+
+    return True, str(getattr(cell, 'value', cell))
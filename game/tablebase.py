@@ -0,0 +1,637 @@
+"""
+Provide implementation of the game's endgame tablebase for boards of up to 16 cells, e.g. 4x4.
+
+A tablebase labels every position of two players, the first player moves first, with its value for a player to move
+and a number of moves to the end of the game with a perfect play. Positions are indexed by a perfect index: positions
+are grouped into layers by a number of marks, and within a layer a position is the rank of the first player's cells
+among combinations of all cells, times a number of the second player's combinations, plus the rank of the second
+player's cells among combinations of the remaining cells (both ranks are colexicographic). So every index is a
+position and a 4x4 tablebase is 10,165,779 bytes.
+
+A tablebase's file is a header (`MAGIC`, a version byte, a size, a height and a win length bytes) followed by a byte per
+position: the lowest two bits are the position's value (`0` if it is not reachable, e.g. a player to move has a line),
+the next bits are a number of moves to the end of the game.
+
+Usage (build a tablebase): python3 -m game.tablebase [path] [--size 4] [--workers 8]
+"""
+import argparse
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from game.board import Board
+from game.dto import Player
+from game.enums import PositionValue
+from game.exceptions import (
+    TablebaseBoardIsNotSupportedException,
+    TablebaseFileIsInvalidException,
+    TablebasePositionIsNotReachableException,
+)
+from game.perfect_play import (
+    CODES_VALUES,
+    UNREACHABLE_SLOT,
+    VALUES_CODES,
+)
+from game.utils import get_winning_lines
+
+MAGIC = b'TTTB'
+VERSION = 1
+HEADER = struct.Struct('<4sBBBB')
+
+PLAYERS_NUMBER = 2
+MAX_CELLS_NUMBER = 16
+
+EMPTY_CELL = 0
+VALUE_BITS_MASK = 0b11
+DISTANCE_BITS_SHIFT = 2
+
+SCORE_BASE = 32
+WIN_SCORE = VALUES_CODES[PositionValue.WIN] * SCORE_BASE
+TIE_SCORE = VALUES_CODES[PositionValue.TIE] * SCORE_BASE
+LOSS_SCORE = VALUES_CODES[PositionValue.LOSS] * SCORE_BASE
+
+DEFAULT_PATH = Path(__file__).parent / 'data' / 'tablebase-4x4.bin'
+
+
+@lru_cache(maxsize=1)
+def get_popcounts() -> np.ndarray:
+    """
+    Get numbers of set bits of all masks of cells.
+
+    Returns:
+        Numbers of set bits by masks as an integer array of `2 ** MAX_CELLS_NUMBER` elements.
+    """
+    popcounts = np.zeros(1 << MAX_CELLS_NUMBER, dtype=np.int64)
+
+    for bit in range(MAX_CELLS_NUMBER):
+        popcounts[1 << bit:1 << (bit + 1)] = popcounts[:1 << bit] + 1
+
+    return popcounts
+
+
+@lru_cache(maxsize=1)
+def get_binomials() -> np.ndarray:
+    """
+    Get binomial coefficients of up to a maximum number of cells.
+
+    Returns:
+        Binomial coefficients `C(n, k)` as an integer array indexed by `n` and `k`, `0` if `k > n`.
+    """
+    return np.array(
+        [[comb(n, k) for k in range(MAX_CELLS_NUMBER + 2)] for n in range(MAX_CELLS_NUMBER + 1)],
+        dtype=np.int64,
+    )
+
+
+def get_ranks(masks: np.ndarray, bits_number: int) -> np.ndarray:
+    """
+    Get colexicographic ranks of combinations.
+
+    A combination of cells `c1 < c2 < ... < ck` is ranked as `C(c1, 1) + C(c2, 2) + ... + C(ck, k)`, so ranks of all
+    combinations of `k` of `n` cells are exactly `0` to `C(n, k) - 1`.
+
+    Arguments:
+        masks (np.ndarray): combinations as an integer array of masks of cells.
+        bits_number (int): a number of cells.
+
+    Returns:
+        The ranks as an integer array.
+    """
+    popcounts, binomials = get_popcounts(), get_binomials()
+    masks = masks.astype(np.int64)
+    ranks = np.zeros(masks.shape, dtype=np.int64)
+
+    for bit in range(bits_number):
+        is_set = (masks >> bit) & 1
+        ranks += is_set * binomials[bit, popcounts[masks & ((1 << bit) - 1)] + 1]
+
+    return ranks
+
+
+@lru_cache(maxsize=MAX_CELLS_NUMBER * MAX_CELLS_NUMBER)
+def get_combinations(bits_number: int, length: int) -> np.ndarray:
+    """
+    Get all combinations of cells in the order of their ranks.
+
+    Arguments:
+        bits_number (int): a number of cells.
+        length (int): a number of cells in a combination.
+
+    Returns:
+        Combinations as an integer array of masks of cells, a combination's index is its rank.
+    """
+    masks = np.array(
+        [sum(1 << bit for bit in combination) for combination in combinations(range(bits_number), length)],
+        dtype=np.int64,
+    )
+    ordered_masks = np.empty_like(masks)
+    ordered_masks[get_ranks(masks=masks, bits_number=bits_number)] = masks
+
+    return ordered_masks
+
+
+def get_layer_shape(cells_number: int, marks_number: int) -> tuple[int, int]:
+    """
+    Get a shape of a layer of positions with a number of marks.
+
+    Arguments:
+        cells_number (int): a number of board's cells.
+        marks_number (int): a number of marks on a board.
+
+    Returns:
+        Numbers of combinations of the first player's cells (rows) and of the second player's cells (columns) as a
+        tuple.
+    """
+    first_marks_number, second_marks_number = (marks_number + 1) // 2, marks_number // 2
+    return comb(cells_number, first_marks_number), comb(cells_number - first_marks_number, second_marks_number)
+
+
+@lru_cache(maxsize=MAX_CELLS_NUMBER)
+def get_layers_offsets(cells_number: int) -> tuple[int, ...]:
+    """
+    Get offsets of layers of positions by numbers of marks.
+
+    Arguments:
+        cells_number (int): a number of board's cells.
+
+    Returns:
+        Offsets of layers as a tuple of integers, the last one is a number of all positions.
+    """
+    offsets = [0]
+
+    for marks_number in range(cells_number + 1):
+        rows, columns = get_layer_shape(cells_number=cells_number, marks_number=marks_number)
+        offsets.append(offsets[-1] + rows * columns)
+
+    return tuple(offsets)
+
+
+def get_position_index(cells: list[int]) -> int:
+    """
+    Get a position's index in a tablebase.
+
+    Arguments:
+        cells (list): cells as a list of `0`, `1` (the first player's mark) or `2` (the second player's mark).
+
+    Raises:
+        TablebasePositionIsNotReachableException: if players' numbers of marks are not reachable in turns.
+
+    Returns:
+        The position's index as an integer.
+    """
+    first_cells = [position for position, cell in enumerate(cells) if cell == 1]
+    free_cells = [position for position, cell in enumerate(cells) if cell != 1]
+    second_cells = [index for index, position in enumerate(free_cells) if cells[position] == 2]  # noqa: PLR2004
+
+    marks_number = len(first_cells) + len(second_cells)
+
+    if len(first_cells) != (marks_number + 1) // 2:
+        raise TablebasePositionIsNotReachableException
+
+    first_rank = sum(comb(cell, index + 1) for index, cell in enumerate(first_cells))
+    second_rank = sum(comb(cell, index + 1) for index, cell in enumerate(second_cells))
+    _, columns = get_layer_shape(cells_number=len(cells), marks_number=marks_number)
+
+    return get_layers_offsets(cells_number=len(cells))[marks_number] + first_rank * columns + second_rank
+
+
+def build_tablebase(
+    path: Path = DEFAULT_PATH,
+    size: int = 4,
+    height: Optional[int] = None,
+    win_length: Optional[int] = None,
+    workers: int = 1,
+) -> None:
+    """
+    Build a tablebase with retrograde analysis and write it to a file.
+
+    Layers are solved from a full board back to an empty one. Terminal positions are labeled as `Board.check` would
+    decide them: a position where a player who has just moved has a line is a loss for a player to move, a position
+    without live lines (every line holds marks of both players) is a tie, both in 0 moves. Other positions take the
+    best value of their moves from the next layer: the fastest win, the fastest tie, or the slowest loss. Positions of
+    a layer do not depend on each other, so each layer is split into chunks of rows solved by worker processes, which
+    share the file memory-mapped.
+
+    Arguments:
+        path (Path): a path to write the tablebase to.
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of board's rows, the same as the size if not specified (a perfect square).
+        win_length (int): a number of marks in a row needed to win, the shortest side if not specified.
+        workers (int): a number of worker processes, layers are solved in the current process if `1`.
+
+    Raises:
+        TablebaseBoardIsNotSupportedException: if a board has more than `MAX_CELLS_NUMBER` cells.
+    """
+    height = size if height is None else height
+    win_length = min(size, height) if win_length is None else win_length
+    cells_number = size * height
+
+    if cells_number > MAX_CELLS_NUMBER:
+        raise TablebaseBoardIsNotSupportedException
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with path.open('wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, size, height, win_length))
+        file.truncate(HEADER.size + get_layers_offsets(cells_number=cells_number)[-1])
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    try:
+        for marks_number in reversed(range(cells_number + 1)):
+            rows, _ = get_layer_shape(cells_number=cells_number, marks_number=marks_number)
+            chunks = [(rows * index // workers, rows * (index + 1) // workers) for index in range(workers)]
+            arguments = [
+                (path, size, height, win_length, marks_number, start, end) for start, end in chunks if start < end
+            ]
+
+            if executor is None:
+                for arguments_ in arguments:
+                    _solve_chunk(*arguments_)
+
+            else:
+                list(executor.map(_solve_chunk, *zip(*arguments, strict=True)))
+
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _solve_chunk(  # noqa: PLR0913
+    path: Path,
+    size: int,
+    height: int,
+    win_length: int,
+    marks_number: int,
+    start: int,
+    end: int,
+) -> None:
+    """
+    Solve a chunk of rows of a layer and write it to a tablebase's file, the next layer has to be solved.
+
+    Arguments:
+        path (Path): a path to the tablebase.
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of board's rows.
+        win_length (int): a number of marks in a row needed to win.
+        marks_number (int): a number of marks of the layer's positions.
+        start (int): the first row of the chunk.
+        end (int): a row after the last row of the chunk.
+    """
+    cells_number = size * height
+    offsets = get_layers_offsets(cells_number=cells_number)
+    first_marks_number, second_marks_number = (marks_number + 1) // 2, marks_number // 2
+    free_cells_number = cells_number - first_marks_number
+    side = marks_number % PLAYERS_NUMBER
+
+    _, columns = get_layer_shape(cells_number=cells_number, marks_number=marks_number)
+    first_masks = get_combinations(bits_number=cells_number, length=first_marks_number)[start:end]
+    second_relative_masks = get_combinations(bits_number=free_cells_number, length=second_marks_number)
+
+    is_cell_free = (first_masks[:, None] >> np.arange(cells_number)) & 1 == 0
+    cells = np.broadcast_to(np.arange(cells_number), is_cell_free.shape)
+    free_cells = cells[is_cell_free].reshape(len(first_masks), free_cells_number)
+
+    second_masks = np.zeros((len(first_masks), columns), dtype=np.int64)
+
+    for bit in range(free_cells_number):
+        second_masks |= ((second_relative_masks >> bit) & 1)[None, :] << free_cells[:, bit][:, None]
+
+    lines_masks = [sum(1 << cell for cell in line) for line in get_winning_lines(size, height, win_length)]
+    first_has_line = np.zeros(first_masks.shape, dtype=bool)
+    second_has_line = np.zeros(second_masks.shape, dtype=bool)
+    has_live_line = np.zeros(second_masks.shape, dtype=bool)
+
+    for line_mask in lines_masks:
+        first_has_line |= (first_masks & line_mask) == line_mask
+        second_has_line |= (second_masks & line_mask) == line_mask
+        has_live_line |= ((first_masks & line_mask) == 0)[:, None] | ((second_masks & line_mask) == 0)
+
+    first_has_line = np.broadcast_to(first_has_line[:, None], second_masks.shape)
+
+    if side == 0:
+        mover_has_line, side_has_line = second_has_line, first_has_line
+
+    else:
+        mover_has_line, side_has_line = first_has_line, second_has_line
+
+    slots = np.full(second_masks.shape, UNREACHABLE_SLOT, dtype=np.uint8)
+    is_lost = mover_has_line & ~side_has_line
+    is_tied = ~mover_has_line & ~side_has_line & ~has_live_line
+    is_open = ~mover_has_line & ~side_has_line & has_live_line
+    slots[is_lost] = VALUES_CODES[PositionValue.LOSS]
+    slots[is_tied] = VALUES_CODES[PositionValue.TIE]
+
+    if is_open.any():
+        scores = _get_moves_scores(
+            path=path,
+            cells_number=cells_number,
+            marks_number=marks_number,
+            first_ranks=np.arange(start, end),
+            first_masks=first_masks,
+            free_cells=free_cells,
+            second_relative_masks=second_relative_masks,
+        )
+        slots[is_open] = _get_slots(scores=scores)[is_open]
+
+    table = np.memmap(
+        path,
+        dtype=np.uint8,
+        mode='r+',
+        offset=HEADER.size + offsets[marks_number] + start * columns,
+        shape=(slots.size,),
+    )
+    table[:] = slots.ravel()
+    table.flush()
+
+
+def _get_moves_scores(  # noqa: PLR0913
+    path: Path,
+    cells_number: int,
+    marks_number: int,
+    first_ranks: np.ndarray,
+    first_masks: np.ndarray,
+    free_cells: np.ndarray,
+    second_relative_masks: np.ndarray,
+) -> np.ndarray:
+    """
+    Get scores of the best moves of a chunk of rows of a layer from the next layer.
+
+    A move's score orders its value for a player to move: the fastest win is the highest, then the fastest tie, then
+    the slowest loss. Ranks of positions after a move are computed on combinations of a single player, not on whole
+    positions: a first player's move adds a cell to its combination and removes it from free cells, which removes a bit
+    from the second player's relative combination; a second player's move adds a bit to its relative combination.
+
+    Arguments:
+        path (Path): a path to the tablebase.
+        cells_number (int): a number of board's cells.
+        marks_number (int): a number of marks of the layer's positions.
+        first_ranks (np.ndarray): ranks of the chunk's rows.
+        first_masks (np.ndarray): the first player's combinations of the chunk's rows.
+        free_cells (np.ndarray): cells free of the first player's marks of each row, in order.
+        second_relative_masks (np.ndarray): the second player's combinations of free cells of the layer's columns.
+
+    Returns:
+        Scores of the best moves as an integer array of the chunk's positions.
+    """
+    offsets = get_layers_offsets(cells_number=cells_number)
+    free_cells_number = free_cells.shape[1]
+    side = marks_number % PLAYERS_NUMBER
+
+    next_table = np.memmap(
+        path,
+        dtype=np.uint8,
+        mode='r',
+        offset=HEADER.size + offsets[marks_number + 1],
+        shape=(offsets[marks_number + 2] - offsets[marks_number + 1],),
+    )
+    _, next_columns = get_layer_shape(cells_number=cells_number, marks_number=marks_number + 1)
+    moves_scores = _get_moves_scores_by_slots()
+
+    best_scores = np.zeros((len(first_masks), len(second_relative_masks)), dtype=np.int64)
+
+    for bit in range(free_cells_number):
+        is_empty = (second_relative_masks >> bit) & 1 == 0
+        low_bits = second_relative_masks & ((1 << bit) - 1)
+
+        if side == 0:
+            next_first_ranks = get_ranks(masks=first_masks | (1 << free_cells[:, bit]), bits_number=cells_number)
+            next_second_masks = low_bits | ((second_relative_masks >> (bit + 1)) << bit)
+            next_second_ranks = get_ranks(masks=next_second_masks, bits_number=free_cells_number - 1)
+
+        else:
+            next_first_ranks = first_ranks
+            next_second_ranks = get_ranks(masks=second_relative_masks | (1 << bit), bits_number=free_cells_number)
+
+        next_indexes = next_first_ranks[:, None] * next_columns + np.where(is_empty, next_second_ranks, 0)[None, :]
+        scores = np.where(is_empty[None, :], moves_scores[next_table[next_indexes]], 0)
+        np.maximum(best_scores, scores, out=best_scores)
+
+    return best_scores
+
+
+@lru_cache(maxsize=1)
+def _get_moves_scores_by_slots() -> np.ndarray:
+    """
+    Get scores of moves by slots of positions after them.
+
+    Returns:
+        Scores as an integer array indexed by slots, `0` for unreachable positions.
+    """
+    scores = np.zeros(1 << 8, dtype=np.int64)
+
+    for slot in range(1, 1 << 8):
+        code, distance = slot & VALUE_BITS_MASK, (slot >> DISTANCE_BITS_SHIFT) + 1
+
+        if code == VALUES_CODES[PositionValue.LOSS]:
+            scores[slot] = WIN_SCORE + SCORE_BASE - 1 - distance
+
+        elif code == VALUES_CODES[PositionValue.TIE]:
+            scores[slot] = TIE_SCORE + SCORE_BASE - 1 - distance
+
+        elif code == VALUES_CODES[PositionValue.WIN]:
+            scores[slot] = LOSS_SCORE + distance
+
+    return scores
+
+
+def _get_slots(scores: np.ndarray) -> np.ndarray:
+    """
+    Get slots of positions by scores of their best moves.
+
+    Arguments:
+        scores (np.ndarray): scores of the best moves.
+
+    Returns:
+        The slots as a byte array.
+    """
+    return np.select(
+        [scores >= WIN_SCORE, scores >= TIE_SCORE],
+        [
+            VALUES_CODES[PositionValue.WIN] | (WIN_SCORE + SCORE_BASE - 1 - scores) << DISTANCE_BITS_SHIFT,
+            VALUES_CODES[PositionValue.TIE] | (TIE_SCORE + SCORE_BASE - 1 - scores) << DISTANCE_BITS_SHIFT,
+        ],
+        VALUES_CODES[PositionValue.LOSS] | (scores - LOSS_SCORE) << DISTANCE_BITS_SHIFT,
+    ).astype(np.uint8)
+
+
+class Tablebase:
+    """
+    Tablebase implementation.
+
+    The tablebase is memory-mapped read-only, so any number of processes share a single page-cached copy of it, and a
+    position's lookup is a single byte read at its perfect index.
+    """
+
+    def __init__(self, path: Path = DEFAULT_PATH) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            path (Path): a path to the tablebase built by `build_tablebase`.
+
+        Raises:
+            TablebaseFileIsInvalidException: if the file is not a tablebase or is of an unsupported version.
+        """
+        with Path(path).open('rb') as file:
+            self._table = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.size, self.height, self.win_length = HEADER.unpack_from(self._table)
+
+        if magic != MAGIC or version != VERSION:
+            self._table.close()
+            raise TablebaseFileIsInvalidException
+
+    def close(self) -> None:
+        """
+        Close the tablebase.
+        """
+        self._table.close()
+
+    def probe(self, board: Board) -> tuple[PositionValue, int]:
+        """
+        Probe a board's position with a perfect play.
+
+        Arguments:
+            board (Board): a game's board.
+
+        Returns:
+            The position's value for a player to move as a `PositionValue` and a number of moves to the end of the
+            game as a tuple.
+        """
+        slot = self._get_slot(cells=self._get_cells(board=board))
+        return CODES_VALUES[slot & VALUE_BITS_MASK], slot >> DISTANCE_BITS_SHIFT
+
+    def evaluate(self, board: Board) -> PositionValue:
+        """
+        Evaluate a board's position with a perfect play.
+
+        Arguments:
+            board (Board): a game's board.
+
+        Returns:
+            The position's value for a player to move as a `PositionValue`.
+        """
+        value, _ = self.probe(board=board)
+        return value
+
+    def best_move(self, board: Board) -> Optional[int]:
+        """
+        Get the best move on a board with a perfect play: the fastest win, the fastest tie or the slowest loss.
+
+        Arguments:
+            board (Board): a game's board.
+
+        Returns:
+            A human-readable position meaning first position would be 1, `None` if the game is over.
+        """
+        cells = self._get_cells(board=board)
+        slot = self._get_slot(cells=cells)
+
+        if not slot >> DISTANCE_BITS_SHIFT:
+            return None
+
+        moves_scores = _get_moves_scores_by_slots()
+        code = cells.count(1) - cells.count(2) + 1
+        best_score, best_position = None, None
+
+        for position, cell in enumerate(cells):
+            if cell != EMPTY_CELL:
+                continue
+
+            cells[position] = code
+            score = moves_scores[self._get_slot(cells=cells)]
+            cells[position] = EMPTY_CELL
+
+            if best_score is None or score > best_score:
+                best_score, best_position = score, position + 1
+
+        return best_position
+
+    def get_move(self, board: Board, player: Player) -> Optional[int]:  # noqa: ARG002
+        """
+        Get the best move of a player on a board, so the tablebase can be used as a game's engine.
+
+        Arguments:
+            board (Board): a game's board.
+            player (Player): a player to move, it is always defined by the board's marks.
+
+        Returns:
+            A human-readable position meaning first position would be 1, `None` if the game is over.
+        """
+        return self.best_move(board=board)
+
+    def _get_cells(self, board: Board) -> list[int]:
+        """
+        Get cells of a board's position, the first board's player is considered to move first.
+
+        Arguments:
+            board (Board): a game's board.
+
+        Raises:
+            TablebaseBoardIsNotSupportedException: if a board's shape is not the tablebase's one or has not two players.
+
+        Returns:
+            Cells as a list of `0`, `1` or `2`.
+        """
+        is_board_supported = (board.size, board.height, board.win_length) == (self.size, self.height, self.win_length)
+
+        if not is_board_supported or board.players_number != PLAYERS_NUMBER:
+            raise TablebaseBoardIsNotSupportedException
+
+        marks_codes = {player.mark: index + 1 for index, player in enumerate(board.players)}
+        return [marks_codes.get(cell, EMPTY_CELL) for cell in board.get()]
+
+    def _get_slot(self, cells: list[int]) -> int:
+        """
+        Get a byte of a position.
+
+        Arguments:
+            cells (list): cells as a list of `0`, `1` or `2`.
+
+        Raises:
+            TablebasePositionIsNotReachableException: if the position is not reachable.
+
+        Returns:
+            The position's byte as an integer.
+        """
+        slot = self._table[HEADER.size + get_position_index(cells=cells)]
+
+        if slot == UNREACHABLE_SLOT:
+            raise TablebasePositionIsNotReachableException
+
+        return slot
+
+
+def main() -> None:
+    """
+    Build a tablebase from a command line.
+    """
+    parser = argparse.ArgumentParser(description='Build an endgame tablebase with retrograde analysis.')
+    parser.add_argument('path', nargs='?', type=Path, default=DEFAULT_PATH, help='a path to write the tablebase to')
+    parser.add_argument('--size', type=int, default=4, help='a number of positions per row')
+    parser.add_argument('--height', type=int, help='a number of rows, the same as the size if not specified')
+    parser.add_argument('--win-length', type=int, help='a number of marks in a row needed to win')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='a number of worker processes')
+    arguments = parser.parse_args()
+
+    build_tablebase(
+        path=arguments.path,
+        size=arguments.size,
+        height=arguments.height,
+        win_length=arguments.win_length,
+        workers=arguments.workers,
+    )
+
+
+if __name__ == '__main__':
+    main()
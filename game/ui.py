@@ -1,6 +1,12 @@
 """
 Provide implementation of the game's UI.
 """
+import sys
+from typing import (
+    Optional,
+    TextIO,
+)
+
 from game.board import Board
 from game.dto import Player
 
@@ -22,111 +28,140 @@ class Ui:
     EMPTY_LINE = ''
 
     HOW_TO_PLAY = """
-    1. The game is played on a grid that's 3 squares by 3 squares.
+    1. The game is played on a grid that's {size} squares by {height} squares.
     2. You are «x», your friend is «o». Players take turns putting their marks in empty squares.
-    3. The first player to get 3 of her marks in a row (up, down, across, or diagonally) is the winner.
-    4. When all 9 squares are full, the game is over. If no player has 3 marks in a row, the game ends in a tie.
+    3. The first player to get {win_length} of her marks in a row (up, down, across, or diagonally) is the winner.
+    4. When no player can get {win_length} marks in a row anymore, the game is over and ends in a tie.
+    5. Enter a square's position from 1 to {positions_number}, squares are numbered row by row from the top left one.
 
     More info: https://en.wikipedia.org/wiki/Tic-tac-toe
     """
 
-    BOARD_TEMPLATE = """
-     {one} | {two} | {three}
-    ———+———+———
-     {four} | {five} | {six}
-    ———+———+———
-     {seven} | {eight} | {nine}
-    """
+    INDENT = '    '
+    CELLS_SEPARATOR = '|'
+    ROWS_SEPARATOR = '—'
+    ROWS_SEPARATORS_CROSS = '+'
+    CELL_PADDING = 1
+
+    PLACEHOLDERS = str.maketrans('0123456789', '⁰¹²³⁴⁵⁶⁷⁸⁹')
 
-    BOARD_KEYWORDS = ('one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine')
-
-    BOARD_POSITIONS_TO_KEYWORDS = {
-        1: 'one',
-        2: 'two',
-        3: 'three',
-        4: 'four',
-        5: 'five',
-        6: 'six',
-        7: 'seven',
-        8: 'eight',
-        9: 'nine',
-    }
-
-    BOARD_POSITIONS_TO_PLACEHOLDERS = {
-        1: '¹',
-        2: '²',
-        3: '³',
-        4: '⁴',
-        5: '⁵',
-        6: '⁶',
-        7: '⁷',
-        8: '⁸',
-        9: '⁹',
-    }
-
-    def __init__(self, board: Board) -> None:
+    CURSOR_UP = '\033[{lines}A'
+    CURSOR_DOWN = '\033[{lines}B'
+    CURSOR_TO_COLUMN = '\033[{column}G'
+    CLEAR_TO_SCREEN_END = '\r\033[J'
+
+    def __init__(self, board: Board, output: Optional[TextIO] = None, is_incremental: Optional[bool] = None) -> None:
         """
         Construct the object.
 
         Arguments:
             board (Board): a game's board.
+            output (TextIO): a stream to write to, the standard output at the moment of writing if not specified.
+            is_incremental (bool): whether to redraw only changed cells of a shown board with ANSI cursor moves, only
+                if the output is a terminal if not specified.
         """
         self.board = board
+        self.output = output
+        self.is_incremental = is_incremental
+
+        self._cell_width = len(str(self.board.board_positions_number))
+        self._template = self._build_template()
+        self._frame = None
+        self._lines_below_frame = 0
 
     def show_current_board(self) -> None:
         """
         Show current board.
+
+        The board's template (rows of cells' slots and separators) is built once for the board's shape. The first
+        board is written whole, then, in the incremental mode, only cells changed since the last shown board are
+        redrawn in place with ANSI cursor moves, so the board does not scroll, and lines written below it (prompts
+        and messages) are cleared. Either way, a board is a single write to the output.
         """
-        board = self.board.get()
+        cells = list(self.board.get())
+
+        if self._frame is None or len(self._frame) != len(cells) or not self._is_incremental():
+            self._write(text=self._render_board(cells=cells))
+            self._frame = cells
+            self._lines_below_frame = 0
+            return
+
+        frame_lines = len(self._template) + 1
+        changes = []
+
+        for computer_position, (cell, previous_cell) in enumerate(zip(cells, self._frame, strict=True)):
+            if cell is previous_cell:
+                continue
 
-        template_arguments = {}
+            row, column = divmod(computer_position, self.board.size)
+            lines = self._lines_below_frame + frame_lines - row * 2
 
-        for computer_position, cell in enumerate(board):
-            human_position = computer_position + 1
+            changes.append(self.CURSOR_UP.format(lines=lines))
+            changes.append(self.CURSOR_TO_COLUMN.format(column=self._get_cell_column(column=column)))
+            changes.append(self._render_cell(computer_position=computer_position, cell=cell))
+            changes.append(self.CURSOR_DOWN.format(lines=lines))
 
-            placeholder = Ui.BOARD_POSITIONS_TO_PLACEHOLDERS[human_position]
-            template_keyword = Ui.BOARD_POSITIONS_TO_KEYWORDS[human_position]
+        if self._lines_below_frame:
+            changes.append(self.CURSOR_UP.format(lines=self._lines_below_frame))
 
-            if cell is self.board.EMPTY_CELL:
-                template_arguments[template_keyword] = self._colorize_placeholder(placeholder=placeholder)
+        changes.append(self.CLEAR_TO_SCREEN_END)
 
-            else:
-                template_arguments[template_keyword] = cell.value
+        self._write(text=''.join(changes))
+        self._frame = cells
+        self._lines_below_frame = 0
 
-        board_as_string = Ui.BOARD_TEMPLATE.format(**template_arguments)
-        print(board_as_string)
+    def ask_position(self, player: Player) -> str:
+        """
+        Ask a player to enter a position.
+
+        Arguments:
+            player (Player): a player to move.
+
+        Returns:
+            The entered text as a string.
+        """
+        text = input(f'Player {player.mark.value}, enter a position: ')
+        self._lines_below_frame += 1
+
+        return text
 
     def show_break(self) -> None:
         """
         Show a break line.
         """
-        print(self.BREAK)
+        self._write(text=f'{self.BREAK}\n')
 
     def show_empty_line(self) -> None:
         """
         Show an empty line.
         """
-        print(self.EMPTY_LINE)
+        self._write(text=f'{self.EMPTY_LINE}\n')
 
     def show_title(self) -> None:
         """
         Show a title of the game.
         """
-        print(self.TITLE)
+        self._write(text=f'{self.TITLE}\n')
         self.show_break()
 
     def show_how_to_play(self) -> None:
         """
-        Show how to play the game.
+        Show how to play the game on the board's shape.
         """
-        print(self.HOW_TO_PLAY)
+        how_to_play = self.HOW_TO_PLAY.format(
+            size=self.board.size,
+            height=self.board.height,
+            win_length=self.board.win_length,
+            positions_number=self.board.board_positions_number,
+        )
+        self._write(text=f'{how_to_play}\n')
         self.show_break()
 
     def show_tie_result(self) -> None:
         """
         Show a game's tie result.
         """
-        print('The game has ended. The result of the game is tie.')
+        self._write(text='The game has ended. The result of the game is tie.\n')
         self.show_empty_line()
 
     def show_win_result(self, player: Player) -> None:
@@ -136,14 +171,16 @@ class Ui:
         Arguments:
             player (Player): a game's player.
         """
-        print(f'The game has ended. The result of the game is a win by player {player.mark.value}.')
+        self._write(text=f'The game has ended. The result of the game is a win by player {player.mark.value}.\n')
         self.show_empty_line()
 
     def show_position_is_invalid(self) -> None:
         """
         Show position is invalid message.
         """
-        print('Position the player enters is not valid. It should be one of the numbers you see on the board.')
+        self._write(
+            text='Position the player enters is not valid. It should be one of the numbers you see on the board.\n',
+        )
         self.show_empty_line()
 
     def _colorize_placeholder(self, placeholder: str) -> str:
@@ -159,3 +196,122 @@ class Ui:
             The colorized placeholder as a string.
         """
         return f'\033[90m{placeholder}\033[0m'
+
+    def _is_incremental(self) -> bool:
+        """
+        Check if shown boards are redrawn incrementally.
+
+        Returns:
+            True if only changed cells are redrawn, otherwise False.
+        """
+        if self.is_incremental is not None:
+            return self.is_incremental
+
+        return self._get_output().isatty()
+
+    def _get_output(self) -> TextIO:
+        """
+        Get a stream to write to.
+
+        Returns:
+            The stream as a `TextIO`.
+        """
+        return sys.stdout if self.output is None else self.output
+
+    def _write(self, text: str) -> None:
+        """
+        Write a text to the output at once and flush it.
+
+        Lines of the text are counted, so an incremental redraw gets back from them to a shown board.
+
+        Arguments:
+            text (str): a text to write.
+        """
+        output = self._get_output()
+        output.write(text)
+        output.flush()
+
+        self._lines_below_frame += text.count('\n')
+
+    def _build_template(self) -> list[str]:
+        """
+        Build a board's template for the board's shape.
+
+        Returns:
+            Rows of cells' slots (`{}`) and rows' separators as a list of strings, the first row of slots is the first.
+        """
+        slot = ' ' * self.CELL_PADDING + '{}' + ' ' * self.CELL_PADDING
+
+        cells_row = self.INDENT + self.CELLS_SEPARATOR.join([slot] * self.board.size).rstrip()
+        separator = self.INDENT + self.ROWS_SEPARATORS_CROSS.join(
+            [self.ROWS_SEPARATOR * (self._cell_width + 2 * self.CELL_PADDING)] * self.board.size,
+        )
+
+        template = []
+
+        for row in range(self.board.height):
+            if row:
+                template.append(separator)
+
+            template.append(cells_row)
+
+        return template
+
+    def _render_board(self, cells: list) -> str:
+        """
+        Render a whole board.
+
+        Arguments:
+            cells (list): the board's cells.
+
+        Returns:
+            The board as a string, surrounded by empty lines.
+        """
+        size = self.board.size
+        rendered_cells = [
+            self._render_cell(computer_position=computer_position, cell=cell)
+            for computer_position, cell in enumerate(cells)
+        ]
+
+        lines = []
+
+        for index, line in enumerate(self._template):
+            if index % 2:
+                lines.append(line)
+                continue
+
+            row = index // 2
+            lines.append(line.format(*rendered_cells[row * size:(row + 1) * size]))
+
+        return '\n' + '\n'.join(lines) + '\n\n'
+
+    def _render_cell(self, computer_position: int, cell: object) -> str:
+        """
+        Render a board's cell: its mark or a position's placeholder, padded to a cell's width (digits of the last
+        position).
+
+        Arguments:
+            computer_position (int): the cell's position, the first position is 0.
+            cell (object): the cell's mark or `None`.
+
+        Returns:
+            The rendered cell as a string.
+        """
+        if cell is self.board.EMPTY_CELL:
+            placeholder = str(computer_position + 1).translate(self.PLACEHOLDERS)
+            return self._colorize_placeholder(placeholder=placeholder.ljust(self._cell_width))
+
+        return cell.value.ljust(self._cell_width)
+
+    def _get_cell_column(self, column: int) -> int:
+        """
+        Get a terminal's column of a board's cell.
+
+        Arguments:
+            column (int): the cell's column on the board, the first column is 0.
+
+        Returns:
+            The terminal's column, the first column is 1.
+        """
+        cell_width = self._cell_width + 2 * self.CELL_PADDING + len(self.CELLS_SEPARATOR)
+        return len(self.INDENT) + column * cell_width + self.CELL_PADDING + 1
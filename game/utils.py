@@ -2,8 +2,27 @@
 Provide implementation of the game's utils.
 """
 import math
+import random
+from functools import lru_cache
+from typing import Optional
 
-from game.exceptions import ListIsNotPerfectSquareException
+from game.enums import PlayerMark
+from game.exceptions import (
+    ListIsNotPerfectSquareException,
+    ListIsNotRectangleException,
+)
+
+WINNING_LINES_CACHE_SIZE = 64
+
+DIRECTIONS = (
+    (0, 1),
+    (1, 0),
+    (1, 1),
+    (1, -1),
+)
+
+ZOBRIST_SEED = 0x9E3779B97F4A7C15
+ZOBRIST_KEY_BITS = 64
 
 
 def get_horizontal_sublists(list_: list, chunks: int) -> list[list]:
@@ -55,46 +74,61 @@ def get_vertical_sublists(list_: list, chunks: int) -> list[list]:
     return sublists
 
 
-def get_diagonal_sublists(list_: list) -> list[list]:
+def get_diagonal_sublists(list_: list, chunks: Optional[int] = None, min_length: Optional[int] = None) -> list[list]:
     """
     Get «diagonal» sublists.
 
-    It «diagonally» partitions a given list into sublists: the first sublist represents the elements along the main
-    diagonal, and the second sublist represents the elements along the secondary diagonal of the square matrix.
+    It «diagonally» partitions a given list, representing a matrix with rows of a specified number of elements
+    (chunks), into sublists: first the diagonals going down and right, then the diagonals going down and left, each
+    ordered by their first element. Only diagonals of at least a minimum length are returned, by default it is the
+    shortest side of the matrix, so for a square matrix these are the main and the secondary diagonals.
 
     Arguments:
         list_ (list): a list.
+        chunks (int): number of elements of the matrix's rows, if not specified, the matrix is a perfect square.
+        min_length (int): minimum number of elements of the diagonals.
 
     Raises:
         ListIsNotPerfectSquareException: if the list, representing a matrix, is not a perfect square.
+        ListIsNotRectangleException: if the list, representing a matrix, is not a rectangle of rows of chunks.
 
     Returns:
         A «diagonally» partitioned list.
     """
     list_length = len(list_)
 
-    if list_length != math.isqrt(list_length) ** 2:
-        raise ListIsNotPerfectSquareException
+    if chunks is None:
+        if list_length != math.isqrt(list_length) ** 2:
+            raise ListIsNotPerfectSquareException
+
+        chunks = math.isqrt(list_length)
+
+    elif list_length % chunks:
+        raise ListIsNotRectangleException
+
+    width, height = chunks, list_length // chunks
+
+    if min_length is None:
+        min_length = min(width, height)
 
-    size = math.isqrt(list_length)
+    first_elements = [(0, column) for column in range(width)]
+    down_right_starts = first_elements + [(row, 0) for row in range(1, height)]
+    down_left_starts = first_elements + [(row, width - 1) for row in range(1, height)]
 
-    first_diagonal_sublist = []
-    increment = 0
+    sublists = []
 
-    for _ in range(size):
-        element = list_[increment]
-        first_diagonal_sublist.append(element)
-        increment += size + 1
+    for starts, column_step in [(sorted(down_right_starts), 1), (sorted(down_left_starts), -1)]:
+        for row, column in starts:
+            length = min(height - row, width - column if column_step > 0 else column + 1)
 
-    second_diagonal_sublist = []
-    increment = size - 1
+            if length < min_length:
+                continue
 
-    for _ in range(size):
-        element = list_[increment]
-        second_diagonal_sublist.append(element)
-        increment += size - 1
+            start = row * width + column
+            step = width + column_step
+            sublists.append([list_[start + step * index] for index in range(length)])
 
-    return [first_diagonal_sublist, second_diagonal_sublist]
+    return sublists
 
 
 def is_list_has_equal_elements(list_: list) -> bool:
@@ -117,3 +151,127 @@ def is_list_has_equal_elements(list_: list) -> bool:
         return False
 
     return True
+
+
+@lru_cache(maxsize=WINNING_LINES_CACHE_SIZE)
+def get_winning_lines(
+    size: int,
+    height: Optional[int] = None,
+    win_length: Optional[int] = None,
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Get winning lines of a board.
+
+    A winning line is a tuple of computer positions (the first position is 0) of a window of a number of cells in a row
+    needed to win (win length): all horizontal ones, vertical ones, diagonal ones going down and right and ones going
+    down and left, in this order, each ordered by its first cell. For a perfect square board with the win length of
+    its size, the lines are the same as `get_horizontal_sublists`, `get_vertical_sublists` and `get_diagonal_sublists`
+    return. Unlike sublists, the lines are computed once per board's shape and shared by all boards of the shape, so
+    nothing is sliced or allocated to check a board.
+
+    Arguments:
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of board's rows, the same as the size if not specified (a perfect square).
+        win_length (int): a number of marks in a row needed to win, the shortest side of a board if not specified.
+
+    Returns:
+        Winning lines as a tuple of tuples of positions.
+    """
+    width = size
+    height = size if height is None else height
+    win_length = min(width, height) if win_length is None else win_length
+
+    winning_lines = []
+
+    for row_step, column_step in DIRECTIONS:
+        for row in range(height):
+            for column in range(width):
+                last_row = row + row_step * (win_length - 1)
+                last_column = column + column_step * (win_length - 1)
+
+                if not (0 <= last_row < height and 0 <= last_column < width):
+                    continue
+
+                winning_lines.append(tuple(
+                    (row + row_step * index) * width + column + column_step * index for index in range(win_length)
+                ))
+
+    return tuple(winning_lines)
+
+
+@lru_cache(maxsize=WINNING_LINES_CACHE_SIZE)
+def get_cells_winning_lines(
+    size: int,
+    height: Optional[int] = None,
+    win_length: Optional[int] = None,
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Get winning lines going through each board's cell.
+
+    A cell is in at most a win length of lines per direction, so a move changes at most 4 win lengths of lines.
+
+    Arguments:
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of board's rows, the same as the size if not specified (a perfect square).
+        win_length (int): a number of marks in a row needed to win, the shortest side of a board if not specified.
+
+    Returns:
+        Indexes of winning lines (as `get_winning_lines` returns them) for each board's cell as a tuple of tuples.
+    """
+    height = size if height is None else height
+    cells_winning_lines = [[] for _ in range(size * height)]
+
+    for line, positions in enumerate(get_winning_lines(size=size, height=height, win_length=win_length)):
+        for position in positions:
+            cells_winning_lines[position].append(line)
+
+    return tuple(tuple(lines) for lines in cells_winning_lines)
+
+
+@lru_cache(maxsize=WINNING_LINES_CACHE_SIZE)
+def get_zobrist_table(cells_number: int) -> dict[PlayerMark, tuple[int, ...]]:
+    """
+    Get a Zobrist table of a board.
+
+    A position's Zobrist key is XOR of a random 64-bit value of each marked cell and its mark, so marking or unmarking
+    a cell updates the key in O(1). Values are generated once per a number of cells from a fixed seed, so keys of the
+    same position are the same in any process and can be stored in shared or persistent caches.
+
+    Arguments:
+        cells_number (int): a number of board's cells.
+
+    Returns:
+        Random values of each cell (the first position is 0) by marks as a dictionary of tuples of integers.
+    """
+    random_ = random.Random(ZOBRIST_SEED + cells_number)
+    return {mark: tuple(random_.getrandbits(ZOBRIST_KEY_BITS) for _ in range(cells_number)) for mark in PlayerMark}
+
+
+@lru_cache(maxsize=WINNING_LINES_CACHE_SIZE)
+def get_zobrist_side_keys(
+    size: int,
+    height: Optional[int] = None,
+    win_length: Optional[int] = None,
+    players_number: int = 2,
+) -> tuple[int, ...]:
+    """
+    Get Zobrist keys of a player to move on a board's shape.
+
+    A position's Zobrist key (see `get_zobrist_table`) depends on its cells only, so positions of boards of the same
+    number of cells but of different shapes or win lengths, or with different players to move, share a key. XOR of the
+    key and a side key tells them apart, so evaluations of all of them can be kept in a single cache.
+
+    Arguments:
+        size (int): a size of a board as integer, means number of positions per row.
+        height (int): a number of board's rows, the same as the size if not specified (a perfect square).
+        win_length (int): a number of marks in a row needed to win, the shortest side of a board if not specified.
+        players_number (int): a number of players.
+
+    Returns:
+        Random values of each player to move (by a player's index) as a tuple of integers.
+    """
+    height = size if height is None else height
+    win_length = min(size, height) if win_length is None else win_length
+
+    random_ = random.Random(f'{ZOBRIST_SEED}:{size}x{height}x{win_length}')
+    return tuple(random_.getrandbits(ZOBRIST_KEY_BITS) for _ in range(players_number))
@@ -12,6 +12,7 @@ from game.enums import (
     BoardCheckResultDecision,
     PlayerMark,
 )
+from game.exceptions import BoardWinLengthIsInvalidException
 
 
 @pytest.mark.parametrize(
@@ -139,6 +140,11 @@ def test_board_check_diagonal_win(board_):
             PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y,
             PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y,
         ],
+        [
+            PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_X,
+            PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y,
+            PlayerMark.CLASSIC_Y, Board.EMPTY_CELL, PlayerMark.CLASSIC_X,
+        ],
     ],
 )
 def test_board_check_tie(board_):
@@ -146,7 +152,7 @@ def test_board_check_tie(board_):
     Case: check a board state.
     When:
         - Neither of players have their marks in one of horizontal, verticals or diagonals «lines».
-        - No positions to mark available.
+        - No positions to mark available or every «line» has marks of both players, so nobody can win anymore.
     Expect: the board state is `tie` with `None` as a winning player.
     """
     player_x = Player(mark=PlayerMark.CLASSIC_X)
@@ -198,11 +204,6 @@ def test_board_check_tie(board_):
             PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y,
             Board.EMPTY_CELL, Board.EMPTY_CELL, PlayerMark.CLASSIC_X,
         ],
-        [
-            PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_X,
-            PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y,
-            PlayerMark.CLASSIC_Y, Board.EMPTY_CELL, PlayerMark.CLASSIC_X,
-        ],
     ],
 )
 def test_board_check_continue(board_):
@@ -222,3 +223,83 @@ def test_board_check_continue(board_):
     expected_board_state = BoardState(decision=BoardCheckResultDecision.CONTINUE)
 
     assert expected_board_state == board.check()
+
+
+@pytest.mark.parametrize(
+    ('size', 'positions', 'expected_decision'),
+    [
+        (3, [1, 4, 2, 5, 3], BoardCheckResultDecision.WIN),
+        (3, [3, 1, 5, 2, 7], BoardCheckResultDecision.WIN),
+        (3, [1, 2, 3, 5, 4, 6, 8, 7, 9], BoardCheckResultDecision.TIE),
+        (3, [1, 2, 3, 5], BoardCheckResultDecision.CONTINUE),
+        (4, [1, 5, 6, 9, 11, 13, 16], BoardCheckResultDecision.WIN),
+        (4, [4, 1, 8, 2, 12, 3], BoardCheckResultDecision.CONTINUE),
+    ],
+)
+def test_board_check_after_marks(size, positions, expected_decision):
+    """
+    Case: check a board state.
+    When: players take turns marking a board one position after another.
+    Expect: the board state is computed from the lines going through the marked positions.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+
+    board = Board(players=[player_x, player_y], size=size)
+
+    for index, position in enumerate(positions):
+        board.mark(player=player_x if index % 2 == 0 else player_y, position=position)
+
+    expected_board_state = BoardState(
+        decision=expected_decision,
+        winning_player=player_x if expected_decision == BoardCheckResultDecision.WIN else None,
+    )
+
+    assert expected_board_state == board.check()
+
+
+@pytest.mark.parametrize(
+    ('size', 'height', 'win_length', 'positions', 'expected_decision'),
+    [
+        (15, 15, 5, [113, 1, 114, 2, 115, 3, 116, 4, 117], BoardCheckResultDecision.WIN),
+        (15, 15, 5, [17, 1, 33, 2, 49, 3, 65, 4, 81], BoardCheckResultDecision.WIN),
+        (15, 15, 5, [113, 1, 114, 2, 115, 3, 116], BoardCheckResultDecision.CONTINUE),
+        (4, 3, 3, [2, 1, 7, 3, 12], BoardCheckResultDecision.WIN),
+        (4, 3, 3, [4, 1, 7, 2, 10], BoardCheckResultDecision.WIN),
+        (3, 4, 2, [1, 2, 4], BoardCheckResultDecision.WIN),
+        (5, 1, 3, [1, 4, 2, 5, 3], BoardCheckResultDecision.WIN),
+    ],
+)
+def test_board_check_after_marks_with_win_length(size, height, win_length, positions, expected_decision):
+    """
+    Case: check a board state.
+    When: players take turns marking a rectangular board with a win length.
+    Expect: a player wins with the win length's marks in a row anywhere on the board.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+
+    board = Board(players=[player_x, player_y], size=size, height=height, win_length=win_length)
+
+    for index, position in enumerate(positions):
+        board.mark(player=player_x if index % 2 == 0 else player_y, position=position)
+
+    expected_board_state = BoardState(
+        decision=expected_decision,
+        winning_player=player_x if expected_decision == BoardCheckResultDecision.WIN else None,
+    )
+
+    assert expected_board_state == board.check()
+
+
+@pytest.mark.parametrize('win_length', [0, 5])
+def test_board_win_length_is_invalid(win_length):
+    """
+    Case: initiate a board.
+    When: providing a win length not fitting into the board.
+    Expect: the board's win length is invalid exception is raised.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+
+    with pytest.raises(BoardWinLengthIsInvalidException):
+        Board(players=[player_x], size=4, height=3, win_length=win_length)
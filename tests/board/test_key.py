@@ -0,0 +1,76 @@
+"""
+Provide tests for the game board's Zobrist key.
+"""
+import random
+
+import pytest
+
+from game.board import Board
+from game.dto import Player
+from game.enums import PlayerMark
+from game.utils import get_zobrist_table
+
+
+@pytest.mark.parametrize('size', [3, 4, 7])
+def test_board_key_after_marks(size):
+    """
+    Case: mark a board with random moves.
+    Expect: the board's key after each move is the key of a board with the same cells, and differs from previous ones.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+
+    board = Board(players=[player_x, player_y], size=size)
+    keys = {board.key}
+
+    positions = list(range(1, size * size + 1))
+    random.Random(size).shuffle(positions)
+
+    for index, position in enumerate(positions):
+        board.mark(player=player_x if index % 2 == 0 else player_y, position=position)
+
+        assigned_board = Board(players=[player_x, player_y], size=size)
+        assigned_board.board = list(board.get())
+
+        assert assigned_board.key == board.key
+        assert board.key not in keys
+
+        keys.add(board.key)
+
+
+def test_board_key_does_not_depend_on_moves_order():
+    """
+    Case: mark boards with the same moves in different orders.
+    Expect: the boards' keys are the same, and differ when marks of cells are swapped.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+
+    board = Board(players=[player_x, player_y], size=3)
+    transposed_board = Board(players=[player_x, player_y], size=3)
+    swapped_board = Board(players=[player_x, player_y], size=3)
+
+    for player, position in [(player_x, 1), (player_y, 5), (player_x, 9)]:
+        board.mark(player=player, position=position)
+
+    for player, position in [(player_x, 9), (player_y, 5), (player_x, 1)]:
+        transposed_board.mark(player=player, position=position)
+
+    for player, position in [(player_y, 1), (player_x, 5), (player_y, 9)]:
+        swapped_board.mark(player=player, position=position)
+
+    assert board.key == transposed_board.key
+    assert board.key != swapped_board.key
+
+
+def test_get_zobrist_table():
+    """
+    Case: get a Zobrist table of a board.
+    Expect: the table is generated from a fixed seed, so its values are the same in any process.
+    """
+    zobrist_table = get_zobrist_table(cells_number=9)
+
+    assert set(PlayerMark) == set(zobrist_table)
+    assert zobrist_table[PlayerMark.CLASSIC_X][0] == 10050431061398915333
+    assert zobrist_table[PlayerMark.CLASSIC_Y][8] == 12273011859503742873
+    assert all(len(values) == 9 and len(set(values)) == 9 for values in zobrist_table.values())
@@ -0,0 +1,119 @@
+"""
+Provide tests for the game board's numbers of open lines.
+"""
+import random
+
+import pytest
+
+from game.board import Board
+from game.dto import Player
+from game.enums import PlayerMark
+
+
+def get_expected_open_lines_numbers(board, player):
+    """
+    Get numbers of a player's open lines by scanning all board's winning lines.
+    """
+    open_lines_numbers = [0] * (board.win_length + 1)
+
+    for line in board.winning_lines:
+        marks = [board.get()[position] for position in line if board.get()[position] is not Board.EMPTY_CELL]
+
+        if marks and all(mark is player.mark for mark in marks):
+            open_lines_numbers[len(marks)] += 1
+
+    return open_lines_numbers
+
+
+def get_expected_threats_cells(board, player):
+    """
+    Get empty cells completing a player's threats by scanning all board's winning lines.
+    """
+    threats_cells = set()
+
+    for line in board.winning_lines:
+        cells = [board.get()[position] for position in line]
+        empty_positions = [position + 1 for position in line if board.get()[position] is Board.EMPTY_CELL]
+
+        if len(empty_positions) == 1 and 0 < cells.count(player.mark) == board.win_length - 1:
+            threats_cells.update(empty_positions)
+
+    return threats_cells
+
+
+def assert_open_lines(board, players):
+    """
+    Assert numbers of players' open lines and their threats' cells are the same as counted by scanning all lines.
+    """
+    for player in players:
+        assert get_expected_open_lines_numbers(board=board, player=player) == board.get_open_lines_numbers(
+            player=player,
+        )
+        assert get_expected_threats_cells(board=board, player=player) == set(board.get_threats_cells(player=player))
+        assert len(board.get_threats_cells(player=player)) == len(set(board.get_threats_cells(player=player)))
+
+
+@pytest.mark.parametrize(
+    ('size', 'win_length', 'players_number'),
+    [
+        (3, None, 2),
+        (4, 3, 3),
+        (7, 4, 2),
+        (5, 2, 2),
+        (3, 1, 2),
+    ],
+)
+def test_board_get_open_lines_numbers(size, win_length, players_number):
+    """
+    Case: mark a board with random moves, undo some of them and redo some.
+    Expect: numbers of players' open lines and their threats' cells are the same as counted by scanning all lines after
+        each step.
+    """
+    players = [Player(mark=mark) for mark in list(PlayerMark)[:players_number]]
+    random_ = random.Random(size)
+
+    for _ in range(20):
+        board = Board(players=players, size=size, win_length=win_length)
+
+        positions = list(range(1, size * size + 1))
+        random_.shuffle(positions)
+
+        for index, position in enumerate(positions):
+            board.mark(player=players[index % players_number], position=position)
+
+            assert_open_lines(board=board, players=players)
+
+        for _ in range(random_.randint(1, len(positions))):
+            board.undo()
+
+            assert_open_lines(board=board, players=players)
+
+        board.redo()
+        cells = list(board.get())
+        board.board = cells
+
+        assert_open_lines(board=board, players=players)
+
+
+@pytest.mark.parametrize(
+    ('size', 'height', 'win_length', 'players_number'),
+    [
+        (3, None, None, 2),
+        (4, 3, 3, 3),
+        (7, 5, 4, 2),
+        (3, None, 1, 2),
+    ],
+)
+def test_board_initial_lines(size, height, win_length, players_number):
+    """
+    Case: construct a board.
+    Expect: lines' state, the board's state and the key are the same as rebuilt from the empty board's cells.
+    """
+    players = [Player(mark=mark) for mark in list(PlayerMark)[:players_number]]
+    board = Board(players=players, size=size, height=height, win_length=win_length)
+
+    rebuilt_board = Board(players=players, size=size, height=height, win_length=win_length)
+    rebuilt_board.board = [Board.EMPTY_CELL] * rebuilt_board.board_positions_number
+
+    assert vars(rebuilt_board) == vars(board)
+    assert_open_lines(board=board, players=players)
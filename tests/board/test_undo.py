@@ -0,0 +1,126 @@
+"""
+Provide tests for the game board's undoing and redoing moves.
+"""
+import random
+
+import pytest
+
+from game.board import Board
+from game.dto import (
+    BoardState,
+    Player,
+)
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.exceptions import (
+    BoardMoveToRedoDoesNotExistException,
+    BoardMoveToUndoDoesNotExistException,
+)
+
+
+@pytest.mark.parametrize(
+    ('size', 'players_number'),
+    [
+        (3, 2),
+        (4, 3),
+        (5, 2),
+    ],
+)
+def test_board_undo_and_redo(size, players_number):
+    """
+    Case: mark a board with random moves, undo some of them, redo some and mark other moves.
+    Expect: the board's cells, key and state are the same as of a board marked with the remaining moves only.
+    """
+    players = [Player(mark=mark) for mark in list(PlayerMark)[:players_number]]
+    random_ = random.Random(size)
+
+    for _ in range(50):
+        board = Board(players=players, size=size)
+
+        positions = list(range(1, size * size + 1))
+        random_.shuffle(positions)
+        moves = [(players[index % players_number], position) for index, position in enumerate(positions)]
+
+        played_moves_number = random_.randint(1, len(moves))
+        undone_moves_number = random_.randint(1, played_moves_number)
+        redone_moves_number = random_.randint(0, undone_moves_number)
+
+        for player, position in moves[:played_moves_number]:
+            board.mark(player=player, position=position)
+
+        for _ in range(undone_moves_number):
+            board.undo()
+
+        for _ in range(redone_moves_number):
+            board.redo()
+
+        replayed_moves_number = played_moves_number - undone_moves_number + redone_moves_number
+        expected_board = Board(players=players, size=size)
+
+        for player, position in moves[:replayed_moves_number]:
+            expected_board.mark(player=player, position=position)
+
+        assert expected_board.get() == board.get()
+        assert expected_board.key == board.key
+        assert expected_board.check() == board.check()
+
+        remaining_moves = moves[replayed_moves_number:]
+        random_.shuffle(remaining_moves)
+
+        for player, position in remaining_moves:
+            board.mark(player=player, position=position)
+            expected_board.mark(player=player, position=position)
+
+            assert expected_board.check() == board.check()
+
+
+def test_board_undo_win():
+    """
+    Case: undo a winning move.
+    Expect: the game continues, and a new move clears moves to redo.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+
+    board = Board(players=[player_x, player_y], size=3)
+
+    for index, position in enumerate([1, 4, 2, 5, 3]):
+        board.mark(player=player_x if index % 2 == 0 else player_y, position=position)
+
+    board.undo()
+
+    assert BoardState(decision=BoardCheckResultDecision.CONTINUE) == board.check()
+
+    board.redo()
+
+    assert BoardState(decision=BoardCheckResultDecision.WIN, winning_player=player_x) == board.check()
+
+    board.undo()
+    board.mark(player=player_x, position=7)
+
+    with pytest.raises(BoardMoveToRedoDoesNotExistException):
+        board.redo()
+
+
+def test_board_undo_and_redo_without_moves():
+    """
+    Case: undo and redo moves.
+    When: there are no moves to undo or redo, as none have been made or the board has been assigned.
+    Expect: no moves to undo or redo exceptions are raised.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    board = Board(players=[player_x], size=3)
+
+    with pytest.raises(BoardMoveToUndoDoesNotExistException):
+        board.undo()
+
+    with pytest.raises(BoardMoveToRedoDoesNotExistException):
+        board.redo()
+
+    board.mark(player=player_x, position=1)
+    board.board = list(board.get())
+
+    with pytest.raises(BoardMoveToUndoDoesNotExistException):
+        board.undo()
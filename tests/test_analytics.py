@@ -0,0 +1,174 @@
+"""
+Provide tests for the game's streaming analytics over archives of games.
+"""
+import pytest
+
+from game.analytics import (
+    analyze_archive,
+    analyze_chunk,
+    get_chunks,
+)
+from game.dto import (
+    ArchiveStatistics,
+    GameRecord,
+)
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.exceptions import WorkersNumberIsInvalidException
+from game.records import (
+    FULL_BOARD_TIE_VERSION,
+    MAGIC,
+    VERSION,
+    RecordWriter,
+    encode_record,
+)
+
+MARKS = [PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y]
+
+
+def create_record(moves: list, decision: BoardCheckResultDecision, winning_mark: PlayerMark = None) -> GameRecord:
+    """
+    Create a record of a classic game.
+
+    Arguments:
+        moves (list): positions of the game's moves.
+        decision (BoardCheckResultDecision): the game's decision.
+        winning_mark (PlayerMark): a winning player's mark, if any.
+
+    Returns:
+        The game's record as a `GameRecord`.
+    """
+    return GameRecord(
+        size=3, height=3, win_length=3, marks=MARKS, moves=moves, decision=decision, winning_mark=winning_mark,
+    )
+
+
+RECORDS = [
+    create_record(moves=[1, 4, 2, 5, 3], decision=BoardCheckResultDecision.WIN, winning_mark=PlayerMark.CLASSIC_X),
+    create_record(moves=[5, 1, 9, 2, 7, 3], decision=BoardCheckResultDecision.WIN, winning_mark=PlayerMark.CLASSIC_Y),
+    create_record(moves=[1, 5, 9, 2, 8, 7, 3, 6, 4], decision=BoardCheckResultDecision.TIE),
+    create_record(moves=[5, 1, 3, 9, 7], decision=BoardCheckResultDecision.WIN, winning_mark=PlayerMark.CLASSIC_X),
+    create_record(moves=[1, 1], decision=BoardCheckResultDecision.CONTINUE),
+    create_record(moves=[1, 4, 2, 5, 3, 6], decision=BoardCheckResultDecision.WIN, winning_mark=PlayerMark.CLASSIC_X),
+    create_record(moves=[5, 1], decision=BoardCheckResultDecision.TIE),
+]
+
+
+def test_analyze_chunk(tmp_path):
+    """
+    Case: analyze an archive with valid games and games with a taken position, moves after a win and a wrong state.
+    Expect: invalid games are counted only, first moves' win rates, lengths and winning lines are of valid games.
+    """
+    path = tmp_path / 'games.ttt'
+
+    with RecordWriter(path=path) as writer:
+        for record in RECORDS:
+            writer.write(record=record)
+
+    statistics = analyze_chunk(path=path)
+
+    assert statistics.games == 7
+    assert statistics.invalid_games == 3
+    assert {5: 2, 6: 1, 9: 1} == statistics.lengths
+    assert {1: 0.5, 5: 0.5} == statistics.get_first_moves_win_rates()
+    assert [((3, 3, (1, 2, 3)), 2), ((3, 3, (3, 5, 7)), 1)] == statistics.get_most_common_winning_lines(number=2)
+
+
+def test_analyze_archive_with_workers(tmp_path):
+    """
+    Case: analyze an archive split into chunks by worker processes.
+    Expect: chunks start at records' boundaries and merged statistics are the same as of a single process.
+    """
+    path = tmp_path / 'games.ttt'
+
+    with RecordWriter(path=path) as writer:
+        for _ in range(100):
+            for record in RECORDS:
+                writer.write(record=record)
+
+    chunks = get_chunks(path=path, chunks_number=3)
+
+    assert len(chunks) == 3
+    assert sum(analyze_chunk(path=path, start=start, end=end).games for start, end in chunks) == 700
+    assert analyze_archive(path=path) == analyze_archive(path=path, workers=3)
+
+
+def test_analyze_chunk_winning_lines_of_boards_shapes(tmp_path):
+    """
+    Case: analyze an archive with games won by the same positions on boards of different shapes.
+    Expect: winning lines are counted by the boards' shapes.
+    """
+    path = tmp_path / 'games.ttt'
+
+    with RecordWriter(path=path) as writer:
+        writer.write(record=RECORDS[0])
+        writer.write(
+            record=GameRecord(
+                size=4,
+                height=3,
+                win_length=3,
+                marks=MARKS,
+                moves=[1, 5, 2, 6, 3],
+                decision=BoardCheckResultDecision.WIN,
+                winning_mark=PlayerMark.CLASSIC_X,
+            ),
+        )
+
+    statistics = analyze_chunk(path=path)
+
+    assert {(3, 3, (1, 2, 3)): 1, (4, 3, (1, 2, 3)): 1} == statistics.winning_lines
+
+
+def test_analyze_archive_empty(tmp_path):
+    """
+    Case: analyze an archive without records with several worker processes.
+    Expect: the archive is not split into chunks and its statistics are empty.
+    """
+    path = tmp_path / 'games.ttt'
+    RecordWriter(path=path).close()
+
+    assert [] == get_chunks(path=path, chunks_number=3)
+    assert ArchiveStatistics() == analyze_archive(path=path, workers=3)
+
+
+def test_analyze_archive_workers_number_is_invalid(tmp_path):
+    """
+    Case: analyze an archive.
+    When: a number of worker processes is less than 1.
+    Expect: workers number is invalid error is raised.
+    """
+    path = tmp_path / 'games.ttt'
+
+    with RecordWriter(path=path) as writer:
+        writer.write(record=RECORDS[0])
+
+    with pytest.raises(WorkersNumberIsInvalidException):
+        analyze_archive(path=path, workers=0)
+
+
+@pytest.mark.parametrize(
+    ('version', 'expected_lengths'),
+    [
+        (FULL_BOARD_TIE_VERSION, {9: 1}),
+        (VERSION, {8: 1}),
+    ],
+)
+def test_analyze_chunk_tie_rules_of_archive_version(tmp_path, version, expected_lengths):
+    """
+    Case: analyze an archive with a game tied on a full board and the same game tied a move earlier.
+    When: the archive is of the first version, when a tie was declared on a full board only, or of the current one.
+    Expect: only the game tied by the rules of the archive's version is valid.
+    """
+    path = tmp_path / 'games.ttt'
+    buffer = bytearray(MAGIC + bytes([version]))
+
+    for moves in ([6, 4, 7, 3, 9, 8, 2, 5, 1], [6, 4, 7, 3, 9, 8, 2, 5]):
+        encode_record(record=create_record(moves=moves, decision=BoardCheckResultDecision.TIE), buffer=buffer)
+
+    path.write_bytes(buffer)
+    statistics = analyze_chunk(path=path)
+
+    assert statistics.invalid_games == 1
+    assert expected_lengths == statistics.lengths
@@ -0,0 +1,82 @@
+"""
+Provide tests for the game's boards batch checking.
+"""
+import pytest
+
+from game.board import Board
+from game.dto import Player
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.exceptions import BoardsShapeDoesNotMatchSizeException
+
+np = pytest.importorskip('numpy')
+
+from game.batch import check_boards  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ('size', 'players_number'),
+    [
+        (3, 2),
+        (3, 1),
+        (4, 2),
+        (4, 3),
+        (5, 4),
+    ],
+)
+def test_check_boards_agrees_with_board_check(size, players_number):
+    """
+    Case: check states of many random boards at once.
+    Expect: decisions and winning marks are the same as a board's check of each of the boards returns.
+    """
+    players = [Player(mark=mark) for mark in list(PlayerMark)[:players_number]]
+    boards = np.random.default_rng(seed=size).integers(0, players_number + 1, size=(2000, size * size))
+
+    decisions, winning_marks = check_boards(boards=boards, size=size)
+
+    for cells, decision, winning_mark in zip(boards, decisions, winning_marks):
+        board = Board(players=players, size=size)
+        board.board = [players[cell - 1].mark if cell else Board.EMPTY_CELL for cell in cells]
+        board_state = board.check()
+
+        assert board_state.decision == BoardCheckResultDecision(decision)
+
+        if board_state.decision == BoardCheckResultDecision.WIN:
+            assert board_state.winning_player == players[winning_mark - 1]
+        else:
+            assert winning_mark == 0
+
+
+def test_check_boards_agrees_with_board_check_with_win_length():
+    """
+    Case: check states of many random rectangular boards with a win length at once.
+    Expect: decisions and winning marks are the same as a board's check of each of the boards returns.
+    """
+    players = [Player(mark=PlayerMark.CLASSIC_X), Player(mark=PlayerMark.CLASSIC_Y)]
+    boards = np.random.default_rng(seed=0).integers(0, 3, size=(2000, 7 * 6))
+
+    decisions, winning_marks = check_boards(boards=boards, size=7, height=6, win_length=4)
+
+    for cells, decision, winning_mark in zip(boards, decisions, winning_marks):
+        board = Board(players=players, size=7, height=6, win_length=4)
+        board.board = [players[cell - 1].mark if cell else Board.EMPTY_CELL for cell in cells]
+        board_state = board.check()
+
+        assert board_state.decision == BoardCheckResultDecision(decision)
+
+        if board_state.decision == BoardCheckResultDecision.WIN:
+            assert board_state.winning_player == players[winning_mark - 1]
+        else:
+            assert winning_mark == 0
+
+
+def test_check_boards_shape_does_not_match_size():
+    """
+    Case: check states of many boards at once.
+    When: boards' cells number does not match a board's size.
+    Expect: boards' shape does not match a board's size exception is raised.
+    """
+    with pytest.raises(BoardsShapeDoesNotMatchSizeException):
+        check_boards(boards=np.zeros((2, 16), dtype=int), size=3)
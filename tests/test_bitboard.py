@@ -0,0 +1,97 @@
+"""
+Provide tests for the game's bitboard.
+"""
+import random
+
+import pytest
+
+from game.bitboard import BitBoard
+from game.board import Board
+from game.dto import Player
+from game.enums import PlayerMark
+from game.exceptions import (
+    BoardPlayerDoesNotExistException,
+    BoardPlayersMarksDuplicateException,
+    BoardPositionAlreadyTakenException,
+    BoardPositionDoesNotExistException,
+)
+
+
+@pytest.mark.parametrize(
+    ('size', 'height', 'win_length'),
+    [
+        (3, None, None),
+        (4, None, None),
+        (5, None, None),
+        (4, 3, 3),
+        (7, 6, 4),
+    ],
+)
+def test_bitboard_agrees_with_board(size, height, win_length):
+    """
+    Case: mark a bitboard and a board with the same random moves.
+    Expect: both boards have the same cells and the same state after each move.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+    random_ = random.Random(size)
+
+    for _ in range(50):
+        bitboard = BitBoard(players=[player_x, player_y], size=size, height=height, win_length=win_length)
+        board = Board(players=[player_x, player_y], size=size, height=height, win_length=win_length)
+
+        positions = list(range(1, board.board_positions_number + 1))
+        random_.shuffle(positions)
+
+        for index, position in enumerate(positions):
+            player = player_x if index % 2 == 0 else player_y
+
+            bitboard.mark(player=player, position=position)
+            board.mark(player=player, position=position)
+
+            assert board.get() == bitboard.get()
+            assert board.check() == bitboard.check()
+
+
+def test_bitboard_set_board():
+    """
+    Case: set a bitboard's cells.
+    Expect: the bitboard's state is checked against all win masks.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    board_ = [
+        BitBoard.EMPTY_CELL, BitBoard.EMPTY_CELL, PlayerMark.CLASSIC_X,
+        BitBoard.EMPTY_CELL, PlayerMark.CLASSIC_X, BitBoard.EMPTY_CELL,
+        PlayerMark.CLASSIC_X, BitBoard.EMPTY_CELL, BitBoard.EMPTY_CELL,
+    ]
+
+    bitboard = BitBoard(players=[player_x], size=3)
+    bitboard.board = board_
+
+    assert board_ == bitboard.get()
+    assert player_x == bitboard.check().winning_player
+
+
+def test_bitboard_exceptions():
+    """
+    Case: mark a bitboard.
+    When: specifying a player that does not exist, a position that does not exist or a position already taken.
+    Expect: the same exceptions as a board's ones are raised.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+
+    with pytest.raises(BoardPlayersMarksDuplicateException):
+        BitBoard(players=[player_x, Player(mark=PlayerMark.CLASSIC_X)])
+
+    bitboard = BitBoard(players=[player_x], size=3)
+    bitboard.mark(player=player_x, position=1)
+
+    with pytest.raises(BoardPlayerDoesNotExistException):
+        bitboard.mark(player=player_y, position=2)
+
+    with pytest.raises(BoardPositionDoesNotExistException):
+        bitboard.mark(player=player_x, position=10)
+
+    with pytest.raises(BoardPositionAlreadyTakenException):
+        bitboard.mark(player=player_x, position=1)
@@ -0,0 +1,91 @@
+"""
+Provide tests for the game's evaluation cache.
+"""
+import pytest
+
+from game.board import Board
+from game.cache import EvaluationCache
+from game.dto import Player
+from game.enums import PlayerMark
+from game.exceptions import (
+    EvaluationCacheCapacityIsInvalidException,
+    EvaluationCacheFileIsInvalidException,
+)
+from game.negamax import NegamaxEngine
+
+
+def test_evaluation_cache_evicts_least_recently_used():
+    """
+    Case: put more entries to a cache than its capacity.
+    Expect: the least recently used entries are evicted, and hits, misses and evictions are counted.
+    """
+    cache = EvaluationCache(capacity=2)
+    cache.put(key=1, depth=1, value=10, bound=0, move=4)
+    cache.put(key=2, depth=2, value=-10, bound=1, move=None)
+
+    assert (1, 10, 0, 4) == cache.get(key=1)
+
+    cache.put(key=3, depth=3, value=0, bound=2, move=8)
+
+    assert len(cache) == 2
+    assert cache.get(key=2) is None
+    assert (3, 0, 2, 8) == cache.get(key=3)
+    assert (2, 1, 1) == (cache.stats.hits, cache.stats.misses, cache.stats.evictions)
+
+
+@pytest.mark.parametrize('capacity', [0, -1])
+def test_evaluation_cache_capacity_is_invalid(capacity):
+    """
+    Case: create a cache.
+    When: its capacity is less than 1 entry.
+    Expect: capacity is invalid error is raised.
+    """
+    with pytest.raises(EvaluationCacheCapacityIsInvalidException):
+        EvaluationCache(capacity=capacity)
+
+
+def test_evaluation_cache_save_and_load(tmp_path):
+    """
+    Case: save a cache to a file and load it to a cache of a smaller capacity.
+    Expect: the most recently used entries are loaded with their values.
+    """
+    path = tmp_path / 'cache.bin'
+    cache = EvaluationCache()
+
+    for key in range(10):
+        cache.put(key=2 ** 64 - 1 - key, depth=key, value=-key * 1000, bound=key % 3, move=None if key == 9 else key)
+
+    cache.save(path=path)
+
+    loaded_cache = EvaluationCache(capacity=5)
+    loaded_cache.load(path=path)
+
+    assert len(loaded_cache) == 5
+    assert loaded_cache.get(key=2 ** 64 - 5) is None
+    assert (9, -9000, 0, None) == loaded_cache.get(key=2 ** 64 - 10)
+
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with pytest.raises(EvaluationCacheFileIsInvalidException):
+        loaded_cache.load(path=path)
+
+
+def test_evaluation_cache_shared_by_engines(tmp_path):
+    """
+    Case: search a position with an engine, save its cache and search the position with a new engine loading it.
+    Expect: the new engine finds the same move searching much less nodes.
+    """
+    players = [Player(mark=PlayerMark.CLASSIC_X), Player(mark=PlayerMark.CLASSIC_Y)]
+    board = Board(players=players, size=3)
+    path = tmp_path / 'cache.bin'
+
+    engine = NegamaxEngine()
+    position = engine.get_move(board=board, player=players[0])
+    engine.cache.save(path=path)
+
+    cache = EvaluationCache()
+    cache.load(path=path)
+    warm_engine = NegamaxEngine(cache=cache)
+
+    assert position == warm_engine.get_move(board=board, player=players[0])
+    assert warm_engine.stats.nodes * 10 < engine.stats.nodes
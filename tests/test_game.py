@@ -0,0 +1,140 @@
+"""
+Provide tests for the game's session.
+"""
+import io
+
+import pytest
+
+from game.board import Board
+from game.dto import Player
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.exceptions import (
+    BoardPositionAlreadyTakenException,
+    BoardPositionDoesNotExistException,
+    GameIsOverException,
+    GamePlayerIsNotToMoveException,
+)
+from game.game_ import (
+    GameBatch,
+    GameSession,
+)
+
+
+def test_game_session_play():
+    """
+    Case: play a game's session.
+    Expect: players move in turns until one of them wins, moves after the game is over are rejected.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+
+    session = GameSession(board=Board(players=[player_x, player_y], size=3))
+
+    for position in [1, 4, 2, 5]:
+        session.play(player=session.current_player, position=position)
+
+    assert player_x == session.current_player
+    assert not session.is_over
+
+    board_state = session.play(player=player_x, position=3)
+
+    assert board_state.decision == BoardCheckResultDecision.WIN
+    assert session.is_over
+    assert session.moves_number == 5
+
+    with pytest.raises(GameIsOverException):
+        session.play(player=player_y, position=6)
+
+
+def test_game_session_invalid_moves():
+    """
+    Case: play a game's session.
+    When: a player moves out of turn or to a position that does not exist or is already taken.
+    Expect: the move is rejected and it is still the same player's turn.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+
+    session = GameSession(board=Board(players=[player_x, player_y], size=3))
+    session.play(player=player_x, position=5)
+
+    with pytest.raises(GamePlayerIsNotToMoveException):
+        session.play(player=player_x, position=1)
+
+    with pytest.raises(BoardPositionAlreadyTakenException):
+        session.play(player=player_y, position=5)
+
+    with pytest.raises(BoardPositionDoesNotExistException):
+        session.play(player=player_y, position=GameSession.parse_position(text='ten'))
+
+    assert player_y == session.current_player
+    assert session.moves_number == 1
+
+
+@pytest.mark.parametrize(
+    ('text', 'expected_position'),
+    [
+        ('1', 1),
+        (' 9\n', 9),
+    ],
+)
+def test_game_session_parse_position(text, expected_position):
+    """
+    Case: parse a position entered by a player.
+    Expect: the position's number.
+    """
+    assert expected_position == GameSession.parse_position(text=text)
+
+
+def test_game_session_parse_position_non_ascii_digit():
+    """
+    Case: parse a position entered by a player.
+    When: the position is written with a non-ASCII digit.
+    Expect: position does not exist error is raised.
+    """
+    with pytest.raises(BoardPositionDoesNotExistException):
+        GameSession.parse_position(text='\u00b2')
+
+
+def test_game_batch_play():
+    """
+    Case: play games' move sequences in the batch mode.
+    Expect: a result line per game in order, invalid moves and moves after a game is over are counted and skipped,
+        blank lines are not games.
+    """
+    lines = [
+        '1 4 2 5 3\n',
+        '5,1,9,2,7,3\n',
+        '1 1 x 0 4 2 5 3 9\n',
+        '\n',
+        '1 5 9 2 8 7 3 6 4\n',
+        ' \t\n',
+    ]
+    output = io.StringIO()
+
+    games_number = GameBatch().play(lines=lines, output=output)
+
+    assert games_number == 4
+    assert [
+        'win x 5 0',
+        'win o 6 0',
+        'win x 5 4',
+        'tie - 9 0',
+    ] == output.getvalue().splitlines()
+
+
+def test_game_batch_play_non_ascii_digit():
+    """
+    Case: play games' move sequences in the batch mode.
+    When: a position is written with a non-ASCII digit.
+    Expect: the position is counted and skipped as an invalid move and the next games are played.
+    """
+    output = io.StringIO()
+
+    games_number = GameBatch().play(lines=['1 \u00b2 4 2 5 3\n', '1 4 2 5 3\n'], output=output)
+
+    assert games_number == 2
+    assert ['win x 5 1', 'win x 5 0'] == output.getvalue().splitlines()
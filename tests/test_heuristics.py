@@ -0,0 +1,112 @@
+"""
+Provide tests for the game's heuristic evaluation.
+"""
+import pytest
+
+from game.board import Board
+from game.dto import (
+    LinesPatterns,
+    Player,
+)
+from game.enums import PlayerMark
+from game.heuristics import (
+    THREAT_SCORE,
+    WIN_SCORE,
+    evaluate,
+    get_lines_patterns,
+)
+
+PLAYER_X = Player(mark=PlayerMark.CLASSIC_X)
+PLAYER_Y = Player(mark=PlayerMark.CLASSIC_Y)
+
+
+@pytest.mark.parametrize(
+    ('moves', 'expected_x_patterns', 'expected_y_patterns'),
+    [
+        (
+            [],
+            LinesPatterns(open_twos=0, open_threes=0, threats=0, threats_cells=0),
+            LinesPatterns(open_twos=0, open_threes=0, threats=0, threats_cells=0),
+        ),
+        (
+            [(PLAYER_X, 24), (PLAYER_Y, 1), (PLAYER_X, 25)],
+            LinesPatterns(open_twos=3, open_threes=0, threats=0, threats_cells=0),
+            LinesPatterns(open_twos=0, open_threes=0, threats=0, threats_cells=0),
+        ),
+        (
+            [(PLAYER_X, 24), (PLAYER_Y, 1), (PLAYER_X, 25), (PLAYER_Y, 2), (PLAYER_X, 26)],
+            LinesPatterns(open_twos=2, open_threes=2, threats=2, threats_cells=2),
+            LinesPatterns(open_twos=1, open_threes=0, threats=0, threats_cells=0),
+        ),
+    ],
+)
+def test_get_lines_patterns(moves, expected_x_patterns, expected_y_patterns):
+    """
+    Case: get players' lines patterns on a 7x7 board with 4 marks in a row to win.
+    Expect: numbers of open twos, open threes and threats of each player.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=7, win_length=4)
+
+    for player, position in moves:
+        board.mark(player=player, position=position)
+
+    assert expected_x_patterns == get_lines_patterns(board=board, player=PLAYER_X)
+    assert expected_y_patterns == get_lines_patterns(board=board, player=PLAYER_Y)
+    assert expected_x_patterns.is_double_threat is (expected_x_patterns.threats_cells > 1)
+
+
+def test_get_lines_patterns_threats_completed_by_same_cell():
+    """
+    Case: get a player's lines patterns on a classic board.
+    When: the player's two threats are completed by the same cell.
+    Expect: the threats are not a double threat, as an opponent blocks both of them with a single move.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y])
+
+    for player, position in [(PLAYER_X, 1), (PLAYER_Y, 3), (PLAYER_X, 9), (PLAYER_Y, 7), (PLAYER_X, 2), (PLAYER_X, 8)]:
+        board.mark(player=player, position=position)
+
+    patterns = get_lines_patterns(board=board, player=PLAYER_X)
+
+    assert LinesPatterns(open_twos=2, open_threes=0, threats=2, threats_cells=1) == patterns
+    assert not patterns.is_double_threat
+    assert [5] == board.get_threats_cells(player=PLAYER_X)
+
+
+def test_evaluate():
+    """
+    Case: evaluate positions of a game for both players.
+    Expect: a player with more patterns is better off, a win is the highest value, values are opposite.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=7, win_length=4)
+
+    assert 0 == evaluate(board=board, player=PLAYER_X)
+
+    for player, position in [(PLAYER_X, 24), (PLAYER_Y, 1), (PLAYER_X, 25), (PLAYER_Y, 2), (PLAYER_X, 26)]:
+        board.mark(player=player, position=position)
+
+    value = evaluate(board=board, player=PLAYER_X)
+
+    assert 0 < value < WIN_SCORE
+    assert -value == evaluate(board=board, player=PLAYER_Y)
+
+    board.mark(player=PLAYER_Y, position=49)
+    board.mark(player=PLAYER_X, position=23)
+
+    assert WIN_SCORE == evaluate(board=board, player=PLAYER_X)
+    assert -WIN_SCORE == evaluate(board=board, player=PLAYER_Y)
+
+
+def test_evaluate_threats_are_not_open_lines():
+    """
+    Case: evaluate a position on a classic board.
+    When: open twos are threats, as two marks are a mark short of a win, X has two threats by the same cell and O has
+        one.
+    Expect: open twos are scored as threats only and the same cell's threats are not a double threat.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y])
+
+    for player, position in [(PLAYER_X, 1), (PLAYER_Y, 3), (PLAYER_X, 9), (PLAYER_Y, 7), (PLAYER_X, 2), (PLAYER_X, 8)]:
+        board.mark(player=player, position=position)
+
+    assert THREAT_SCORE == evaluate(board=board, player=PLAYER_X)
@@ -0,0 +1,151 @@
+"""
+Provide tests for the game's instrumentation.
+"""
+import pstats
+
+import pytest
+
+from game.board import Board
+from game.dto import Player
+from game.enums import (
+    PlayerMark,
+    ProfileMode,
+)
+from game.exceptions import BoardPositionAlreadyTakenException
+from game.game_ import Game
+from game.instrumentation import (
+    Histogram,
+    Instrumentation,
+    capture_profile,
+)
+from game.negamax import NegamaxEngine
+
+
+@pytest.fixture()
+def instrumentation():
+    """
+    Get an instrumentation disabled after a test.
+
+    Yields:
+        The instrumentation as an `Instrumentation`.
+    """
+    instrumentation_ = Instrumentation()
+    yield instrumentation_
+    instrumentation_.disable()
+
+
+def test_instrumentation_counts_board_calls(instrumentation):
+    """
+    Case: mark and check a board with the instrumentation enabled.
+    Expect: calls and exceptions are counted and latencies are added to histograms.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    board = Board(players=[player_x], size=3)
+
+    instrumentation.enable()
+
+    board.mark(player=player_x, position=1)
+    board.check()
+
+    with pytest.raises(BoardPositionAlreadyTakenException):
+        board.mark(player=player_x, position=1)
+
+    snapshot = instrumentation.snapshot()
+
+    assert snapshot['enabled']
+    assert {
+        'board.mark': 2,
+        'board.check': 1,
+        'board.mark.BoardPositionAlreadyTakenException': 1,
+    } == snapshot['counters']
+    assert snapshot['histograms']['board.mark']['count'] == 2
+    assert sum(snapshot['histograms']['board.mark']['buckets'].values()) == 2
+
+
+def test_instrumentation_disable_restores_methods(instrumentation):
+    """
+    Case: enable the instrumentation and disable it.
+    Expect: the original methods are restored, stats are kept until reset.
+    """
+    original_mark = Board.mark
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+
+    instrumentation.enable()
+    instrumentation.enable()
+
+    assert Board.mark is not original_mark
+
+    Board(players=[player_x], size=3).mark(player=player_x, position=1)
+    instrumentation.disable()
+
+    assert Board.mark is original_mark
+    assert not instrumentation.is_enabled
+
+    Board(players=[player_x], size=3).mark(player=player_x, position=1)
+
+    assert instrumentation.snapshot()['counters']['board.mark'] == 1
+
+    instrumentation.reset()
+
+    assert {} == instrumentation.snapshot()['counters']
+    assert instrumentation.snapshot()['histograms']['board.mark']['count'] == 0
+
+
+def test_instrumentation_counts_game_loop_iterations(instrumentation):
+    """
+    Case: play a game of two computer players with the instrumentation enabled.
+    Expect: each game loop's iteration is counted as a move, the game is a tie a move before the board is full.
+    """
+    engine = NegamaxEngine()
+    game = Game(engines={PlayerMark.CLASSIC_X: engine, PlayerMark.CLASSIC_Y: engine})
+
+    instrumentation.enable()
+
+    with pytest.raises(SystemExit):
+        game.start()
+
+    counters = instrumentation.snapshot()['counters']
+
+    assert counters['game.move'] == 8
+    assert counters['board.mark'] == 8
+
+
+@pytest.mark.parametrize(
+    ('latencies', 'expected_statistics'),
+    [
+        ([], {'count': 0, 'mean': None, 'p50': None}),
+        ([100, 100, 100, 5000], {'count': 4, 'mean': 1325, 'min': 100, 'max': 5000, 'p50': 127, 'p99': 5000}),
+    ],
+)
+def test_histogram_snapshot(latencies, expected_statistics):
+    """
+    Case: add latencies to a histogram.
+    Expect: statistics with percentiles precise up to a power-of-two bucket.
+    """
+    histogram = Histogram()
+
+    for latency in latencies:
+        histogram.add(latency=latency)
+
+    statistics = histogram.snapshot()
+
+    assert expected_statistics == {key: statistics[key] for key in expected_statistics}
+
+
+@pytest.mark.parametrize('mode', list(ProfileMode))
+def test_capture_profile(mode, tmp_path):
+    """
+    Case: capture a profile of a block exiting as the game does.
+    Expect: the profile is dumped to an output file.
+    """
+    output = tmp_path / 'profile'
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+
+    with pytest.raises(SystemExit), capture_profile(mode=mode, output=output):
+        Board(players=[player_x], size=3).mark(player=player_x, position=1)
+        raise SystemExit
+
+    assert output.stat().st_size
+
+    if mode == ProfileMode.CPROFILE:
+        assert pstats.Stats(str(output)).total_calls
@@ -0,0 +1,124 @@
+"""
+Provide tests for the game's Monte Carlo tree search engine.
+"""
+import pytest
+
+from game.board import Board
+from game.dto import Player
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.mcts import MctsEngine
+
+PLAYER_X = Player(mark=PlayerMark.CLASSIC_X)
+PLAYER_Y = Player(mark=PlayerMark.CLASSIC_Y)
+
+
+@pytest.mark.parametrize(
+    ('board_', 'player', 'expected_position'),
+    [
+        (
+            [
+                PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, Board.EMPTY_CELL,
+                PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+            ],
+            PLAYER_X,
+            3,
+        ),
+        (
+            [
+                PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+            ],
+            PLAYER_Y,
+            3,
+        ),
+    ],
+)
+def test_mcts_engine_wins_or_blocks(board_, player, expected_position):
+    """
+    Case: get the best move of a player.
+    When: the player can win in one move or an opponent can win in one move.
+    Expect: the player takes the winning position or blocks the opponent's one.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=3)
+    board.board = board_
+
+    engine = MctsEngine(deadline=100, seed=0)
+
+    assert expected_position == engine.get_move(board=board, player=player)
+    assert engine.stats.playouts > 0
+    assert engine.stats.playouts_per_second > 0
+
+
+def test_mcts_engine_reuses_search_tree():
+    """
+    Case: get moves of players one after another.
+    Expect: playouts of the previous move's subtree are reused and the board is not changed by searching.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=3)
+    engine = MctsEngine(deadline=50, seed=0)
+
+    board.mark(player=PLAYER_X, position=engine.get_move(board=board, player=PLAYER_X))
+    board.mark(player=PLAYER_Y, position=engine.get_move(board=board, player=PLAYER_Y))
+
+    assert engine.stats.reused_playouts > 0
+    assert 2 == len([cell for cell in board.get() if cell is not Board.EMPTY_CELL])
+
+
+def test_mcts_engine_plays_any_size_and_players_number():
+    """
+    Case: play a game of Monte Carlo engines on a 5x5 board with 3 players.
+    Expect: every move is valid and the game ends.
+    """
+    players = [Player(mark=mark) for mark in list(PlayerMark)[:3]]
+    board = Board(players=players, size=5)
+    engine = MctsEngine(deadline=5, seed=0)
+    moves_number = 0
+
+    while board.check().decision == BoardCheckResultDecision.CONTINUE:
+        player = players[moves_number % len(players)]
+        board.mark(player=player, position=engine.get_move(board=board, player=player))
+        moves_number += 1
+
+    assert moves_number <= 25
+
+
+def test_mcts_engine_game_is_over():
+    """
+    Case: get the best move of a player.
+    When: a board is full.
+    Expect: no move is returned.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=3)
+    board.board = [
+        PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_X,
+        PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y,
+        PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X,
+    ]
+
+    assert MctsEngine(deadline=5, seed=0).get_move(board=board, player=PLAYER_X) is None
+
+
+def test_mcts_engine_nodes_do_not_store_moves():
+    """
+    Case: search a big board.
+    Expect: nodes keep an index of their untried moves instead of lists of empty positions.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=15, win_length=5)
+    engine = MctsEngine(deadline=20, seed=0)
+
+    position = engine.get_move(board=board, player=PLAYER_X)
+    nodes = [engine._root]
+
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(node.children.values())
+
+        assert not hasattr(node, 'untried_positions')
+        assert 0 <= node.untried_index <= board.board_positions_number
+
+    assert 1 <= position <= board.board_positions_number
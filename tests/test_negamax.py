@@ -0,0 +1,141 @@
+"""
+Provide tests for the game's negamax engine.
+"""
+import pytest
+
+from game.board import Board
+from game.dto import Player
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.exceptions import EnginePlayersNumberIsNotSupportedException
+from game.negamax import NegamaxEngine
+
+PLAYER_X = Player(mark=PlayerMark.CLASSIC_X)
+PLAYER_Y = Player(mark=PlayerMark.CLASSIC_Y)
+
+
+def test_negamax_engine_plays_tie_against_itself():
+    """
+    Case: play a game of two negamax engines on a 3x3 board.
+    Expect: the game ends in a tie as tic-tac-toe is a tie with a perfect play.
+    """
+    engine = NegamaxEngine()
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=3)
+    player = PLAYER_X
+
+    while board.check().decision == BoardCheckResultDecision.CONTINUE:
+        board.mark(player=player, position=engine.get_move(board=board, player=player))
+        player = PLAYER_Y if player == PLAYER_X else PLAYER_X
+
+    assert BoardCheckResultDecision.TIE == board.check().decision
+
+
+@pytest.mark.parametrize(
+    ('board_', 'player', 'expected_position'),
+    [
+        (
+            [
+                PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, Board.EMPTY_CELL,
+                PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+            ],
+            PLAYER_X,
+            3,
+        ),
+        (
+            [
+                PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+            ],
+            PLAYER_Y,
+            3,
+        ),
+    ],
+)
+def test_negamax_engine_wins_or_blocks(board_, player, expected_position):
+    """
+    Case: get the best move of a player.
+    When: the player can win in one move or an opponent can win in one move.
+    Expect: the player takes the winning position or blocks the opponent's one.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=3)
+    board.board = board_
+
+    assert expected_position == NegamaxEngine().get_move(board=board, player=player)
+
+
+def test_negamax_engine_respects_nodes_budget():
+    """
+    Case: get the best move of a player on a 4x4 board.
+    When: the engine's nodes budget is limited.
+    Expect: the engine searches no more nodes than the budget and reports its statistics.
+    """
+    engine = NegamaxEngine(max_nodes=1000)
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=4)
+
+    position = engine.get_move(board=board, player=PLAYER_X)
+
+    assert 1 <= position <= 16
+    assert engine.stats.nodes <= 1001
+    assert engine.stats.depth >= 1
+    assert 0 <= engine.stats.transposition_table_hit_rate <= 1
+
+
+def test_negamax_engine_players_number_is_not_supported():
+    """
+    Case: get the best move of a player.
+    When: a board has not two players.
+    Expect: engine's players number is not supported exception is raised.
+    """
+    board = Board(players=[PLAYER_X], size=3)
+
+    with pytest.raises(EnginePlayersNumberIsNotSupportedException):
+        NegamaxEngine().get_move(board=board, player=PLAYER_X)
+
+
+@pytest.mark.parametrize(
+    'board_',
+    [
+        [
+            PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_X,
+            PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y,
+            PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X,
+        ],
+        [
+            PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X,
+            PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+            Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+        ],
+    ],
+)
+def test_negamax_engine_game_is_over(board_):
+    """
+    Case: get the best move of a player.
+    When: a board is full or the game is already won.
+    Expect: no move is returned.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=3)
+    board.board = board_
+
+    assert NegamaxEngine().get_move(board=board, player=PLAYER_Y) is None
+
+
+def test_negamax_engine_seed():
+    """
+    Case: get the best move on an empty board, where every move is a tie with a perfect play.
+    Expect: an engine without a seed takes the first best move, seeded engines choose among the best moves.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=3)
+
+    unseeded_positions = {NegamaxEngine().get_move(board=board, player=PLAYER_X) for _ in range(3)}
+    seeded_positions = {NegamaxEngine(seed=seed).get_move(board=board, player=PLAYER_X) for seed in range(8)}
+
+    assert 1 == len(unseeded_positions)
+    assert 1 < len(seeded_positions)
+    assert NegamaxEngine(seed=7).get_move(board=board, player=PLAYER_X) == NegamaxEngine(seed=7).get_move(
+        board=board,
+        player=PLAYER_X,
+    )
@@ -0,0 +1,125 @@
+"""
+Provide tests for the game's perfect play table.
+"""
+import pytest
+
+from game.board import Board
+from game.dto import Player
+from game.enums import (
+    PlayerMark,
+    PositionValue,
+)
+from game.exceptions import (
+    PerfectPlayTableBoardIsNotSupportedException,
+    PerfectPlayTablePositionIsNotReachableException,
+)
+from game.perfect_play import (
+    SLOTS_NUMBER,
+    PerfectPlayTable,
+    build_perfect_play_table,
+)
+
+PLAYER_X = Player(mark=PlayerMark.CLASSIC_X)
+PLAYER_Y = Player(mark=PlayerMark.CLASSIC_Y)
+
+
+@pytest.fixture(scope='module')
+def perfect_play_table(tmp_path_factory):
+    """
+    Build the perfect play table to a temporary file and open it.
+    """
+    path = tmp_path_factory.mktemp('perfect-play') / 'perfect-play-3x3.bin'
+    build_perfect_play_table(path=path)
+
+    assert SLOTS_NUMBER == path.stat().st_size
+
+    table = PerfectPlayTable(path=path)
+    yield table
+    table.close()
+
+
+@pytest.mark.parametrize(
+    ('board_', 'expected_value', 'expected_position'),
+    [
+        (
+            [
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+            ],
+            PositionValue.TIE,
+            1,
+        ),
+        (
+            [
+                PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, Board.EMPTY_CELL,
+                PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+            ],
+            PositionValue.WIN,
+            3,
+        ),
+        (
+            [
+                PlayerMark.CLASSIC_X, Board.EMPTY_CELL, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, PlayerMark.CLASSIC_X,
+            ],
+            PositionValue.TIE,
+            2,
+        ),
+        (
+            [
+                PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X,
+                PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+            ],
+            PositionValue.LOSS,
+            None,
+        ),
+        (
+            [
+                PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y,
+                PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y,
+                Board.EMPTY_CELL, PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_X,
+            ],
+            PositionValue.TIE,
+            None,
+        ),
+    ],
+)
+def test_perfect_play_table(perfect_play_table, board_, expected_value, expected_position):
+    """
+    Case: evaluate a board's position and get the best move with the perfect play table.
+    Expect: the position's value for a player to move and the best move of a perfect play.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=3)
+    board.board = board_
+
+    assert expected_value == perfect_play_table.evaluate(board=board)
+    assert expected_position == perfect_play_table.best_move(board=board)
+
+
+def test_perfect_play_table_position_is_not_reachable(perfect_play_table):
+    """
+    Case: evaluate a board's position with the perfect play table.
+    When: the position is not reachable (the second player has more marks than the first one).
+    Expect: perfect play table's position is not reachable exception is raised.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=3)
+    board.board = [PlayerMark.CLASSIC_Y] + [Board.EMPTY_CELL] * 8
+
+    with pytest.raises(PerfectPlayTablePositionIsNotReachableException):
+        perfect_play_table.evaluate(board=board)
+
+
+def test_perfect_play_table_board_is_not_supported(perfect_play_table):
+    """
+    Case: evaluate a board's position with the perfect play table.
+    When: the board is not 3x3.
+    Expect: perfect play table's board is not supported exception is raised.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y], size=4)
+
+    with pytest.raises(PerfectPlayTableBoardIsNotSupportedException):
+        perfect_play_table.evaluate(board=board)
@@ -0,0 +1,186 @@
+"""
+Provide tests for the game's binary records of games.
+"""
+import random
+
+import pytest
+
+from game.board import Board
+from game.dto import (
+    GameRecord,
+    Player,
+)
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.exceptions import (
+    GameRecordIsInvalidException,
+    GameRecordsArchiveIsInvalidException,
+)
+from game.records import (
+    FULL_BOARD_TIE_VERSION,
+    MAGIC,
+    VERSION,
+    RecordReader,
+    RecordWriter,
+    create_record,
+    decode_varint,
+    encode_record,
+    encode_varint,
+    get_record_state,
+    load_index,
+    replay_record,
+    save_index,
+)
+
+
+def play_random_game(random_: random.Random, size: int, height: int, win_length: int) -> Board:
+    """
+    Play a game with random moves until it is over.
+
+    Arguments:
+        random_ (random.Random): a random numbers generator.
+        size (int): a number of positions per row.
+        height (int): a number of rows.
+        win_length (int): a number of marks in a row needed to win.
+
+    Returns:
+        The board of the game as a `Board`.
+    """
+    players = [Player(mark=PlayerMark.CLASSIC_X), Player(mark=PlayerMark.MODERN_Y)]
+    board = Board(players=players, size=size, height=height, win_length=win_length)
+
+    positions = list(range(1, size * height + 1))
+    random_.shuffle(positions)
+
+    for index, position in enumerate(positions):
+        board.mark(player=players[index % 2], position=position)
+
+        if board.check().decision != BoardCheckResultDecision.CONTINUE:
+            break
+
+    return board
+
+
+@pytest.mark.parametrize('value', [0, 1, 127, 128, 300, 2 ** 64 - 1])
+def test_varint(value):
+    """
+    Case: encode and decode an integer as a varint.
+    Expect: the integer is decoded back, integers below 128 take a single byte.
+    """
+    buffer = bytearray()
+    encode_varint(value=value, buffer=buffer)
+
+    assert (value, len(buffer)) == decode_varint(data=bytes(buffer), offset=0)
+    assert (len(buffer) == 1) == (value < 128)
+
+
+def test_records_write_and_read(tmp_path):
+    """
+    Case: write records of random games of different boards to an archive in two sessions and read them back.
+    Expect: records are read in order by iteration and by numbers, and replay to the games' boards and states.
+    """
+    path = tmp_path / 'games.ttt'
+    random_ = random.Random(0)
+    boards = [play_random_game(random_=random_, size=size, height=height, win_length=win_length)
+              for size, height, win_length in [(3, 3, 3), (4, 3, 3), (15, 15, 5)] * 20]
+
+    for boards_ in (boards[:30], boards[30:]):
+        with RecordWriter(path=path, buffer_size=64) as writer:
+            for board in boards_:
+                writer.write(record=create_record(board=board))
+
+    with RecordReader(path=path) as reader:
+        records = list(reader)
+
+        assert len(boards) == len(reader)
+        assert records[41] == reader[41]
+
+    for board, record in zip(boards, records):
+        assert board.get() == replay_record(record=record).get()
+        assert board.check() == replay_record(record=record).check() == get_record_state(record=record)
+
+
+def test_records_index(tmp_path):
+    """
+    Case: save an offset index of an archive and read records through the loaded index.
+    Expect: records are the same as read by iteration.
+    """
+    path, index_path = tmp_path / 'games.ttt', tmp_path / 'games.idx'
+    random_ = random.Random(1)
+
+    with RecordWriter(path=path) as writer:
+        for _ in range(100):
+            writer.write(record=create_record(board=play_random_game(random_=random_, size=3, height=3, win_length=3)))
+
+    with RecordReader(path=path) as reader:
+        save_index(index=reader.build_index(), path=index_path)
+        records = list(reader)
+
+    with RecordReader(path=path, index=load_index(path=index_path)) as reader:
+        assert records[::-1] == [reader[number] for number in reversed(range(len(reader)))]
+
+
+def test_records_archive_is_invalid(tmp_path):
+    """
+    Case: read a file that is not an archive, and an archive cut in the middle of a record.
+    Expect: archive is invalid and record is invalid exceptions are raised.
+    """
+    path = tmp_path / 'games.ttt'
+    path.write_bytes(b'')
+
+    with pytest.raises(GameRecordsArchiveIsInvalidException):
+        RecordReader(path=path)
+
+    path.unlink()
+
+    with RecordWriter(path=path) as writer:
+        writer.write(record=GameRecord(size=3, height=3, win_length=3, marks=[PlayerMark.CLASSIC_X], moves=[5]))
+
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with RecordReader(path=path) as reader, pytest.raises(GameRecordIsInvalidException):
+        list(reader)
+
+
+@pytest.mark.parametrize('version', [FULL_BOARD_TIE_VERSION, VERSION])
+def test_records_archive_versions(tmp_path, version):
+    """
+    Case: read an archive of a supported version and append records to it.
+    Expect: records are read with the archive's version, records are appended to an archive of the current version only.
+    """
+    path = tmp_path / 'games.ttt'
+    record = GameRecord(size=3, height=3, win_length=3, marks=[PlayerMark.CLASSIC_X], moves=[5])
+
+    buffer = bytearray(MAGIC + bytes([version]))
+    encode_record(record=record, buffer=buffer)
+    path.write_bytes(buffer)
+
+    with RecordReader(path=path) as reader:
+        assert version == reader.version
+        assert [record] == list(reader)
+
+    if version != VERSION:
+        with pytest.raises(GameRecordsArchiveIsInvalidException):
+            RecordWriter(path=path)
+
+        return
+
+    with RecordWriter(path=path) as writer:
+        writer.write(record=record)
+
+    with RecordReader(path=path) as reader:
+        assert [record, record] == list(reader)
+
+
+def test_records_archive_version_is_not_supported(tmp_path):
+    """
+    Case: read an archive of a version newer than the current one.
+    Expect: archive is invalid exception is raised.
+    """
+    path = tmp_path / 'games.ttt'
+    path.write_bytes(MAGIC + bytes([VERSION + 1]))
+
+    with pytest.raises(GameRecordsArchiveIsInvalidException):
+        RecordReader(path=path)
@@ -0,0 +1,70 @@
+"""
+Provide tests for the game's multi-process self-play.
+"""
+import pytest
+
+from game.dto import SelfPlayResult
+from game.exceptions import (
+    EnginePlayersNumberIsNotSupportedException,
+    WorkersNumberIsInvalidException,
+)
+from game.selfplay import (
+    merge_results,
+    play_games,
+    run_self_play,
+)
+
+
+def test_run_self_play():
+    """
+    Case: run self-play games sharded across worker processes.
+    Expect: every game is counted once as a win or a tie, workers' results are reproducible with the same seed.
+    """
+    result, workers_results = run_self_play(games=21, workers=2, policy='random', seed=7)
+
+    assert 21 == result.games
+    assert 21 == sum(result.wins.values()) + result.ties
+    assert 21 == sum(result.lengths.values())
+    assert [11, 10] == [worker_result.games for worker_result in workers_results]
+
+    replayed_result = play_games(games=11, policy='random', players_number=2, seed=7, board_options={})
+
+    assert workers_results[0].wins == replayed_result.wins
+    assert workers_results[0].lengths == replayed_result.lengths
+
+
+def test_merge_results():
+    """
+    Case: merge games' results of workers.
+    Expect: games, wins, ties and lengths are summed up.
+    """
+    results = [
+        SelfPlayResult(games=3, wins={'x': 2}, ties=1, lengths={5: 2, 9: 1}, time=1.0),
+        SelfPlayResult(games=2, wins={'x': 1, 'o': 1}, ties=0, lengths={7: 1, 5: 1}, time=1.0),
+    ]
+
+    result = merge_results(results=results, time_=0.5)
+
+    assert SelfPlayResult(games=5, wins={'x': 3, 'o': 1}, ties=1, lengths={5: 3, 7: 1, 9: 1}, time=0.5) == result
+    assert 10 == result.games_per_second
+
+
+def test_run_self_play_players_number_is_not_supported():
+    """
+    Case: run self-play games of negamax engines.
+    When: a number of players is not two.
+    Expect: engine's players number is not supported exception is raised before any game is played.
+    """
+    with pytest.raises(EnginePlayersNumberIsNotSupportedException):
+        run_self_play(games=10, workers=2, policy='negamax', players_number=3)
+
+
+@pytest.mark.parametrize('workers', [0, -1])
+def test_run_self_play_workers_number_is_invalid(workers):
+    """
+    Case: run self-play games.
+    When: a number of worker processes is less than 1.
+    Expect: workers number is invalid error is raised before any game is played.
+    """
+    with pytest.raises(WorkersNumberIsInvalidException):
+        run_self_play(games=10, workers=workers, policy='random')
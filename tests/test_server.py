@@ -0,0 +1,301 @@
+"""
+Provide tests for the game's server.
+"""
+import asyncio
+
+import pytest
+
+from game.server import GameServer
+
+
+async def connect(port: int) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Connect to a game server on localhost.
+
+    Arguments:
+        port (int): the server's port.
+
+    Returns:
+        The connection's reader and writer as a tuple.
+    """
+    return await asyncio.open_connection(host='127.0.0.1', port=port)
+
+
+async def read_until(reader: asyncio.StreamReader, prefix: str) -> list[str]:
+    """
+    Read messages until a message starting with a prefix.
+
+    Arguments:
+        reader (asyncio.StreamReader): a connection's reader.
+        prefix (str): a prefix of the last message to read.
+
+    Returns:
+        The read messages as a list of strings.
+    """
+    messages = []
+
+    while not messages or not messages[-1].startswith(prefix):
+        line = await asyncio.wait_for(reader.readline(), timeout=5)
+        assert line, f'the connection is closed before {prefix}: {messages}'
+        messages.append(line.decode().strip())
+
+    return messages
+
+
+async def play(port: int, moves: list[int]) -> tuple[list[str], list[str]]:
+    """
+    Play a game of two clients, the clients move in turns.
+
+    Arguments:
+        port (int): the server's port.
+        moves (list): positions of the moves in order.
+
+    Returns:
+        All messages received by each of the clients as a tuple.
+    """
+    reader_x, writer_x = await connect(port=port)
+    await read_until(reader=reader_x, prefix='WAIT')
+    reader_y, writer_y = await connect(port=port)
+
+    messages_x = await read_until(reader=reader_x, prefix='TURN')
+    messages_y = await read_until(reader=reader_y, prefix='TURN')
+
+    for index, position in enumerate(moves):
+        writer = writer_x if index % 2 == 0 else writer_y
+        writer.write(f'{position}\n'.encode())
+
+        prefix = 'OVER' if index == len(moves) - 1 else 'TURN'
+        messages_x += await read_until(reader=reader_x, prefix=prefix)
+        messages_y += await read_until(reader=reader_y, prefix=prefix)
+
+    writer_x.close()
+    writer_y.close()
+
+    return messages_x, messages_y
+
+
+def test_server_plays_game():
+    """
+    Case: two clients connect to a server and play a game.
+    Expect: the clients are matched, get the board and the turns after each move and the game's result.
+    """
+
+    async def run() -> tuple[list[str], list[str]]:
+        server = await GameServer().start()
+
+        async with server:
+            return await play(port=server.sockets[0].getsockname()[1], moves=[1, 4, 2, 5, 3])
+
+    messages_x, messages_y = asyncio.run(run())
+
+    assert messages_x[:3] == ['START x', 'BOARD .........', 'TURN x']
+    assert messages_y[:3] == ['START o', 'BOARD .........', 'TURN x']
+    assert messages_x[-2:] == messages_y[-2:] == ['BOARD xxxoo....', 'OVER win x']
+
+
+def test_server_rejects_invalid_moves():
+    """
+    Case: two clients play a game.
+    When: a client moves out of turn or to an invalid position.
+    Expect: the move is rejected and the game goes on.
+    """
+
+    async def run() -> list[str]:
+        server = await GameServer().start()
+
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+
+            reader_x, writer_x = await connect(port=port)
+            await read_until(reader=reader_x, prefix='WAIT')
+            reader_y, writer_y = await connect(port=port)
+            await read_until(reader=reader_x, prefix='TURN')
+            await read_until(reader=reader_y, prefix='TURN')
+
+            messages = []
+
+            writer_y.write(b'1\n')
+            messages += await read_until(reader=reader_y, prefix='INVALID')
+
+            writer_x.write(b'ten\n')
+            messages += await read_until(reader=reader_x, prefix='INVALID')
+
+            writer_x.write(b'5\n')
+            messages += await read_until(reader=reader_y, prefix='TURN')
+
+            writer_y.write(b'5\n')
+            messages += await read_until(reader=reader_y, prefix='INVALID')
+
+            writer_x.close()
+            writer_y.close()
+
+            return messages
+
+    assert ['INVALID', 'INVALID', 'BOARD ....x....', 'TURN o', 'INVALID'] == asyncio.run(run())
+
+
+def test_server_rejects_non_ascii_digits():
+    """
+    Case: two clients play a game.
+    When: a client moves to a position written with a non-ASCII digit.
+    Expect: the move is rejected, the game goes on and is finished when the clients disconnect.
+    """
+
+    async def run() -> tuple[list[str], GameServer]:
+        game_server = GameServer()
+        server = await game_server.start()
+
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+
+            reader_x, writer_x = await connect(port=port)
+            await read_until(reader=reader_x, prefix='WAIT')
+            reader_y, writer_y = await connect(port=port)
+            await read_until(reader=reader_x, prefix='TURN')
+            await read_until(reader=reader_y, prefix='TURN')
+
+            writer_x.write('\u00b2\n'.encode())
+            messages = await read_until(reader=reader_x, prefix='INVALID')
+
+            writer_x.write(b'2\n')
+            messages += await read_until(reader=reader_y, prefix='TURN')
+
+            writer_x.close()
+            writer_y.close()
+
+            while game_server.active_games_number:
+                await asyncio.sleep(0.01)
+
+            return messages, game_server
+
+    messages, game_server = asyncio.run(run())
+
+    assert ['INVALID', 'BOARD .x.......', 'TURN o'] == messages
+    assert 1 == game_server.finished_games_number
+
+
+def test_server_drops_disconnected_waiting_client():
+    """
+    Case: a client waits for an opponent.
+    When: the client disconnects while waiting, or sends lines before the game starts.
+    Expect: a disconnected client is not matched, the next client waits and lines sent while waiting are discarded.
+    """
+
+    async def run() -> tuple[list[str], list[str]]:
+        game_server = GameServer()
+        server = await game_server.start()
+
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+
+            reader_left, writer_left = await connect(port=port)
+            await read_until(reader=reader_left, prefix='WAIT')
+            writer_left.close()
+
+            while game_server._waiting_connection is not None:
+                await asyncio.sleep(0.01)
+
+            reader_x, writer_x = await connect(port=port)
+            messages_x = await read_until(reader=reader_x, prefix='WAIT')
+
+            writer_x.write(b'5\n')
+            await asyncio.sleep(0.1)
+
+            reader_y, writer_y = await connect(port=port)
+            messages_x += await read_until(reader=reader_x, prefix='TURN')
+            messages_y = await read_until(reader=reader_y, prefix='TURN')
+
+            writer_x.write(b'1\n')
+            messages_y += await read_until(reader=reader_y, prefix='TURN')
+
+            writer_x.close()
+            writer_y.close()
+
+            return messages_x, messages_y
+
+    messages_x, messages_y = asyncio.run(run())
+
+    assert ['WAIT', 'START x', 'BOARD .........', 'TURN x'] == messages_x
+    assert ['START o', 'BOARD .........', 'TURN x', 'BOARD x........', 'TURN o'] == messages_y
+
+
+@pytest.mark.parametrize('is_disconnected', [False, True])
+def test_server_ends_game_without_move(is_disconnected):
+    """
+    Case: two clients play a game.
+    When: a player to move does not move in time or disconnects.
+    Expect: the game is over for the opponent with the player's timeout or leaving.
+    """
+
+    async def run() -> list[str]:
+        server = await GameServer(move_timeout=0.2).start()
+
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+
+            reader_x, writer_x = await connect(port=port)
+            await read_until(reader=reader_x, prefix='WAIT')
+            reader_y, writer_y = await connect(port=port)
+            await read_until(reader=reader_y, prefix='TURN')
+
+            if is_disconnected:
+                writer_x.close()
+
+            messages = await read_until(reader=reader_y, prefix='OVER')
+            writer_y.close()
+
+            return messages
+
+    expected_message = 'OVER left x' if is_disconnected else 'OVER timeout x'
+
+    assert expected_message == asyncio.run(run())[-1]
+
+
+def test_server_hosts_concurrent_games():
+    """
+    Case: many pairs of clients play games on a server at the same time.
+    Expect: each game is played independently on a single event loop.
+    """
+    games_number = 200
+
+    async def run() -> tuple[list, GameServer]:
+        game_server = GameServer()
+        server = await game_server.start()
+
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            games = []
+
+            for _ in range(games_number):
+                games.append(await play_started(port=port))
+
+            results = await asyncio.gather(*(finish(*game) for game in games))
+
+            while game_server.active_games_number:
+                await asyncio.sleep(0.01)
+
+            return results, game_server
+
+    async def play_started(port: int) -> tuple:
+        reader_x, writer_x = await connect(port=port)
+        await read_until(reader=reader_x, prefix='WAIT')
+        reader_y, writer_y = await connect(port=port)
+        return reader_x, writer_x, reader_y, writer_y
+
+    async def finish(reader_x, writer_x, reader_y, writer_y) -> str:  # noqa: ANN001
+        await read_until(reader=reader_y, prefix='TURN')
+
+        for index, position in enumerate([1, 2, 3, 5, 4, 6, 8, 7]):
+            (writer_x if index % 2 == 0 else writer_y).write(f'{position}\n'.encode())
+            await read_until(reader=reader_y, prefix='TURN' if index < 7 else 'OVER')
+
+        messages = await read_until(reader=reader_x, prefix='OVER')
+        writer_x.close()
+        writer_y.close()
+
+        return messages[-1]
+
+    results, game_server = asyncio.run(run())
+
+    assert ['OVER tie'] * games_number == results
+    assert game_server.games_number == game_server.finished_games_number == games_number
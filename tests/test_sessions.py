@@ -0,0 +1,82 @@
+"""
+Provide tests for the game's session pool.
+"""
+import pytest
+
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.exceptions import (
+    SessionPoolMarksNumberDoesNotMatchException,
+    SessionPoolSessionDoesNotExistException,
+)
+from game.sessions import SessionPool
+
+
+def test_session_pool_play():
+    """
+    Case: play sessions of a pool a move at a time, as correspondence games are played.
+    Expect: each session is packed back with its board, turn and state, and is restored from them.
+    """
+    pool = SessionPool()
+    first_id = pool.create(marks=[PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y])
+    second_id = pool.create(marks=[PlayerMark.MODERN_Y, PlayerMark.MODERN_X])
+
+    for position in [1, 4, 2, 5, 3]:
+        for session_id in [first_id, second_id]:
+            with pool.play(session_id=session_id) as session:
+                session.play(player=session.current_player, position=position)
+
+    first_session = pool.check_out(session_id=first_id)
+    second_session = pool.check_out(session_id=second_id)
+
+    assert len(pool) == 2
+    assert first_session.moves_number == second_session.moves_number == 5
+    assert first_session.state.decision == BoardCheckResultDecision.WIN
+    assert first_session.state.winning_player.mark == PlayerMark.CLASSIC_X
+    assert second_session.state.winning_player.mark == PlayerMark.MODERN_Y
+    assert [
+        PlayerMark.MODERN_Y, PlayerMark.MODERN_Y, PlayerMark.MODERN_Y,
+        PlayerMark.MODERN_X, PlayerMark.MODERN_X, None,
+        None, None, None,
+    ] == second_session.board.get()
+
+
+def test_session_pool_delete():
+    """
+    Case: delete a session of a pool.
+    Expect: the session does not exist anymore and its record is reused by a next created session.
+    """
+    pool = SessionPool(size=4, players_number=3)
+    marks = [PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y, PlayerMark.MODERN_X]
+
+    session_id = pool.create(marks=marks)
+    pool.create(marks=marks)
+    pool.delete(session_id=session_id)
+
+    assert len(pool) == 1
+
+    with pytest.raises(SessionPoolSessionDoesNotExistException):
+        pool.check_out(session_id=session_id)
+
+    with pytest.raises(SessionPoolSessionDoesNotExistException):
+        pool.check_out(session_id=2)
+
+    assert session_id == pool.create(marks=marks)
+    assert pool.check_out(session_id=session_id).board.get() == [None] * 16
+
+
+@pytest.mark.parametrize('marks_number', [1, 3])
+def test_session_pool_create_marks_number_does_not_match(marks_number):
+    """
+    Case: create a session of a pool for two players.
+    When: a number of players' marks is not two.
+    Expect: marks number does not match error is raised and no session is created.
+    """
+    pool = SessionPool()
+
+    with pytest.raises(SessionPoolMarksNumberDoesNotMatchException):
+        pool.create(marks=list(PlayerMark)[:marks_number])
+
+    assert len(pool) == 0
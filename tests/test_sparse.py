@@ -0,0 +1,174 @@
+"""
+Provide tests for the game's sparse board.
+"""
+import random
+
+import pytest
+
+from game.board import Board
+from game.dto import Player
+from game.enums import (
+    BoardCheckResultDecision,
+    PlayerMark,
+)
+from game.exceptions import (
+    BoardPlayerDoesNotExistException,
+    BoardPositionAlreadyTakenException,
+    BoardPositionDoesNotExistException,
+    BoardWinLengthIsInvalidException,
+)
+from game.sparse import SparseBoard
+
+
+@pytest.mark.parametrize(
+    ('size', 'height', 'win_length'),
+    [
+        (3, None, None),
+        (4, None, None),
+        (4, 3, 3),
+        (9, 9, 4),
+    ],
+)
+def test_sparse_board_agrees_with_board(size, height, win_length):
+    """
+    Case: mark a sparse board and a board with the same random moves.
+    Expect: both boards have the same cells and the same state after each move.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+    random_ = random.Random(size)
+
+    for _ in range(50):
+        sparse_board = SparseBoard(players=[player_x, player_y], size=size, height=height, win_length=win_length)
+        board = Board(players=[player_x, player_y], size=size, height=height, win_length=win_length)
+
+        positions = list(range(1, board.board_positions_number + 1))
+        random_.shuffle(positions)
+
+        for index, position in enumerate(positions):
+            player = player_x if index % 2 == 0 else player_y
+
+            sparse_board.mark(player=player, position=position)
+            board.mark(player=player, position=position)
+
+            assert board.get() == sparse_board.get()
+            assert board.check() == sparse_board.check()
+
+        sparse_board.board = board.get()
+
+        assert board.check().decision == sparse_board.check().decision
+
+
+def test_sparse_board_set_and_mark():
+    """
+    Case: set a sparse board's cells to a board's first random moves and mark the board's next moves on both boards.
+    Expect: both boards have the same state after each move, as lines' marks are rebuilt from the set cells.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+    random_ = random.Random(0)
+
+    for _ in range(50):
+        sparse_board = SparseBoard(players=[player_x, player_y], size=5, win_length=4)
+        board = Board(players=[player_x, player_y], size=5, win_length=4)
+
+        positions = list(range(1, board.board_positions_number + 1))
+        random_.shuffle(positions)
+
+        for index, position in enumerate(positions[:6]):
+            board.mark(player=player_x if index % 2 == 0 else player_y, position=position)
+
+        sparse_board.board = board.get()
+
+        for index, position in enumerate(positions[6:]):
+            player = player_x if index % 2 == 0 else player_y
+
+            sparse_board.mark(player=player, position=position)
+            board.mark(player=player, position=position)
+
+            assert board.check() == sparse_board.check()
+            assert board._live_lines_number == sparse_board.live_lines_number
+
+
+def test_sparse_board_unbounded():
+    """
+    Case: mark an unbounded sparse board far away from the origin.
+    Expect: only occupied cells are stored, the bounding box covers them and a line wins.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+
+    board = SparseBoard(players=[player_x, player_y], size=None, win_length=5)
+
+    for index in range(4):
+        board.mark_cell(player=player_x, row=-1000 + index, column=10**9 - index)
+        board.mark_cell(player=player_y, row=0, column=index)
+
+    assert board.check().decision == BoardCheckResultDecision.CONTINUE
+    assert len(board.cells) == 8
+    assert (-1000, 0, 0, 10**9) == board.bounding_box
+
+    board.mark_cell(player=player_x, row=-1001, column=10**9 + 1)
+
+    assert player_x == board.check().winning_player
+    assert (-1001, 0, 0, 10**9 + 1) == board.bounding_box
+
+
+def test_sparse_board_get_region():
+    """
+    Case: get the active region of a bounded sparse board.
+    Expect: the bounding box of occupied cells extended by a margin and clipped to the board.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+
+    board = SparseBoard(players=[player_x, player_y], size=1000, win_length=5)
+
+    assert (0, 0, []) == board.get_region()
+
+    board.mark_cell(player=player_x, row=0, column=500)
+    board.mark_cell(player=player_y, row=1, column=501)
+
+    top, left, rows = board.get_region(margin=1)
+
+    assert (0, 499) == (top, left)
+    assert [
+        [None, PlayerMark.CLASSIC_X, None, None],
+        [None, None, PlayerMark.CLASSIC_Y, None],
+        [None, None, None, None],
+    ] == rows
+
+
+def test_sparse_board_exceptions():
+    """
+    Case: construct and mark a sparse board.
+    When: specifying an invalid win length, a player that does not exist, a position that does not exist or a position
+          already taken.
+    Expect: the same exceptions as a board's ones are raised.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    player_y = Player(mark=PlayerMark.CLASSIC_Y)
+
+    with pytest.raises(BoardWinLengthIsInvalidException):
+        SparseBoard(players=[player_x], size=None)
+
+    with pytest.raises(BoardWinLengthIsInvalidException):
+        SparseBoard(players=[player_x], size=3, win_length=4)
+
+    board = SparseBoard(players=[player_x], size=3)
+    board.mark(player=player_x, position=1)
+
+    with pytest.raises(BoardPlayerDoesNotExistException):
+        board.mark(player=player_y, position=2)
+
+    with pytest.raises(BoardPositionDoesNotExistException):
+        board.mark(player=player_x, position=10)
+
+    with pytest.raises(BoardPositionDoesNotExistException):
+        board.mark_cell(player=player_x, row=0, column=3)
+
+    with pytest.raises(BoardPositionAlreadyTakenException):
+        board.mark(player=player_x, position=1)
+
+    with pytest.raises(BoardPositionDoesNotExistException):
+        SparseBoard(players=[player_x], size=None, win_length=5).mark(player=player_x, position=1)
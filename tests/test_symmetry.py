@@ -0,0 +1,82 @@
+"""
+Provide tests for the game's board symmetries.
+"""
+import pytest
+
+from game.board import Board
+from game.enums import PlayerMark
+from game.symmetry import (
+    canonicalize,
+    get_permutations,
+    get_positions_maps,
+    restore_position,
+    transform_position,
+)
+
+
+@pytest.mark.parametrize(
+    ('size', 'height', 'expected_symmetries_number'),
+    [
+        (1, None, 1),
+        (2, None, 8),
+        (3, None, 8),
+        (4, None, 8),
+        (4, 3, 4),
+        (3, 1, 2),
+    ],
+)
+def test_get_positions_maps(size, height, expected_symmetries_number):
+    """
+    Case: get maps of positions for each symmetry of a board.
+    Expect: distinct maps of positions, inverse to permutations of cells, starting with identity.
+    """
+    positions = list(range(size * (height or size)))
+    positions_maps = get_positions_maps(size=size, height=height)
+
+    assert tuple(positions) == positions_maps[0]
+    assert expected_symmetries_number == len(set(positions_maps))
+
+    for positions_map, permutation in zip(positions_maps, get_permutations(size=size, height=height)):
+        assert sorted(positions_map) == positions
+        assert [permutation[position] for position in positions_map] == positions
+
+
+def test_canonicalize_symmetric_positions():
+    """
+    Case: canonicalize positions mapped into each other by symmetries.
+    Expect: all of the positions have the same canonical representative.
+    """
+    cells = [
+        PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+        Board.EMPTY_CELL, PlayerMark.CLASSIC_X, Board.EMPTY_CELL,
+        Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+    ]
+
+    canonical_cells_variants = set()
+
+    for permutation in get_permutations(size=3):
+        transformed_cells = [cells[position] for position in permutation]
+        canonical_cells, _ = canonicalize(cells=transformed_cells, size=3)
+        canonical_cells_variants.add(canonical_cells)
+
+    assert 1 == len(canonical_cells_variants)
+
+
+def test_canonicalize_maps_moves_back():
+    """
+    Case: canonicalize a position, find a move on the canonical cells and restore it.
+    Expect: the restored move marks the same cell of the original position.
+    """
+    cells = [
+        Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+        Board.EMPTY_CELL, Board.EMPTY_CELL, PlayerMark.CLASSIC_Y,
+        PlayerMark.CLASSIC_X, Board.EMPTY_CELL, PlayerMark.CLASSIC_X,
+    ]
+
+    canonical_cells, transform = canonicalize(cells=cells, size=3)
+
+    for position in range(1, 10):
+        canonical_position = transform_position(position=position, transform=transform, size=3)
+
+        assert cells[position - 1] == canonical_cells[canonical_position - 1]
+        assert position == restore_position(position=canonical_position, transform=transform, size=3)
@@ -0,0 +1,208 @@
+"""
+Provide tests for the game's endgame tablebase.
+"""
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from game.board import Board  # noqa: E402
+from game.dto import Player  # noqa: E402
+from game.enums import (  # noqa: E402
+    BoardCheckResultDecision,
+    PlayerMark,
+    PositionValue,
+)
+from game.exceptions import (  # noqa: E402
+    TablebaseBoardIsNotSupportedException,
+    TablebasePositionIsNotReachableException,
+)
+from game.perfect_play import (  # noqa: E402
+    PerfectPlayTable,
+    build_perfect_play_table,
+)
+from game.tablebase import (  # noqa: E402
+    HEADER,
+    Tablebase,
+    build_tablebase,
+    get_layers_offsets,
+    get_position_index,
+)
+
+PLAYER_X = Player(mark=PlayerMark.CLASSIC_X)
+PLAYER_Y = Player(mark=PlayerMark.CLASSIC_Y)
+
+
+@pytest.fixture(scope='module')
+def tablebase(tmp_path_factory):
+    """
+    Build a 3x3 tablebase to a temporary file and open it.
+    """
+    path = tmp_path_factory.mktemp('tablebase') / 'tablebase-3x3.bin'
+    build_tablebase(path=path, size=3)
+
+    assert HEADER.size + get_layers_offsets(cells_number=9)[-1] == path.stat().st_size
+
+    table = Tablebase(path=path)
+    yield table
+    table.close()
+
+
+def test_get_position_index():
+    """
+    Case: get indexes of all positions of a board.
+    Expected: indexes are exactly all numbers from 0 to a number of positions.
+    """
+    cells_number = 4
+    indexes = set()
+
+    for position in range(3 ** cells_number):
+        cells = [position // 3 ** cell % 3 for cell in range(cells_number)]
+
+        if cells.count(1) - cells.count(2) in (0, 1):
+            indexes.add(get_position_index(cells=cells))
+
+    assert set(range(get_layers_offsets(cells_number=cells_number)[-1])) == indexes
+
+
+def test_build_tablebase_workers(tablebase, tmp_path):
+    """
+    Case: build a tablebase with several worker processes.
+    Expected: the tablebase is the same as the one built in the current process.
+    """
+    path = tmp_path / 'tablebase-3x3.bin'
+    build_tablebase(path=path, size=3, workers=2)
+
+    with open(path, 'rb') as file:  # noqa: PTH123
+        assert file.read() == tablebase._table[:]
+
+
+@pytest.mark.parametrize(
+    ('board_', 'expected_value', 'expected_distance', 'expected_position'),
+    [
+        (
+            [
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+            ],
+            PositionValue.TIE,
+            8,
+            1,
+        ),
+        (
+            [
+                PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, Board.EMPTY_CELL,
+                PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+            ],
+            PositionValue.WIN,
+            1,
+            3,
+        ),
+        (
+            [
+                PlayerMark.CLASSIC_X, Board.EMPTY_CELL, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+                PlayerMark.CLASSIC_Y, Board.EMPTY_CELL, PlayerMark.CLASSIC_X,
+            ],
+            PositionValue.WIN,
+            3,
+            3,
+        ),
+        (
+            [
+                PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X,
+                PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y, Board.EMPTY_CELL,
+                Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+            ],
+            PositionValue.LOSS,
+            0,
+            None,
+        ),
+    ],
+)
+def test_tablebase_probe(tablebase, board_, expected_value, expected_distance, expected_position):
+    """
+    Case: probe positions and get the best moves.
+    Expected: positions' values and distances to the end of the game and the best moves are returned.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y])
+    board.board = board_
+
+    assert (expected_value, expected_distance) == tablebase.probe(board=board)
+    assert expected_position == tablebase.best_move(board=board)
+
+
+def test_tablebase_perfect_play_table(tablebase, tmp_path):
+    """
+    Case: probe all positions reachable from an empty board.
+    Expected: terminal positions are labeled as the board checks them, others are valued as the perfect play table.
+    """
+    path = tmp_path / 'perfect-play-3x3.bin'
+    build_perfect_play_table(path=path)
+    perfect_play_table = PerfectPlayTable(path=path)
+
+    board = Board(players=[PLAYER_X, PLAYER_Y])
+    boards = [board.get()]
+    seen = set()
+
+    while boards:
+        board.board = boards.pop()
+        key = tuple(board.get())
+
+        if key in seen:
+            continue
+
+        seen.add(key)
+        value, distance = tablebase.probe(board=board)
+        decision = board.check().decision
+
+        if decision == BoardCheckResultDecision.WIN:
+            assert (PositionValue.LOSS, 0) == (value, distance)
+            continue
+
+        if decision == BoardCheckResultDecision.TIE:
+            assert (PositionValue.TIE, 0) == (value, distance)
+            continue
+
+        assert perfect_play_table.evaluate(board=board) == value
+
+        player = PLAYER_X if key.count(PLAYER_X.mark) == key.count(PLAYER_Y.mark) else PLAYER_Y
+
+        for position in range(1, 10):
+            if board.get()[position - 1] is Board.EMPTY_CELL:
+                cells = list(key)
+                cells[position - 1] = player.mark
+                boards.append(cells)
+
+    perfect_play_table.close()
+
+    assert 5478 == len(seen)  # noqa: PLR2004
+
+
+def test_tablebase_position_is_not_reachable(tablebase):
+    """
+    Case: probe a position where a player to move has a line.
+    Expected: position is not reachable error is raised.
+    """
+    board = Board(players=[PLAYER_X, PLAYER_Y])
+    board.board = [
+        PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X, PlayerMark.CLASSIC_X,
+        PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y, PlayerMark.CLASSIC_Y,
+        Board.EMPTY_CELL, Board.EMPTY_CELL, Board.EMPTY_CELL,
+    ]
+
+    with pytest.raises(TablebasePositionIsNotReachableException):
+        tablebase.probe(board=board)
+
+
+def test_tablebase_board_is_not_supported(tablebase):
+    """
+    Case: probe a board of another shape than the tablebase's one.
+    Expected: board is not supported error is raised.
+    """
+    with pytest.raises(TablebaseBoardIsNotSupportedException):
+        tablebase.probe(board=Board(players=[PLAYER_X, PLAYER_Y], size=4))
+
+    with pytest.raises(TablebaseBoardIsNotSupportedException):
+        build_tablebase(size=5)
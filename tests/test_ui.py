@@ -0,0 +1,69 @@
+"""
+Provide tests for the game's UI.
+"""
+import io
+
+from game.board import Board
+from game.dto import Player
+from game.enums import PlayerMark
+from game.ui import Ui
+
+
+def test_ui_show_current_board():
+    """
+    Case: show a board of a shape other than the classic one.
+    Expect: the board is written in a single write with a row per board's row and two-digits wide cells.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    board = Board(players=[player_x], size=4, height=3)
+    board.mark(player=player_x, position=12)
+
+    output = io.StringIO()
+    Ui(board=board, output=output).show_current_board()
+
+    lines = output.getvalue().split('\n')
+
+    assert len(lines) == 8
+    assert lines[5].endswith('| x ')
+    assert lines[4] == '    ————+————+————+————'
+    assert '\033[90m¹⁰\033[0m' in lines[5]
+
+
+def test_ui_show_current_board_incremental():
+    """
+    Case: show a board, ask a move and show the board again incrementally.
+    Expect: only the changed cell is redrawn with cursor moves from below the prompt, and lines below are cleared.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    board = Board(players=[player_x], size=3)
+
+    output = io.StringIO()
+    ui = Ui(board=board, output=output, is_incremental=True)
+    ui.show_current_board()
+    ui.show_position_is_invalid()
+
+    output.seek(0)
+    output.truncate()
+
+    board.mark(player=player_x, position=6)
+    ui.show_current_board()
+
+    assert '\033[6A\033[14Gx\033[6B\033[2A\r\033[J' == output.getvalue()
+
+
+def test_ui_show_how_to_play():
+    """
+    Case: show how to play on a board of a shape other than the classic one.
+    Expect: the grid's size, the number of marks in a row to win and the positions' range are of the board's shape.
+    """
+    player_x = Player(mark=PlayerMark.CLASSIC_X)
+    board = Board(players=[player_x], size=5, height=4, win_length=3)
+
+    output = io.StringIO()
+    Ui(board=board, output=output).show_how_to_play()
+
+    text = output.getvalue()
+
+    assert "a grid that's 5 squares by 4 squares" in text
+    assert 'to get 3 of her marks in a row' in text
+    assert 'from 1 to 20' in text
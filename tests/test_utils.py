@@ -3,10 +3,13 @@ Provide tests for the game's utils.
 """
 import pytest
 
+from game.exceptions import ListIsNotRectangleException
 from game.utils import (
+    get_cells_winning_lines,
     get_diagonal_sublists,
     get_horizontal_sublists,
     get_vertical_sublists,
+    get_winning_lines,
 )
 
 
@@ -104,3 +107,85 @@ def test_get_diagonal_sublists(list_, expected_sublists):
     """
     sublists = get_diagonal_sublists(list_=list_)
     assert expected_sublists == sublists
+
+
+def test_get_diagonal_sublists_of_rectangle():
+    """
+    Case: get diagonal sublists of a list split into rows.
+    Expect: a list of down-right diagonals, then down-left diagonals, not shorter than a minimum length.
+    """
+    list_ = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
+
+    expected_sublists = [
+        [1, 6, 11], [2, 7, 12], [3, 8], [5, 10],
+        [2, 5], [3, 6, 9], [4, 7, 10], [8, 11],
+    ]
+
+    assert expected_sublists == get_diagonal_sublists(list_=list_, chunks=4, min_length=2)
+    assert [[1, 6, 11], [2, 7, 12], [3, 6, 9], [4, 7, 10]] == get_diagonal_sublists(list_=list_, chunks=4)
+
+    with pytest.raises(ListIsNotRectangleException):
+        get_diagonal_sublists(list_=list_, chunks=5)
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 4, 7])
+def test_get_winning_lines(size):
+    """
+    Case: get winning lines of a board.
+    Expect: lines of positions are the same as horizontal, vertical and diagonal sublists of the board's positions.
+    """
+    positions = list(range(size * size))
+
+    expected_winning_lines = [
+        *get_horizontal_sublists(list_=positions, chunks=size),
+        *get_vertical_sublists(list_=positions, chunks=size),
+        *get_diagonal_sublists(list_=positions),
+    ]
+
+    winning_lines = get_winning_lines(size=size)
+
+    assert expected_winning_lines == [list(line) for line in winning_lines]
+    assert winning_lines is get_winning_lines(size=size)
+
+
+@pytest.mark.parametrize(
+    ('size', 'height', 'win_length', 'expected_lines_number'),
+    [
+        (3, 3, 3, 8),
+        (4, 3, 3, 14),
+        (3, 4, 2, 29),
+        (15, 15, 5, 572),
+    ],
+)
+def test_get_winning_lines_of_win_length(size, height, win_length, expected_lines_number):
+    """
+    Case: get winning lines of a board with a win length.
+    Expect: every horizontal, vertical and diagonal window of the win length's positions, each of them once.
+    """
+    winning_lines = get_winning_lines(size=size, height=height, win_length=win_length)
+
+    assert expected_lines_number == len(set(winning_lines))
+    assert expected_lines_number == len(winning_lines)
+
+    for line in winning_lines:
+        rows_steps = {(end // size - start // size) for start, end in zip(line, line[1:])}
+        columns_steps = {(end % size - start % size) for start, end in zip(line, line[1:])}
+
+        assert win_length == len(line)
+        assert len(rows_steps) == 1
+        assert len(columns_steps) == 1
+        assert all(0 <= position < size * height for position in line)
+
+
+def test_get_cells_winning_lines():
+    """
+    Case: get winning lines going through each board's cell.
+    Expect: indexes of the lines containing the cell.
+    """
+    expected_cells_winning_lines = (
+        (0, 3, 6), (0, 4), (0, 5, 7),
+        (1, 3), (1, 4, 6, 7), (1, 5),
+        (2, 3, 7), (2, 4), (2, 5, 6),
+    )
+
+    assert expected_cells_winning_lines == get_cells_winning_lines(size=3)